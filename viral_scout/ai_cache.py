@@ -0,0 +1,103 @@
+"""
+AI 응답 캐시 (SQLite 단일 파일)
+- 키: (provider, model, 프롬프트 해시, 생성 파라미터)
+- TTL 만료 + 최대 개수 초과 시 오래 안 쓴 항목부터 삭제
+- 같은 날 재실행 시 동일 프롬프트는 유료 호출 없이 재사용
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+import state_db
+
+
+class AICache:
+    """
+    콘텐츠 주소 기반 AI 응답 캐시
+
+    Args:
+        path: SQLite 파일 경로
+        ttl_seconds: 항목 유효 시간 (초)
+        max_entries: 최대 보관 항목 수
+    """
+
+    EVICT_EVERY = 100  # N번 저장할 때마다 정리
+
+    def __init__(self, path, ttl_seconds, max_entries):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn = state_db.connect(path)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS ai_cache (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_ai_cache_accessed ON ai_cache(accessed_at)")
+        self._conn.commit()
+        self.evict()
+
+    @staticmethod
+    def make_key(provider, model, prompt, params):
+        """캐시 키 생성 (프롬프트는 해시로만 보관)"""
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        raw = json.dumps([provider, model, prompt_hash, params], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """캐시 조회 (없거나 만료되면 None)"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM ai_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row and now - row[1] <= self.ttl_seconds:
+                self._conn.execute("UPDATE ai_cache SET accessed_at = ? WHERE key = ?", (now, key))
+                self._conn.commit()
+                self.hits += 1
+                return row[0]
+            self.misses += 1
+            return None
+
+    def set(self, key, response):
+        """응답 저장"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ai_cache (key, response, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, response, now, now),
+            )
+            self._conn.commit()
+            self._writes += 1
+            should_evict = self._writes % self.EVICT_EVERY == 0
+        if should_evict:
+            self.evict()
+
+    def evict(self):
+        """만료 항목 삭제 후 최대 개수를 넘는 만큼 오래 안 쓴 항목 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM ai_cache WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+            count = self._conn.execute("SELECT COUNT(*) FROM ai_cache").fetchone()[0]
+            overflow = count - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM ai_cache WHERE key IN (SELECT key FROM ai_cache ORDER BY accessed_at LIMIT ?)",
+                    (overflow,),
+                )
+            self._conn.commit()
+
+    def format_stats(self):
+        """적중/미스 통계 문자열"""
+        total = self.hits + self.misses
+        rate = (self.hits / total * 100) if total else 0
+        return f"적중 {self.hits}회 / 미스 {self.misses}회 (적중률 {rate:.0f}%)"
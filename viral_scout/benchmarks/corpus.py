@@ -0,0 +1,83 @@
+"""
+벤치마크용 합성 한국어 게시글 코퍼스
+- 시드 고정 → 실행/커밋이 달라도 항상 같은 글 생성 (결과 비교 가능)
+- 실제 수집 글과 비슷하게 질문형/후기형/협찬글/무관한 글/브랜드 언급을 섞음
+"""
+
+import random
+
+BRANDS = [
+    "보양대첩", "로얄캐닌", "힐스", "퓨리나", "네추럴코어", "건강백서", "밥이보약", "듀먼",
+    "하림", "더리얼", "오리젠", "아카나", "지위픽", "나우", "뉴트로", "카길", "ANF", "K9"
+]
+PETS = ["강아지", "반려견", "말티즈", "푸들", "고양이", "냥이", "반려묘", "노령견", "아기 고양이"]
+CONCERNS = ["눈물자국", "알러지", "설사", "소화불량", "피부병", "기호성", "변 상태", "체중 관리", "털 빠짐"]
+FOODS = ["사료", "화식", "습식 캔", "간식", "동결건조", "저알러지 사료", "곤충 사료", "보양식"]
+QUESTIONS = ["어떤가요?", "괜찮을까요?", "추천 부탁드려요", "먹여도 될까요?", "고민이에요", "궁금해요"]
+REVIEWS = [
+    "잘 먹어요", "정착했어요", "재구매 예정이에요", "별로였어요", "설사를 했어요",
+    "기호성이 좋아요", "눈물자국이 줄었어요", "안 먹어서 후회했어요", "변 상태가 좋아졌어요"
+]
+SPONSORED = ["업체로부터 제품을 제공받아 작성했습니다", "체험단으로 참여했어요", "원고료를 받아 작성된 글입니다"]
+OFF_TOPIC = ["삼계탕 맛집", "입주청소 후기", "여행 다녀왔어요", "인테리어 고민", "레시피 공유"]
+FILLER = [
+    "요즘 날씨가 추워져서", "병원에서 상담받고", "한 달 정도 급여해보니", "가격이 조금 있지만",
+    "처음에는 걱정했는데", "다른 분들 후기를 보고", "성분표를 꼼꼼히 확인하고", "조금씩 섞어서 바꿔주니"
+]
+COMMENTS = [
+    "저희 애도 잘 먹어요", "저는 별로였어요", "설사해서 바꿨어요", "좋은 정보 감사합니다",
+    "가격이 좀 비싸네요", "저희는 안 먹어서 후회했어요", "눈물자국 효과 있었어요", "그냥 그래요",
+    "좋지 않아요 ㅠ", "재구매 했어요!", "어디서 사셨어요?", "설사 없어요 괜찮았어요"
+]
+
+
+def make_post(rng):
+    """게시글 1개 생성"""
+    pet = rng.choice(PETS)
+    food = rng.choice(FOODS)
+    concern = rng.choice(CONCERNS)
+    brands = rng.sample(BRANDS, rng.randint(0, 3))
+    kind = rng.random()
+
+    if kind < 0.08:
+        title = f"{rng.choice(OFF_TOPIC)} {rng.choice(FILLER)}"
+    elif kind < 0.4:
+        title = f"{pet} {concern} {food} {rng.choice(QUESTIONS)}"
+    else:
+        brand = brands[0] if brands else ""
+        title = f"{brand} {pet} {food} {rng.choice(REVIEWS)}".strip()
+    if rng.random() < 0.05:
+        title = "[협찬] " + title
+
+    sentences = []
+    for _ in range(rng.randint(4, 12)):
+        sentence = f"{rng.choice(FILLER)} {pet}에게 {rng.choice(brands + [''])} {food}를 줬는데 {rng.choice(REVIEWS)}"
+        sentences.append(" ".join(sentence.split()))
+    if rng.random() < 0.1:
+        sentences.append(rng.choice(SPONSORED))
+    if rng.random() < 0.2:
+        sentences.append(f"#{pet} #{food} #{concern}")
+
+    comments = [{"content": rng.choice(COMMENTS)} for _ in range(rng.randint(0, 20))]
+    return {"title": title, "content": ". ".join(sentences) + ".", "comments": comments}
+
+
+def make_corpus(count, seed=42):
+    """게시글 count개 생성 (같은 seed면 항상 같은 결과)"""
+    rng = random.Random(seed)
+    return [make_post(rng) for _ in range(count)]
+
+
+def make_ai_responses(count, seed=7):
+    """clean 함수용 AI 응답 샘플 (마크다운, 이모지, 라벨, 공백 섞음)"""
+    rng = random.Random(seed)
+    decorations = ["**", "*", "🐶", "😊", "✨", "👍", "🐱", "\n\n", "   "]
+    labels = ["요약: ", "결론: ", "", "", ""]
+    responses = []
+    for _ in range(count):
+        words = [rng.choice(REVIEWS + FILLER + CONCERNS) for _ in range(rng.randint(5, 20))]
+        for i in range(len(words)):
+            if rng.random() < 0.3:
+                words[i] = rng.choice(decorations) + words[i] + rng.choice(decorations)
+        responses.append(rng.choice(labels) + " ".join(words))
+    return responses
@@ -0,0 +1,231 @@
+"""
+성능 벤치마크 (완전 오프라인)
+
+측정 항목:
+- search_parse.*   : 저장된 네이버 검색 결과(카페 HTML, 블로그 API JSON) 파싱
+- filters.*        : content_filters / naver_scanner 필터 함수 (합성 게시글 수천 개)
+- clean.*          : clean_ai_text / clean_ai_response / remove_hashtags
+- brands.*         : merge_and_sort_brands / extract_brands_regex
+- sentiment.*      : 로컬 댓글 감성 점수기
+- near_dup.*       : SimHash 지문 생성
+- e2e.main         : naver_scanner.main() 전체 (네이버/AI/시트/텔레그램 스텁, 카페 제외)
+
+사용법:
+    python viral_scout/benchmarks/run_benchmarks.py
+    python viral_scout/benchmarks/run_benchmarks.py --output before.json
+    python viral_scout/benchmarks/run_benchmarks.py --compare before.json   # 느려진 항목이 있으면 exit 1
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SCOUT_DIR = os.path.dirname(BENCH_DIR)
+REPO_DIR = os.path.dirname(SCOUT_DIR)
+sys.path.insert(0, SCOUT_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+# config.py 필수 환경변수 검사를 통과하기 위한 더미 값 (실제 외부 호출은 하지 않음)
+for _name in ("NAVER_CLIENT_ID", "NAVER_CLIENT_SECRET", "GEMINI_API_KEY", "TELEGRAM_BOT_TOKEN", "TELEGRAM_CHAT_ID"):
+    os.environ.setdefault(_name, "benchmark")
+
+DEFAULT_OUTPUT = os.path.join(BENCH_DIR, "results", "latest.json")
+CAFE_SEARCH_HTML = os.path.join(REPO_DIR, "debug_page.html")
+E2E_KEYWORDS = ["강아지 사료 추천", "고양이 사료 추천", "알러지 사료", "눈물자국 사료", "설사 사료", "강아지 화식"]
+
+
+def measure(fn, repeat):
+    """fn을 repeat번 실행한 시간 목록 (첫 실행 전 1회 예열, 출력은 버림)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn()
+        times = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - started)
+    return times
+
+
+def summarize(times, items):
+    median = statistics.median(times)
+    return {
+        "median_s": round(median, 6),
+        "min_s": round(min(times), 6),
+        "max_s": round(max(times), 6),
+        "runs": len(times),
+        "items": items,
+        "per_item_us": round(median / items * 1e6, 3) if items else None,
+    }
+
+
+def build_cases(posts, repeat):
+    """(이름, 함수, 항목 수, 반복 횟수) 목록"""
+    import content_filters as cf
+    import naver_scanner as ns
+    from cafe_scanner import parse_cafe_search_results
+    from corpus import make_corpus, make_ai_responses
+    from near_dup import NearDupIndex
+    from stubs import load_fixture
+
+    corpus = make_corpus(posts)
+    responses = make_ai_responses(posts)
+    texts = [p["title"] + " " + p["content"] for p in corpus]
+    brand_pairs = [(", ".join(cf.extract_brands_regex(t)[::-1]), t) for t in texts]
+    comment_lists = [[c["content"] for c in p["comments"]] for p in corpus]
+    comment_count = sum(len(c) for c in comment_lists)
+    blog_json = load_fixture("naver_blog_search.json")
+
+    cases = []
+
+    if os.path.exists(CAFE_SEARCH_HTML):
+        with open(CAFE_SEARCH_HTML, "r", encoding="utf-8") as f:
+            cafe_html = f.read()
+
+        cases.append(("search_parse.cafe_html", lambda: parse_cafe_search_results(cafe_html), 1, repeat))
+
+    def parse_blog_json():
+        for item in json.loads(blog_json)["items"]:
+            item['title'].replace('<b>', '').replace('</b>', '').replace('&quot;', '"')
+            ns.format_date(item['postdate'])
+
+    cases.append(("search_parse.blog_json", parse_blog_json, 1, repeat * 20))
+
+    cases += [
+        ("filters.detect_sponsored_content",
+         lambda: [cf.detect_sponsored_content(p["title"], p["content"]) for p in corpus], posts, repeat),
+        ("filters.is_genuine_question",
+         lambda: [cf.is_genuine_question(p["title"], p["content"]) for p in corpus], posts, repeat),
+        ("filters.is_blacklisted",
+         lambda: [ns.is_blacklisted(p["title"]) for p in corpus], posts, repeat),
+        ("filters.has_required_keyword",
+         lambda: [ns.has_required_keyword(p["title"]) for p in corpus], posts, repeat),
+        ("filters.extract_keywords_hybrid",
+         lambda: [cf.extract_keywords_hybrid(p["title"], p["content"]) for p in corpus], posts, repeat),
+        ("clean.clean_ai_text", lambda: [ns.clean_ai_text(r) for r in responses], posts, repeat),
+        ("clean.clean_ai_response", lambda: [cf.clean_ai_response(r) for r in responses], posts, repeat),
+        ("clean.remove_hashtags", lambda: [cf.remove_hashtags(t) for t in texts], posts, repeat),
+        ("brands.extract_brands_regex", lambda: [cf.extract_brands_regex(t) for t in texts], posts, repeat),
+        ("brands.merge_and_sort_brands",
+         lambda: [cf.merge_and_sort_brands(ai, t) for ai, t in brand_pairs], posts, repeat),
+        ("sentiment.local_score_batch",
+         lambda: [cf.SENTIMENT_SCORER.score_batch(c) for c in comment_lists], comment_count, repeat),
+    ]
+
+    fingerprinter = NearDupIndex.__new__(NearDupIndex)
+    fingerprinter.min_chars = 0
+    cases.append(("near_dup.fingerprint", lambda: [fingerprinter.fingerprint(t) for t in texts], posts, repeat))
+    return cases
+
+
+def run(args):
+    from stubs import run_main_offline
+
+    results = {}
+    for name, fn, items, repeat in build_cases(args.posts, args.repeat):
+        if args.only and not any(name.startswith(prefix) for prefix in args.only):
+            continue
+        results[name] = summarize(measure(fn, repeat), items)
+        print(f"  {name:40s} {results[name]['median_s'] * 1000:10.2f} ms  ({items}건)")
+
+    if not args.only or any("e2e".startswith(p) or p.startswith("e2e") for p in args.only):
+        outcome = {}
+
+        def e2e():
+            outcome.update(run_main_offline(E2E_KEYWORDS))
+
+        results["e2e.main"] = summarize(measure(e2e, args.e2e_repeat), len(E2E_KEYWORDS))
+        results["e2e.main"]["blog_rows"] = outcome.get("blog_rows")
+        results["e2e.main"]["calls"] = outcome.get("calls")
+        print(f"  {'e2e.main':40s} {results['e2e.main']['median_s'] * 1000:10.2f} ms  "
+              f"(키워드 {len(E2E_KEYWORDS)}개, 저장 {outcome.get('blog_rows')}행)")
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return None
+
+
+def compare(baseline_path, results, threshold):
+    """
+    기준 결과와 비교
+
+    Returns:
+        list: 기준보다 threshold 이상 느려진 항목 이름
+    """
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    print(f"\n📊 비교 기준: {baseline_path} (commit {baseline.get('meta', {}).get('commit')})")
+    regressions = []
+    for name, current in results.items():
+        before = baseline.get("results", {}).get(name)
+        if not before:
+            print(f"  {name:40s} (기준 없음)")
+            continue
+        ratio = current["median_s"] / before["median_s"] if before["median_s"] else 1.0
+        mark = ""
+        if ratio > 1 + threshold:
+            mark = "  ⚠️ 느려짐"
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            mark = "  ✅ 빨라짐"
+        print(f"  {name:40s} {before['median_s'] * 1000:10.2f} → {current['median_s'] * 1000:10.2f} ms "
+              f"({(ratio - 1) * 100:+.1f}%){mark}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Viral Scout 오프라인 성능 벤치마크")
+    parser.add_argument("--posts", type=int, default=3000, help="합성 게시글 수 (기본 3000)")
+    parser.add_argument("--repeat", type=int, default=5, help="항목별 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--e2e-repeat", type=int, default=3, help="main() 전체 실행 반복 횟수")
+    parser.add_argument("--only", nargs="*", help="이 접두어로 시작하는 항목만 실행 (예: filters clean e2e)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="결과 JSON 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.10, help="느려짐 판정 기준 (기본 0.10 = 10%%)")
+    args = parser.parse_args(argv)
+
+    print(f"🏁 벤치마크 시작 (게시글 {args.posts}개, 반복 {args.repeat}회)")
+    results = run(args)
+
+    report = {
+        "meta": {
+            "commit": git_revision(),
+            "created_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "posts": args.posts,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 결과 저장: {args.output}")
+
+    if args.compare:
+        regressions = compare(args.compare, results, args.threshold)
+        if regressions:
+            print(f"\n❌ 느려진 항목 {len(regressions)}개: {', '.join(regressions)}")
+            return 1
+        print("\n✅ 느려진 항목 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""
+벤치마크용 오프라인 스텁
+- Naver 검색 API / Gemini / OpenAI / Telegram: 공용 http_client 세션에 가짜 어댑터를 연결
+  (실제 요청 경로 - 속도 제한, 재시도, 배치 파싱 - 는 그대로 거침)
+- 구글 시트: 메모리에 행을 쌓는 가짜 시트
+- 지연 시간은 호스트별로 지정 (실제 네트워크 대기 흉내)
+"""
+
+import json
+import os
+import random
+import re
+import tempfile
+import time
+import zlib
+from urllib.parse import urlparse, parse_qs
+
+import requests
+from requests.adapters import BaseAdapter
+
+from corpus import make_post
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# 호스트별 기본 지연 시간 (초)
+DEFAULT_LATENCY = {
+    "openapi.naver.com": 0.05,
+    "generativelanguage.googleapis.com": 0.2,
+    "api.openai.com": 0.2,
+    "api.telegram.org": 0.05,
+}
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _json_response(request, payload, status=200):
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    response.headers["Content-Type"] = "application/json; charset=utf-8"
+    response.encoding = "utf-8"
+    response.url = request.url
+    response.request = request
+    return response
+
+
+class OfflineAdapter(BaseAdapter):
+    """외부 API 응답을 흉내 내는 requests 어댑터"""
+
+    def __init__(self, latency=None):
+        super().__init__()
+        self.latency = dict(DEFAULT_LATENCY if latency is None else latency)
+        self.blog_page = json.loads(load_fixture("naver_blog_search.json"))
+        self.calls = {}
+
+    def send(self, request, **kwargs):
+        host = urlparse(request.url).hostname
+        self.calls[host] = self.calls.get(host, 0) + 1
+        time.sleep(self.latency.get(host, 0))
+
+        if host == "openapi.naver.com":
+            return self._naver_blog(request)
+        if host == "generativelanguage.googleapis.com":
+            prompt = json.loads(request.body)["contents"][0]["parts"][0]["text"]
+            text = self._ai_answer(prompt)
+            return _json_response(request, {
+                "candidates": [{"content": {"parts": [{"text": text}]}}],
+                "usageMetadata": {"totalTokenCount": len(prompt) + len(text)},
+            })
+        if host == "api.openai.com":
+            prompt = json.loads(request.body)["messages"][0]["content"]
+            text = self._ai_answer(prompt)
+            return _json_response(request, {
+                "choices": [{"message": {"content": text}}],
+                "usage": {"total_tokens": len(prompt) + len(text)},
+            })
+        if host == "api.telegram.org":
+            return _json_response(request, {"ok": True})
+        return _json_response(request, {"error": "offline"}, status=404)
+
+    def close(self):
+        pass
+
+    def _naver_blog(self, request):
+        """
+        녹화된 응답 형식 그대로, 글 내용은 검색어/시작 위치마다 다르게
+        (중복/유사글 체크에 전부 걸리지 않도록 합성 코퍼스에서 생성)
+        """
+        query = parse_qs(urlparse(request.url).query)
+        keyword = query.get("query", [""])[0]
+        start = int(query.get("start", ["1"])[0])
+        rng = random.Random(zlib.crc32(f"{keyword}:{start}".encode("utf-8")))
+
+        page = dict(self.blog_page, start=start)
+        page["items"] = []
+        for i, item in enumerate(self.blog_page["items"]):
+            post = make_post(rng)
+            page["items"].append(dict(
+                item,
+                title=post["title"],
+                description=post["content"][:150],
+                link=f"{item['link']}{rng.randrange(100000):05d}{start + i}",
+            ))
+        return _json_response(request, page)
+
+    def _ai_answer(self, prompt):
+        """프롬프트 종류에 맞는 형식의 고정 답변"""
+        post_ids = re.findall(r"\[글 (\w+)\]", prompt)
+        if post_ids:
+            return json.dumps([
+                {"id": pid, "반려동물관련": True, "요약": "사료를 바꾼 뒤 변 상태와 기호성이 좋아졌다는 후기임",
+                 "브랜드언급": "보양대첩, 로얄캐닌"}
+                for pid in post_ids
+            ], ensure_ascii=False)
+
+        comment_ids = re.findall(r"\[댓글 (\w+)\]", prompt)
+        if comment_ids:
+            return json.dumps({
+                "results": [{"id": cid, "감성": "중립"} for cid in comment_ids],
+                "주요_불만": "기호성 낮음",
+            }, ensure_ascii=False)
+
+        if "JSON" in prompt:
+            return json.dumps({"반려동물관련": True, "요약": "반려견 사료 급여 후기를 정리한 글임",
+                               "브랜드언급": "보양대첩"}, ensure_ascii=False)
+        return "오늘 수집된 글은 사료 교체 후기와 기호성 관련 질문이 많았음"
+
+
+class FakeSheet:
+    """append_rows만 지원하는 메모리 시트"""
+
+    def __init__(self, sheet_id, title):
+        self.id = sheet_id
+        self.title = title
+        self.spreadsheet_id = "benchmark"
+        self.rows = []
+
+    def get(self, range_name):
+        return []
+
+    def append_rows(self, rows, value_input_option=None):
+        self.rows.extend(rows)
+
+
+class _Patch:
+    """모듈 속성 임시 교체 (종료 시 원래 값 복구)"""
+
+    def __init__(self):
+        self._saved = []
+
+    def set(self, module, name, value):
+        self._saved.append((module, name, getattr(module, name)))
+        setattr(module, name, value)
+
+    def restore(self):
+        for module, name, value in reversed(self._saved):
+            setattr(module, name, value)
+        self._saved.clear()
+
+
+def run_main_offline(keywords, latency=None):
+    """
+    naver_scanner.main()을 외부 연결 없이 실행
+
+    - 카페 크롤링(브라우저)은 끄고, 상태 파일은 임시 폴더 사용
+    - AI 응답 캐시는 끔 (매 실행이 같은 양의 AI 호출을 하도록)
+    - 네이버/AI 호출 한도는 충분히 크게 (코드 자체의 처리 시간을 측정)
+    - AI 토큰 예산은 실행마다 새로 (반복 실행 중 상한에 걸리지 않도록)
+
+    Returns:
+        dict: 저장된 행 수 / 호스트별 호출 수
+    """
+    import naver_scanner
+    import content_filters
+    import http_client
+    from rate_limit import RateLimiter, ProviderRateLimiter
+    from token_budget import TokenBudget
+
+    blog_sheet = FakeSheet(1, "블로그")
+    cafe_sheet = FakeSheet(2, "카페")
+    adapter = OfflineAdapter(latency)
+    state_dir = tempfile.mkdtemp(prefix="viral_scout_bench_")
+
+    patch = _Patch()
+    original_adapters = dict(http_client.session.adapters)
+    try:
+        patch.set(naver_scanner, "init_google_sheets", lambda: (blog_sheet, cafe_sheet, None))
+        patch.set(naver_scanner, "load_keywords_from_sheet", lambda spreadsheet: list(keywords))
+        patch.set(naver_scanner, "ENABLE_CAFE_CRAWLING", False)
+        patch.set(naver_scanner, "STATE_DIR", state_dir)
+        patch.set(naver_scanner, "RUN_JOURNAL_PATH", os.path.join(state_dir, "run_journal.jsonl"))
+        patch.set(naver_scanner, "_dedup_index", None)
+        patch.set(naver_scanner, "_near_dup_index", None)
+        patch.set(naver_scanner, "naver_api_limiter", RateLimiter(10000))
+        patch.set(content_filters, "AI_CACHE_ENABLED", False)
+        patch.set(content_filters, "_ai_cache", None)
+        token_budget = TokenBudget(run_limit=None)
+        patch.set(content_filters, "TOKEN_BUDGET", token_budget)
+        patch.set(naver_scanner, "TOKEN_BUDGET", token_budget)
+        patch.set(content_filters, "_ai_limiters", {
+            "gemini": ProviderRateLimiter(100000),
+            "openai": ProviderRateLimiter(100000),
+        })
+        http_client.session.mount("https://", adapter)
+
+        naver_scanner.main([])
+    finally:
+        http_client.session.adapters.clear()
+        http_client.session.adapters.update(original_adapters)
+        patch.restore()
+
+    return {"blog_rows": len(blog_sheet.rows), "calls": adapter.calls}
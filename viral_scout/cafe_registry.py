@@ -0,0 +1,139 @@
+"""
+카페 정보 저장소 (SQLite 단일 파일)
+- 키: 카페 식별자 (cafe.naver.com/<영문ID>/... 의 영문 ID 또는 /ca-fe/cafes/<clubid>/... 의 숫자 ID)
+- 카페명, 회원 수, 게시판 정보, 처음/마지막으로 본 시각, 본 횟수
+- 실행 시작 시 전체를 메모리로 읽음 → 카페명 조회는 딕셔너리 조회 (상세 페이지 iframe을 뒤지지 않음)
+- 제외 목록의 카페는 상세 페이지를 열기 전에 건너뜀
+"""
+
+import json
+import os
+import threading
+import time
+
+import state_db
+
+
+class CafeRegistry:
+    """
+    카페 식별자별 메타데이터
+
+    Args:
+        path: SQLite 파일 경로
+        skip_ids: 수집하지 않을 카페 식별자 목록
+    """
+
+    def __init__(self, path, skip_ids=()):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.skip_ids = {cafe_id.strip().lower() for cafe_id in skip_ids if cafe_id and cafe_id.strip()}
+        self.name_hits = 0
+        self.skipped = 0
+        self._lock = threading.Lock()
+        self._conn = state_db.connect(path)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS cafes (
+                cafe_id TEXT PRIMARY KEY,
+                name TEXT,
+                member_count INTEGER,
+                boards TEXT,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                seen_count INTEGER NOT NULL DEFAULT 0
+            )"""
+        )
+        self._conn.commit()
+        self._cafes = {
+            row[0]: {
+                "name": row[1] or "",
+                "member_count": row[2],
+                "boards": json.loads(row[3]) if row[3] else None,
+                "seen_count": row[4],
+            }
+            for row in self._conn.execute("SELECT cafe_id, name, member_count, boards, seen_count FROM cafes")
+        }
+
+    def __len__(self):
+        return len(self._cafes)
+
+    def get(self, cafe_id):
+        """
+        Returns:
+            dict: 카페 정보 (name, member_count, boards, seen_count) - 처음 보는 카페면 None
+        """
+        with self._lock:
+            info = self._cafes.get(cafe_id)
+            return dict(info) if info else None
+
+    def get_name(self, cafe_id):
+        """저장된 카페명 (없으면 빈 문자열)"""
+        with self._lock:
+            info = self._cafes.get(cafe_id)
+            if info and info["name"]:
+                self.name_hits += 1
+                return info["name"]
+            return ""
+
+    def is_skipped(self, cafe_id):
+        """제외 목록에 있는 카페인지"""
+        return bool(cafe_id) and cafe_id.lower() in self.skip_ids
+
+    def record_sightings(self, cafe_ids):
+        """검색 결과에 나온 카페 기록 (본 횟수 +1, 처음 보는 카페는 새로 추가)"""
+        now = time.time()
+        cafe_ids = [cafe_id for cafe_id in cafe_ids if cafe_id]
+        if not cafe_ids:
+            return
+        with self._lock:
+            self._conn.executemany(
+                """INSERT INTO cafes (cafe_id, first_seen, last_seen, seen_count) VALUES (?, ?, ?, 1)
+                   ON CONFLICT(cafe_id) DO UPDATE SET last_seen = excluded.last_seen, seen_count = seen_count + 1""",
+                [(cafe_id, now, now) for cafe_id in cafe_ids],
+            )
+            self._conn.commit()
+            for cafe_id in cafe_ids:
+                info = self._cafes.setdefault(
+                    cafe_id, {"name": "", "member_count": None, "boards": None, "seen_count": 0}
+                )
+                info["seen_count"] += 1
+
+    def remember(self, cafe_id, name=None, member_count=None, boards=None):
+        """
+        카페 정보 저장 (None인 항목은 기존 값 유지, 바뀐 게 없으면 쓰지 않음)
+
+        Args:
+            cafe_id: 카페 식별자
+            name: 카페명
+            member_count: 회원 수
+            boards: 게시판 정보 (JSON으로 저장할 수 있는 값)
+        """
+        if not cafe_id:
+            return
+        with self._lock:
+            info = self._cafes.get(cafe_id) or {"name": "", "member_count": None, "boards": None, "seen_count": 0}
+            updated = dict(
+                info,
+                name=name or info["name"],
+                member_count=info["member_count"] if member_count is None else member_count,
+                boards=info["boards"] if boards is None else boards,
+            )
+            if cafe_id in self._cafes and updated == info:
+                return
+            now = time.time()
+            self._conn.execute(
+                """INSERT INTO cafes (cafe_id, name, member_count, boards, first_seen, last_seen, seen_count)
+                   VALUES (?, ?, ?, ?, ?, ?, 0)
+                   ON CONFLICT(cafe_id) DO UPDATE SET
+                       name = excluded.name, member_count = excluded.member_count,
+                       boards = excluded.boards, last_seen = excluded.last_seen""",
+                (
+                    cafe_id, updated["name"], updated["member_count"],
+                    json.dumps(updated["boards"], ensure_ascii=False) if updated["boards"] is not None else None,
+                    now, now,
+                ),
+            )
+            self._conn.commit()
+            self._cafes[cafe_id] = updated
+
+    def format_stats(self):
+        """등록 카페 수 / 이름 조회 적중 / 제외 건수"""
+        return f"등록 {len(self)}곳 / 카페명 조회 {self.name_hits}회 / 제외 목록으로 건너뜀 {self.skipped}건"
@@ -7,8 +7,174 @@
 import time
 import hashlib
 import random
+from urllib.parse import urlparse
+from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright
-from config import SEARCH_KEYWORDS, CAFE_MAX_POSTS, SORT_MODE
+from metrics import metrics
+from config import (
+    SEARCH_KEYWORDS, CAFE_MAX_POSTS, SORT_MODE, CAFE_CONTEXT_RECYCLE_PAGES,
+    CAFE_DETAIL_CONCURRENCY, CAFE_PER_CAFE_DELAY,
+    CAFE_LEAN_MODE, CAFE_BLOCKED_RESOURCE_TYPES, CAFE_BLOCKED_HOSTS
+)
+
+# 모바일/데스크탑 봇 탐지 회피용 User-Agent
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# 검색 결과 제목 링크 (광고 제외, 실제 카페 게시글만)
+SEARCH_RESULT_SELECTOR = "a[href*='cafe.naver.com'][class*='title']"
+
+# 게시글 본문 선택자 (카페마다 다를 수 있음)
+CONTENT_SELECTORS = [
+    ".ContentRenderer",
+    ".se-main-container",
+    "#postContent",
+    ".post-content"
+]
+
+
+class CafeCrawlerSession:
+    """
+    카페 크롤링 세션 - 브라우저를 한 번만 띄워서 모든 키워드의 검색/상세 페이지에 재사용
+    
+    - recycle_pages개 페이지를 연 뒤에는 열린 탭이 없을 때 context를 새로 생성 (메모리 누적 방지)
+    - with 문 또는 start()/close()로 사용
+    - cassette가 있으면 녹화 모드는 context별 HAR 저장, 재생 모드는 HAR로만 응답 (네트워크 차단, 요청 간격 대기 생략)
+    - registry가 있으면 카페명을 저장소에서 먼저 찾고, 제외 목록의 카페는 상세 페이지를 열지 않음
+    
+    Args:
+        recycle_pages: context 재생성 주기 (페이지 수)
+        headless: 헤드리스 모드 여부
+        cassette: 녹화/재생용 Cassette (없으면 실제 네트워크 사용)
+        registry: CafeRegistry (없으면 매번 상세 페이지에서 카페명 확인)
+    """
+    
+    def __init__(self, recycle_pages=CAFE_CONTEXT_RECYCLE_PAGES, headless=True, lean=CAFE_LEAN_MODE, cassette=None,
+                 registry=None):
+        self.recycle_pages = recycle_pages
+        self.headless = headless
+        self.cassette = cassette
+        self.registry = registry
+        self.replaying = bool(cassette and cassette.replaying)
+        # 재생 시에는 녹화되지 않은 요청이 모두 차단되므로 별도 차단 규칙 불필요
+        self.lean = lean and not self.replaying
+        self.browser = None
+        self.context = None
+        self._playwright = None
+        self._pages_served = 0
+        self._page_stats = {}
+        # 상세 페이지 로딩 통계 (건수, 소요시간, 전송 바이트, 차단 요청 수)
+        self.totals = {"pages": 0, "seconds": 0.0, "bytes": 0, "blocked": 0}
+    
+    def start(self):
+        """브라우저 실행 (세션당 1회)"""
+        if self.browser is None:
+            self._playwright = sync_playwright().start()
+            self.browser = self._playwright.chromium.launch(headless=self.headless)
+            self._new_context()
+        return self
+    
+    def _new_context(self):
+        if self.context is not None:
+            self.context.close()
+        if self.cassette and not self.replaying:
+            # HAR는 context를 닫을 때 기록됨
+            self.context = self.browser.new_context(
+                user_agent=USER_AGENT, record_har_path=self.cassette.next_har_path(), record_har_content="embed"
+            )
+        else:
+            self.context = self.browser.new_context(user_agent=USER_AGENT)
+        if self.replaying:
+            # 나중에 등록한 route가 먼저 처리됨: HAR에서 찾고, 어디에도 없으면 차단
+            self.context.route("**/*", lambda route: route.abort())
+            for har_path in self.cassette.har_paths():
+                self.context.route_from_har(har_path, not_found="fallback")
+        if self.lean:
+            self.context.route("**/*", self._route_lean)
+        self._pages_served = 0
+    
+    def _route_lean(self, route):
+        """이미지/미디어/폰트/광고·분석 요청 차단 (텍스트 추출에 불필요)"""
+        request = route.request
+        host = urlparse(request.url).hostname or ""
+        if request.resource_type in CAFE_BLOCKED_RESOURCE_TYPES or any(
+            host == blocked or host.endswith("." + blocked) for blocked in CAFE_BLOCKED_HOSTS
+        ):
+            self.totals["blocked"] += 1
+            route.abort()
+        else:
+            route.continue_()
+    
+    def new_page(self):
+        """새 탭 열기 (필요 시 context 재생성) - 탭별 로딩 시간/전송량 측정 시작"""
+        self.start()
+        if self._pages_served >= self.recycle_pages and not self.context.pages:
+            print(f"   ♻️ 브라우저 context 재생성 ({self._pages_served}페이지 사용)")
+            self._new_context()
+        self._pages_served += 1
+        page = self.context.new_page()
+        
+        stats = {"started": time.monotonic(), "bytes": 0}
+        self._page_stats[page] = stats
+        
+        def on_response(response):
+            # Content-Length 기준 (압축 전송 크기, 헤더 없는 응답은 제외)
+            try:
+                stats["bytes"] += int(response.headers.get("content-length", 0))
+            except ValueError:
+                pass
+        
+        page.on("response", on_response)
+        return page
+    
+    def finish_page(self, page, record=True):
+        """
+        탭의 로딩 측정 종료 후 통계 누적 (record=False면 측정만 버림 - 실패한 로딩)
+        
+        Returns:
+            tuple: (소요 초, 전송 바이트)
+        """
+        stats = self._page_stats.pop(page, None)
+        if not stats:
+            return 0.0, 0
+        elapsed = time.monotonic() - stats["started"]
+        if not record:
+            metrics.count("cafe.detail.failed")
+            return elapsed, stats["bytes"]
+        metrics.observe("cafe.detail", elapsed)
+        metrics.count("cafe.detail.bytes", stats["bytes"])
+        self.totals["pages"] += 1
+        self.totals["seconds"] += elapsed
+        self.totals["bytes"] += stats["bytes"]
+        return elapsed, stats["bytes"]
+    
+    def format_totals(self):
+        """상세 페이지 로딩 통계 문자열"""
+        pages = self.totals["pages"]
+        if not pages:
+            return "상세 페이지 로딩 없음"
+        return (
+            f"상세 페이지 {pages}건 / 평균 {self.totals['seconds'] / pages:.1f}초 / "
+            f"평균 {self.totals['bytes'] / pages / 1024:.0f}KB / 차단 요청 {self.totals['blocked']}건"
+        )
+    
+    def close(self):
+        """context/브라우저 종료"""
+        try:
+            if self.context is not None:
+                self.context.close()
+            if self.browser is not None:
+                self.browser.close()
+        finally:
+            if self._playwright is not None:
+                self._playwright.stop()
+            self.context = self.browser = self._playwright = None
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
 
 def generate_post_hash(author, title, content):
     """중복 제거용 해시 생성"""
@@ -73,165 +239,368 @@ def improve_cafe_name_extraction(page, initial_cafe_name):
     return initial_cafe_name if initial_cafe_name else "(카페명 미확인)"
 
 
-def search_cafe_posts(keyword, max_posts=20):
+def search_cafe_posts(keyword, max_posts=20, session=None, is_seen=None, failed=None):
     """
     네이버 통합검색 카페 탭에서 게시글 수집
     
     Args:
         keyword: 검색 키워드
         max_posts: 최대 수집 개수
+        session: CafeCrawlerSession (없으면 이번 호출용으로 새로 띄움)
+        is_seen: 이전 실행에서 이미 본 카드면 True인 함수 (최신순 검색일 때, 그 카드부터 상세 페이지를 열지 않음)
+        failed: 상세 페이지 수집에 실패한 카드를 담을 리스트 (기준점이 실패한 글을 넘어가지 않도록)
     
     Returns:
         list: 게시글 정보 딕셔너리 리스트
     """
+    if session is None:
+        with CafeCrawlerSession() as temp_session:
+            return search_cafe_posts(keyword, max_posts, session=temp_session, is_seen=is_seen, failed=failed)
+    
     results = []
     
-    with sync_playwright() as p:
-        # 브라우저 실행 (headless mode) - 한 번만 실행!
-        browser = p.chromium.launch(headless=True)
+    page = session.new_page()
+    search_started = time.monotonic()
+    
+    try:
+        # 1. 네이버 통합검색
+        print(f"   🔍 카페 검색: '{keyword}' (정렬: {SORT_MODE})")
         
-        # 모바일/데스크탑 봇 탐지 회피용 User-Agent 설정
-        context = browser.new_context(
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
+        # 정렬 옵션 적용 (sim=관련도순, date=최신순)
+        sort_param = "&sort=date" if SORT_MODE == "date" else "&sort=sim"
         
-        page = context.new_page()
+        # 정확한 URL 파라미터 구성
+        # where=article (카페 글)
+        # ie=utf8
+        # st=rel (관련도순) or date (최신순)
+        base_url = "https://search.naver.com/search.naver?where=article&ie=utf8"
+        final_url = f"{base_url}&query={keyword}{sort_param}"
         
-        try:
-            # 1. 네이버 통합검색
-            print(f"   🔍 카페 검색: '{keyword}' (정렬: {SORT_MODE})")
-            
-            # 정렬 옵션 적용 (sim=관련도순, date=최신순)
-            sort_param = "&sort=date" if SORT_MODE == "date" else "&sort=sim"
-            
-            # 정확한 URL 파라미터 구성
-            # where=article (카페 글)
-            # ie=utf8
-            # st=rel (관련도순) or date (최신순)
-            base_url = "https://search.naver.com/search.naver?where=article&ie=utf8"
-            final_url = f"{base_url}&query={keyword}{sort_param}"
-            
+        if session.lean:
+            # 전체 네트워크 종료 대신 검색 결과 제목 링크가 나타날 때까지만 대기
+            page.goto(final_url, wait_until="domcontentloaded")
+            _wait_for_selector(page, SEARCH_RESULT_SELECTOR)
+        else:
             page.goto(final_url, wait_until="networkidle")
-            
-            # 랜덤 지연
+        
+        # 랜덤 지연 (재생 시 생략)
+        if not getattr(session, "replaying", False):
             time.sleep(random.uniform(1.0, 2.0))
-            
-            # 2. 카페 탭 클릭
-            try:
-                cafe_tab = page.locator("a.tab:has-text('카페')").first
-                if cafe_tab.count() > 0:
-                    cafe_tab.click()
-                    page.wait_for_load_state("networkidle")
+        
+        # 2. 카페 탭 클릭
+        try:
+            cafe_tab = page.locator("a.tab:has-text('카페')").first
+            if cafe_tab.count() > 0:
+                cafe_tab.click()
+                if session.lean:
+                    page.wait_for_load_state("domcontentloaded")
+                    _wait_for_selector(page, SEARCH_RESULT_SELECTOR)
                 else:
-                    # 통합검색 결과에 바로 나오는 경우도 있음
-                    pass
-            except Exception as e:
-                print(f"   ⚠️ 카페 탭 클릭 실패 (통합검색 결과 사용): {e}")
+                    page.wait_for_load_state("networkidle")
+            else:
+                # 통합검색 결과에 바로 나오는 경우도 있음
+                pass
+        except Exception as e:
+            print(f"   ⚠️ 카페 탭 클릭 실패 (통합검색 결과 사용): {e}")
+        
+        
+        # 3. 게시글 리스트 수집 (광고 제외, 실제 카페 게시글만)
+        # 요소마다 브라우저에 묻지 않고 HTML 한 번만 받아서 파싱
+        cards = parse_cafe_search_results(page.content())
+        
+        print(f"   ✅ 실제 카페 게시글: {len(cards)}개 발견")
+        
+        if is_seen:
+            seen_at = next((i for i, card in enumerate(cards) if is_seen(card)), None)
+            if seen_at is not None:
+                print(f"   ⏹️ {seen_at + 1}번째부터 이전 실행에서 본 글, {len(cards) - seen_at}개 생략")
+                cards = cards[:seen_at]
+        print(f"   📋 수집 시작: {min(len(cards), max_posts)}개")
+        
+        cards = _apply_cafe_registry(getattr(session, "registry", None), cards[:max_posts])
+        for idx, card in enumerate(cards):
+            print(f"   📄 [{idx+1}] {card['title'][:40]}... ({card['cafe_name']})")
+        
+        metrics.observe("cafe.search", time.monotonic() - search_started)
+        
+        # 4. 게시글 상세 페이지 접속 (여러 탭 동시 로딩, 카페별 요청 간격 유지)
+        results = fetch_cafe_post_details(session, cards, failed=failed)
+        
+    finally:
+        page.close()
+    
+    return results
+
+
+def _element_text(elem):
+    """요소 텍스트 (줄바꿈/연속 공백을 공백 하나로)"""
+    return " ".join(elem.get_text().split())
+
+
+def _is_result_card(tag):
+    """검색 결과 카드 (li 또는 class에 api가 들어간 div)"""
+    if tag.name == "li":
+        return True
+    return tag.name == "div" and any("api" in cls for cls in tag.get("class") or [])
+
+
+def _is_date_elem(tag):
+    if "sub_time" in (tag.get("class") or []):
+        return True
+    return tag.name == "span" and "." in tag.get_text()
+
+
+def parse_cafe_search_results(html):
+    """
+    카페 검색 결과 페이지 HTML에서 게시글 카드 추출
+    
+    브라우저에는 page.content() 한 번만 요청하고 나머지는 여기서 파싱
+    (링크마다 locator로 제목/카페명/날짜/미리보기를 물어보면 검색 1회에 왕복 100회 이상)
+    
+    Args:
+        html: 검색 결과 페이지 HTML
+    
+    Returns:
+        list: 카드 딕셔너리 리스트 (title, link, author, cafe_name, date, description) - 페이지 순서
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    cards = []
+    
+    # title 클래스가 들어간 카페 링크 = 실제 제목 링크
+    for link_elem in soup.select(SEARCH_RESULT_SELECTOR):
+        try:
+            title = _element_text(link_elem)
+            link = link_elem.get("href") or ""
+            if not title or not link:
+                continue
             
+            # 제목 링크를 감싼 가장 가까운 결과 카드
+            parent = link_elem.find_parent(_is_result_card) or link_elem.parent
             
-            # 3. 게시글 리스트 수집 (광고 제외, 실제 카페 게시글만)
-            # title_area 클래스를 가진 a 태그 = 실제 제목 링크
-            title_links = page.locator("a[href*='cafe.naver.com'][class*='title']").all()
+            # 카페명 (제목이 아닌 카페 링크 중 텍스트가 있는 첫 링크)
+            # "강사모-반려견..." 형태면 첫 부분만
+            cafe_name = ""
+            for cafe_link in parent.select("a[href*='cafe.naver.com']:not([class*='title'])"):
+                cafe_name_text = _element_text(cafe_link)
+                if cafe_name_text:
+                    cafe_name = cafe_name_text.split('-')[0].split('|')[0].strip()
+                    break
             
-            print(f"   ✅ 실제 카페 게시글: {len(title_links)}개 발견")
-            print(f"   📋 수집 시작: {min(len(title_links), max_posts)}개")
+            date_elem = parent.find(_is_date_elem)
+            post_date = _element_text(date_elem) if date_elem else ""
             
-            for idx, link_elem in enumerate(title_links[:max_posts]):
-                try:
-                    # 제목 & 링크 (직접 추출)
-                    title = link_elem.inner_text().strip()
-                    link = link_elem.get_attribute("href") or ""
-                    
-                    if not title or not link:
-                        continue
-                    
-                    # 부모 요소 찾기
-                    parent = link_elem.locator('xpath=ancestor::li | ancestor::div[contains(@class,"api")]').first
-                    
-                    # 카페명 찾기 (카페 링크에서)
-                    cafe_link = parent.locator("a[href*='cafe.naver.com']:not([class*='title'])").first
-                    cafe_name = ""
-                    if cafe_link.count() > 0:
-                        cafe_name_text = cafe_link.inner_text().strip()
-                        # "강사모-반려견..." 형태면 첫 부분만
-                        cafe_name = cafe_name_text.split('-')[0].split('|')[0].strip()
-                    
-                    # 작성자
-                    author = "카페회원"
-                    
-                    # 날짜 찾기
-                    date_elem = parent.locator(".sub_time, span:has-text('.')").first
-                    post_date = date_elem.inner_text().strip() if date_elem.count() > 0 else ""
-                    
-                    # 미리보기 텍스트
-                    desc_elem = parent.locator(".dsc_area, .dsc_txt").first
-                    description = desc_elem.inner_text().strip() if desc_elem.count() > 0 else ""
-                    
-                    print(f"   📄 [{idx+1}] {title[:40]}... ({cafe_name})")
-                    
-                    # 4. 게시글 상세 페이지 접속 (context 재사용)
-                    post_data = scrape_cafe_post_detail(context, link, title, author, cafe_name, post_date, description)
-                    
-                    if post_data:
-                        results.append(post_data)
-                    
-                    # 랜덤 지연 (부하 방지 및 사람처럼 보이기)
-                    time.sleep(random.uniform(1.5, 3.5))
-                    
-                except Exception as e:
-                    print(f"   ⚠️ 게시글 파싱 실패: {e}")
-                    continue
+            desc_elem = parent.select_one(".dsc_area, .dsc_txt")
+            description = _element_text(desc_elem) if desc_elem else ""
             
-        finally:
-            context.close()
-            browser.close()
+            cards.append({
+                "title": title,
+                "link": link,
+                "author": "카페회원",
+                "cafe_name": cafe_name,
+                "date": post_date,
+                "description": description
+            })
+        except Exception as e:
+            print(f"   ⚠️ 게시글 파싱 실패: {e}")
+            continue
     
-    return results
+    return cards
 
 
-def scrape_cafe_post_detail(context, url, title, author, cafe_name, post_date, description):
+def _apply_cafe_registry(registry, cards):
     """
-    카페 게시글 상세 페이지 크롤링 (Browser Context 재사용)
+    검색 결과 카드에 카페 저장소 적용
+    
+    - 제외 목록의 카페 글은 빼기
+    - 검색 결과에 카페명이 없으면 저장소의 카페명으로 채우기 (상세 페이지에서 찾지 않아도 됨)
+    - 검색 결과에 카페명이 있으면 저장소에 기록
     
     Returns:
-        dict: 게시글 데이터 (본문, 댓글 포함)
+        list: 적용 후 카드 리스트
     """
-    # 새 탭 열기 (브라우저를 새로 띄우지 않음!)
-    page = context.new_page()
+    if registry is None:
+        return cards
     
+    kept = []
+    for card in cards:
+        cafe_id = cafe_id_from_url(card['link'])
+        if registry.is_skipped(cafe_id):
+            registry.skipped += 1
+            print(f"   ⏭️ 제외 카페 건너뜀: {card['title'][:30]}... ({cafe_id})")
+            continue
+        if card['cafe_name']:
+            registry.remember(cafe_id, name=card['cafe_name'])
+        else:
+            card['cafe_name'] = registry.get_name(cafe_id)
+        kept.append(card)
+    registry.record_sightings([cafe_id_from_url(card['link']) for card in kept])
+    return kept
+
+
+def cafe_id_from_url(url):
+    """
+    카페 게시글 URL에서 카페 식별자 추출
+    
+    예: https://cafe.naver.com/dogpalza/12345 -> "dogpalza"
+        https://cafe.naver.com/ca-fe/cafes/10050146/articles/123 -> "10050146"
+    """
     try:
-        page.goto(url, wait_until="networkidle", timeout=15000)
-        time.sleep(random.uniform(1.0, 2.0))  # 동적 로딩 대기
+        parts = [p for p in urlparse(url).path.split('/') if p]
+        if len(parts) >= 3 and parts[0] == "ca-fe" and parts[1] == "cafes":
+            return parts[2]
+        return parts[0] if parts else ""
+    except Exception:
+        return ""
+
+
+class CafePoliteness:
+    """
+    카페별 요청 간격 관리
+    - 같은 카페에는 min_delay~max_delay초 랜덤 간격으로 요청
+    - 서로 다른 카페는 기다리지 않고 동시에 진행
+    """
+    
+    def __init__(self, min_delay, max_delay):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self._next_allowed = {}
+    
+    def ready_at(self, cafe_id):
+        return self._next_allowed.get(cafe_id, 0.0)
+    
+    def mark(self, cafe_id):
+        self._next_allowed[cafe_id] = time.monotonic() + random.uniform(self.min_delay, self.max_delay)
+
+
+def fetch_cafe_post_details(session, cards, concurrency=None, failed=None):
+    """
+    여러 카페 게시글 상세 페이지를 동시에 로딩
+    
+    - 최대 concurrency개 탭에서 동시에 페이지 로딩 (같은 context 안의 여러 탭)
+    - 본문/댓글 추출은 먼저 시작한 탭부터 순서대로 (그동안 나머지 탭은 계속 로딩)
+    - 같은 카페 요청 간격은 CAFE_PER_CAFE_DELAY로 카페별 관리
+    
+    Args:
+        session: CafeCrawlerSession
+        cards: 검색 결과 카드 리스트 (title, link, author, cafe_name, date, description)
+        concurrency: 동시 로딩 탭 수 (기본값 CAFE_DETAIL_CONCURRENCY)
+        failed: 실패한 카드를 담을 리스트 (cards 순서 유지)
+    
+    Returns:
+        list: scrape_cafe_post_detail()과 같은 형식의 dict 리스트 (cards 순서 유지, 실패 제외)
+    """
+    concurrency = max(1, concurrency or CAFE_DETAIL_CONCURRENCY)
+    politeness = CafePoliteness(0, 0) if getattr(session, "replaying", False) else CafePoliteness(*CAFE_PER_CAFE_DELAY)
+    pending = list(enumerate(cards))
+    in_flight = []  # (순번, 카드, page)
+    results = {}
+    failures = {}
+    
+    while pending or in_flight:
+        # 1. 빈 슬롯 채우기 (요청 간격이 지난 카페의 글부터)
+        now = time.monotonic()
+        while len(in_flight) < concurrency:
+            ready = next(
+                (item for item in pending if politeness.ready_at(cafe_id_from_url(item[1]['link'])) <= now),
+                None
+            )
+            if ready is None:
+                break
+            pending.remove(ready)
+            idx, card = ready
+            politeness.mark(cafe_id_from_url(card['link']))
+            page = _start_detail_page(session, card['link'])
+            if page:
+                in_flight.append((idx, card, page))
+            else:
+                failures[idx] = card
         
+        if not in_flight:
+            # 남은 글이 모두 같은 카페 요청 간격 대기 중
+            wait = min(politeness.ready_at(cafe_id_from_url(card['link'])) for _, card in pending) - time.monotonic()
+            time.sleep(max(wait, 0.05))
+            continue
+        
+        # 2. 가장 먼저 시작한 탭에서 추출
+        idx, card, page = in_flight.pop(0)
+        post_data = _extract_post_detail(session, page, card)
+        if post_data:
+            results[idx] = post_data
+        else:
+            failures[idx] = card
+    
+    if failed is not None:
+        failed.extend(failures[idx] for idx in sorted(failures))
+    return [results[idx] for idx in sorted(results)]
+
+
+def _start_detail_page(session, url):
+    """새 탭에서 상세 페이지 이동 시작 (응답 수신까지만 대기, 나머지 로딩은 백그라운드)"""
+    page = session.new_page()
+    try:
+        page.goto(url, wait_until="commit", timeout=15000)
+        return page
+    except Exception as e:
+        print(f"      ⚠️ 상세 페이지 로딩 실패: {e}")
+        if hasattr(session, "finish_page"):
+            session.finish_page(page, record=False)
+        page.close()
+        return None
+
+
+def _wait_for_selector(page_or_frame, selector, timeout=10000):
+    """선택자가 DOM에 나타날 때까지 대기 (시간 초과 시 False, 예외 없음)"""
+    try:
+        page_or_frame.locator(selector).first.wait_for(state="attached", timeout=timeout)
+        return True
+    except Exception:
+        return False
+
+
+def _extract_post_detail(session, page, card):
+    """
+    로딩 중인 상세 페이지에서 본문/댓글 추출 후 탭 닫기
+    
+    Returns:
+        dict: 게시글 데이터 (본문, 댓글 포함) - 실패 시 None
+    """
+    try:
         # iframe 확인 (카페는 보통 iframe 사용)
         iframe = page.frame_locator("iframe#cafe_main")
         
-        # 카페명 개선 (상세 페이지에서 재확인)
-        improved_cafe_name = improve_cafe_name_extraction(page, cafe_name)
+        # 동적 로딩 대기 (시간 초과여도 로딩된 만큼 추출 시도)
+        if getattr(session, "lean", False):
+            # 네트워크 종료 대신 iframe 안의 본문 → 댓글 영역이 나타날 때까지만 대기
+            if _wait_for_selector(iframe, ", ".join(CONTENT_SELECTORS), timeout=15000):
+                _wait_for_selector(iframe, ".CommentBox, .CommentItem", timeout=2000)
+        else:
+            try:
+                page.wait_for_load_state("networkidle", timeout=15000)
+            except Exception:
+                pass
+        
+
+        # 카페명 개선 (검색 결과/카페 저장소에 없을 때만 상세 페이지에서 재확인)
+        improved_cafe_name = improve_cafe_name_extraction(page, card['cafe_name'])
+        registry = getattr(session, "registry", None)
+        if registry is not None and improved_cafe_name != "(카페명 미확인)":
+            registry.remember(cafe_id_from_url(card['link']), name=improved_cafe_name)
         
         # 본문 추출
         content = ""
         try:
-            # 본문 선택자 (카페마다 다를 수 있음)
-            content_selectors = [
-                ".ContentRenderer",
-                ".se-main-container",
-                "#postContent",
-                ".post-content"
-            ]
-            
-            for selector in content_selectors:
+            for selector in CONTENT_SELECTORS:
                 content_elem = iframe.locator(selector).first
                 if content_elem.count() > 0:
                     content = content_elem.inner_text().strip()
                     break
             
             if not content:
-                content = description  # 폴백: 미리보기 사용
+                content = card['description']  # 폴백: 미리보기 사용
         
         except Exception as e:
             print(f"      ⚠️ 본문 추출 실패: {e}")
-            content = description
+            content = card['description']
         
         # 댓글 수집
         comments = []
@@ -254,17 +623,22 @@ def scrape_cafe_post_detail(context, url, title, author, cafe_name, post_date, d
             print(f"      ⚠️ 댓글 수집 실패: {e}")
         
         # 해시 생성
-        post_hash = generate_post_hash(author, title, content)
+        post_hash = generate_post_hash(card['author'], card['title'], content)
+        
+        # 로딩 시간 / 전송량 기록
+        if hasattr(session, "finish_page"):
+            elapsed, loaded_bytes = session.finish_page(page)
+            print(f"      ⏱️ {elapsed:.1f}초 / {loaded_bytes / 1024:.0f}KB / 댓글 {len(comments)}개")
         
         return {
             "source": "카페",
             "cafe_name": improved_cafe_name,
-            "title": title,
-            "link": url,
-            "author": author,
-            "date": post_date,
+            "title": card['title'],
+            "link": card['link'],
+            "author": card['author'],
+            "date": card['date'],
             "content": content[:2000],  # 2000자 제한
-            "description": description,
+            "description": card['description'],
 
             "comments": comments,
             "comment_count": len(comments),  # 댓글 수 추가
@@ -277,9 +651,36 @@ def scrape_cafe_post_detail(context, url, title, author, cafe_name, post_date, d
     
     finally:
         # 탭만 닫음 (브라우저는 유지)
+        if hasattr(session, "finish_page"):
+            session.finish_page(page, record=False)
         page.close()
 
 
+def scrape_cafe_post_detail(session, url, title, author, cafe_name, post_date, description):
+    """
+    카페 게시글 상세 페이지 크롤링 (Browser 재사용, 1건)
+    
+    Args:
+        session: CafeCrawlerSession 또는 Playwright BrowserContext (new_page() 제공 객체)
+    
+    Returns:
+        dict: 게시글 데이터 (본문, 댓글 포함)
+    """
+    card = {
+        "title": title,
+        "link": url,
+        "author": author,
+        "cafe_name": cafe_name,
+        "date": post_date,
+        "description": description
+    }
+    # 새 탭 열기 (브라우저를 새로 띄우지 않음!)
+    page = _start_detail_page(session, url)
+    if not page:
+        return None
+    return _extract_post_detail(session, page, card)
+
+
 if __name__ == "__main__":
     # 테스트
     results = search_cafe_posts("보양대첩", max_posts=3)
@@ -0,0 +1,277 @@
+"""
+네트워크 녹화/재생 (카세트)
+- 녹화: 실제 네이버/블로그/AI 응답을 카세트 폴더에 저장, 카페 브라우저 트래픽은 HAR로 저장
+- 재생: 저장된 응답만으로 실행 (네트워크 없음) → 파싱/필터 로직 반복 수정, 프로파일링용
+- 공용 http_client 세션에 어댑터를 연결하므로 호출 코드는 그대로 사용
+- API 키/토큰은 URL에서 가려서 저장 (카세트 파일을 공유해도 안전)
+
+카세트 폴더 구조:
+    http/<키>.json     요청 1건의 응답 (키 = 메서드 + 가린 URL + 본문 해시)
+    browser/NNN.har    브라우저 context별 HAR
+    meta.json          녹화 시점의 키워드, 수집일시
+    <모드>_rows.json   실행 결과 행 (녹화/재생 결과 비교용)
+"""
+
+import base64
+import glob
+import hashlib
+import json
+import os
+import re
+import threading
+from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
+
+import requests
+from requests.adapters import BaseAdapter
+
+MODES = ("record", "replay")
+
+# URL에서 가릴 쿼리 파라미터 (소문자)
+SECRET_PARAMS = {"key", "api_key", "apikey", "access_token", "token", "client_secret"}
+_BOT_TOKEN_PATH = re.compile(r"/bot[^/]+/")
+
+# 녹화/재생 모두 실제로 보내지 않는 호스트 (알림 등 부수 효과가 있는 호출)
+OFFLINE_HOSTS = {"api.telegram.org"}
+
+
+def redact_url(url):
+    """API 키/봇 토큰을 가리고 쿼리 파라미터를 정렬한 URL"""
+    parsed = urlparse(url)
+    query = sorted(
+        (name, "REDACTED" if name.lower() in SECRET_PARAMS else value)
+        for name, value in parse_qsl(parsed.query, keep_blank_values=True)
+    )
+    path = _BOT_TOKEN_PATH.sub("/bot***/", parsed.path)
+    return urlunparse(parsed._replace(path=path, query=urlencode(query)))
+
+
+def _body_bytes(body):
+    if body is None:
+        return b""
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    return bytes(body)
+
+
+class CassetteMiss(Exception):
+    pass
+
+
+class Cassette:
+    """
+    녹화/재생 저장소
+
+    Args:
+        path: 카세트 폴더
+        mode: "record" (실제 호출 후 저장) / "replay" (저장된 응답만 사용)
+    """
+
+    def __init__(self, path, mode):
+        if mode not in MODES:
+            raise ValueError(f"알 수 없는 카세트 모드: {mode}")
+        self.path = path
+        self.mode = mode
+        self.http_dir = os.path.join(path, "http")
+        self.browser_dir = os.path.join(path, "browser")
+        self.recorded = 0
+        self.hits = 0
+        self.misses = 0
+        self._har_count = 0
+        self._lock = threading.Lock()
+
+        if mode == "replay" and not os.path.isdir(self.http_dir):
+            raise FileNotFoundError(f"녹화된 카세트가 없습니다: {path}")
+        os.makedirs(self.http_dir, exist_ok=True)
+        os.makedirs(self.browser_dir, exist_ok=True)
+        if mode == "record":
+            # 이전 녹화분의 HAR가 재생에 섞이지 않도록 정리
+            for har in glob.glob(os.path.join(self.browser_dir, "*.har")):
+                os.remove(har)
+
+    @property
+    def replaying(self):
+        return self.mode == "replay"
+
+    # ---- HTTP ----
+
+    def request_key(self, request):
+        digest = hashlib.sha1()
+        digest.update(request.method.encode("utf-8") + b"\n")
+        digest.update(redact_url(request.url).encode("utf-8") + b"\n")
+        digest.update(_body_bytes(request.body))
+        return digest.hexdigest()
+
+    def save(self, request, response):
+        """응답 1건 저장 (파일 단위로 교체 → 여러 스레드에서 동시에 호출 가능)"""
+        key = self.request_key(request)
+        entry = {
+            "method": request.method,
+            "url": redact_url(request.url),
+            "status": response.status_code,
+            "headers": {
+                name: response.headers[name]
+                for name in ("Content-Type", "Location", "Retry-After")
+                if name in response.headers
+            },
+        }
+        content = response.content
+        try:
+            entry["body"] = content.decode("utf-8")
+        except UnicodeDecodeError:
+            entry["body_b64"] = base64.b64encode(content).decode("ascii")
+
+        path = os.path.join(self.http_dir, f"{key}.json")
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self.recorded += 1
+
+    def load(self, request):
+        """
+        저장된 응답 조회
+
+        Raises:
+            CassetteMiss: 녹화되지 않은 요청
+        """
+        path = os.path.join(self.http_dir, f"{self.request_key(request)}.json")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            raise CassetteMiss(f"{request.method} {redact_url(request.url)}")
+        with self._lock:
+            self.hits += 1
+        return entry
+
+    # ---- 브라우저 (HAR) ----
+
+    def next_har_path(self):
+        """녹화 시 새 브라우저 context가 기록할 HAR 경로"""
+        with self._lock:
+            self._har_count += 1
+            return os.path.join(self.browser_dir, f"{self._har_count:03d}.har")
+
+    def har_paths(self):
+        return sorted(glob.glob(os.path.join(self.browser_dir, "*.har")))
+
+    # ---- 실행 정보 / 결과 ----
+
+    def save_meta(self, **meta):
+        with open(os.path.join(self.path, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+
+    def load_meta(self):
+        try:
+            with open(os.path.join(self.path, "meta.json"), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def save_rows(self, rows_by_sheet):
+        """실행 결과 행 저장 (녹화/재생 결과를 나란히 비교)"""
+        path = os.path.join(self.path, f"{self.mode}_rows.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(rows_by_sheet, f, ensure_ascii=False, indent=1)
+        return path
+
+    def format_stats(self):
+        if self.replaying:
+            return f"재생 {self.hits}건 / 미녹화 {self.misses}건"
+        return f"녹화 {self.recorded}건 / 브라우저 HAR {self._har_count}개"
+
+
+def _build_response(request, status, headers, content):
+    response = requests.Response()
+    response.status_code = status
+    response._content = content
+    response.headers.update(headers)
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers) or "utf-8"
+    response.url = request.url
+    response.request = request
+    return response
+
+
+class CassetteAdapter(BaseAdapter):
+    """
+    requests 어댑터 - 녹화 모드는 실제 어댑터로 보낸 뒤 저장, 재생 모드는 저장된 응답 반환
+
+    재생 중 녹화되지 않은 요청은 404 응답 (재시도 없이 호출 측의 실패 처리 경로로 진행)
+
+    Args:
+        cassette: Cassette
+        inner: 녹화 모드에서 실제 요청을 보낼 어댑터
+    """
+
+    def __init__(self, cassette, inner=None):
+        super().__init__()
+        self.cassette = cassette
+        self.inner = inner
+
+    def send(self, request, **kwargs):
+        if urlparse(request.url).hostname in OFFLINE_HOSTS:
+            return _build_response(request, 200, {"Content-Type": "application/json"}, b'{"ok": true}')
+
+        if self.cassette.replaying:
+            try:
+                entry = self.cassette.load(request)
+            except CassetteMiss as e:
+                print(f"      📼 미녹화 요청: {e}")
+                return _build_response(request, 404, {"Content-Type": "text/plain"}, b"cassette miss")
+            if "body_b64" in entry:
+                content = base64.b64decode(entry["body_b64"])
+            else:
+                content = entry.get("body", "").encode("utf-8")
+            return _build_response(request, entry["status"], entry.get("headers", {}), content)
+
+        response = self.inner.send(request, **kwargs)
+        if response.status_code < 500 and response.status_code != 429:
+            # 일시적 오류는 저장하지 않음 (재시도 후의 정상 응답을 녹화)
+            self.cassette.save(request, response)
+        return response
+
+    def close(self):
+        if self.inner is not None:
+            self.inner.close()
+
+
+def install(session, cassette):
+    """
+    세션의 https/http 요청을 카세트로 연결
+
+    Returns:
+        dict: 원래 어댑터 (uninstall에 전달)
+    """
+    original = dict(session.adapters)
+    adapter = CassetteAdapter(cassette, inner=session.get_adapter("https://"))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return original
+
+
+def uninstall(session, original):
+    session.adapters.clear()
+    session.adapters.update(original)
+
+
+class OfflineSheet:
+    """
+    녹화/재생 실행용 메모리 시트 (실제 구글 시트에 쓰지 않음)
+
+    항상 빈 시트에서 시작하므로 녹화와 재생이 같은 글을 처리함
+    """
+
+    def __init__(self, sheet_id, title):
+        self.id = sheet_id
+        self.title = title
+        self.spreadsheet_id = "cassette"
+        self.rows = []
+
+    def get(self, range_name):
+        return []
+
+    def append_rows(self, rows, value_input_option=None):
+        self.rows.extend(rows)
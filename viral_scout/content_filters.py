@@ -5,9 +5,40 @@ AI 기반 콘텐츠 필터
 - 댓글 감성 분석
 """
 
-import requests
 import json
-from config import AI_PROVIDER, GEMINI_API_KEY, OPENAI_API_KEY
+import os
+import random
+import time
+import email.utils
+import requests
+import http_client
+from metrics import metrics
+from ai_cache import AICache
+from rate_limit import ProviderRateLimiter
+from keyword_matcher import KeywordMatcher
+from local_sentiment import LocalSentimentScorer
+from token_budget import TokenBudget, TokenBudgetExceeded, estimate_tokens, trim_to_budget
+from config import (
+    AI_PROVIDER, GEMINI_API_KEY, OPENAI_API_KEY, AI_BATCH_SIZE,
+    ENABLE_AI_ANALYSIS, ANALYZE_ALL,
+    AI_RATE_LIMITS, AI_MAX_RETRIES, AI_BACKOFF_BASE,
+    AI_TOKEN_BUDGETS, AI_RUN_TOKEN_LIMIT,
+    SENTIMENT_LOCAL_FIRST, SENTIMENT_UNCERTAINTY_BAND,
+    EXCLUDE_KEYWORDS, REQUIRED_KEYWORDS,
+    STATE_DIR, AI_CACHE_ENABLED, AI_CACHE_TTL_HOURS, AI_CACHE_MAX_ENTRIES
+)
+
+GEMINI_MODEL = "gemini-2.0-flash"
+OPENAI_MODEL = "gpt-4o-mini"
+
+_ai_cache = None
+_ai_limiters = {}
+
+# 댓글 감성 1차 판별 (애매한 댓글만 AI로)
+SENTIMENT_SCORER = LocalSentimentScorer(band=SENTIMENT_UNCERTAINTY_BAND)
+
+# 실행 전체 AI 토큰 사용량 / 상한 (작업별 집계)
+TOKEN_BUDGET = TokenBudget(run_limit=AI_RUN_TOKEN_LIMIT)
 
 
 # 협찬 감지 키워드
@@ -39,12 +70,8 @@ def detect_sponsored_content(title, content):
     # 명시적 협찬 키워드만 확인 (AI 판단 제거)
     full_text = title + content[:500]  # 본문 전체 대신 앞부분만 체크
     
-    for keyword in SPONSORED_KEYWORDS:
-        if keyword in full_text:
-            return True
-    
     # AI 판단 제거 - 너무 많은 정상 리뷰를 차단함
-    return False
+    return KEYWORD_MATCHER.contains_any(full_text, "sponsored")
 
 
 def is_genuine_question(title, content):
@@ -61,7 +88,7 @@ def is_genuine_question(title, content):
     has_question_mark = "?" in title or "?" in title
     
     # 질문 패턴
-    has_question_pattern = any(pattern in full_text for pattern in QUESTION_PATTERNS)
+    has_question_pattern = KEYWORD_MATCHER.contains_any(full_text, "question")
     
     if has_question_mark and has_question_pattern:
         return True
@@ -83,7 +110,7 @@ def is_genuine_question(title, content):
 
 YES 또는 NO로만 답변:"""
 
-        ai_response = call_ai_api(prompt, max_tokens=10)
+        ai_response = call_ai_api(prompt, max_tokens=10, task="question")
         
         return "YES" in ai_response.upper()
     
@@ -99,19 +126,9 @@ def analyze_comment_sentiment(comment_text):
         str: "긍정", "부정", "중립"
     """
     if not GEMINI_API_KEY and not OPENAI_API_KEY:
-        # 간단한 키워드 기반 폴백
-        positive_words = ["좋아요", "만족", "추천", "괜찮", "좋네요", "굿"]
-        negative_words = ["별로", "실망", "안좋", "설사", "안맞", "후회", "최악"]
-        
-        pos_count = sum(1 for w in positive_words if w in comment_text)
-        neg_count = sum(1 for w in negative_words if w in comment_text)
-        
-        if neg_count > pos_count:
-            return "부정"
-        elif pos_count > neg_count:
-            return "긍정"
-        else:
-            return "중립"
+        # 사전 기반 로컬 판별로 폴백
+        score, _ = SENTIMENT_SCORER.score_batch([comment_text])[0]
+        return SENTIMENT_SCORER.label(score)
     
     try:
         prompt = f"""다음 댓글의 감성을 분석하세요:
@@ -120,23 +137,95 @@ def analyze_comment_sentiment(comment_text):
 
 '긍정', '부정', '중립' 중 하나로만 답변:"""
 
-        ai_response = call_ai_api(prompt, max_tokens=10)
-        
-        if "부정" in ai_response:
-            return "부정"
-        elif "긍정" in ai_response:
-            return "긍정"
-        else:
-            return "중립"
+        ai_response = call_ai_api(prompt, max_tokens=10, task="comments")
+        return _normalize_sentiment(ai_response)
     
+    except TokenBudgetExceeded:
+        score, _ = SENTIMENT_SCORER.score_batch([comment_text])[0]
+        return SENTIMENT_SCORER.label(score)
     except:
         return "중립"
 
 
+def _normalize_sentiment(text):
+    """AI 응답 문자열 -> 긍정 / 부정 / 중립"""
+    text = str(text or "")
+    if "부정" in text:
+        return "부정"
+    elif "긍정" in text:
+        return "긍정"
+    else:
+        return "중립"
+
+
+def classify_comments(comments_list):
+    """
+    게시글 댓글 전체의 감성 + 주요 불만을 한 번의 AI 요청으로 분석
+    
+    Args:
+        comments_list: [{"content": ...}] 리스트
+    
+    Returns:
+        tuple: ([감성, ...] 댓글 순서대로, 주요 불만 문자열 또는 None)
+        
+    응답에서 누락된 댓글은 analyze_comment_sentiment()로 개별 재요청
+    주요 불만이 None이면 호출한 쪽에서 extract_key_issues()로 보완
+    """
+    if not GEMINI_API_KEY and not OPENAI_API_KEY:
+        return [analyze_comment_sentiment(c['content']) for c in comments_list], None
+    
+    budget = AI_TOKEN_BUDGETS["comments"]
+    ids = [str(i) for i in range(1, len(comments_list) + 1)]
+    comments_text = "\n".join(
+        f"[댓글 {cid}] {trim_to_budget(comment['content'], budget['input'])}"
+        for cid, comment in zip(ids, comments_list)
+    )
+    
+    prompt = f"""반려동물 사료 관련 게시글의 댓글 {len(comments_list)}개입니다.
+
+{comments_text}
+
+1. 댓글마다 감성을 '긍정', '부정', '중립' 중 하나로 분류하세요.
+2. 부정 댓글들의 공통 불만사항을 한 줄로 간단히 요약하세요. (예: 알러지 반응, 기호성 낮음 / 부정 댓글이 없으면 빈칸)
+
+아래 JSON 형식으로만 응답 (다른 말 없이 JSON만, "id"는 위의 댓글 번호 그대로):
+{{
+  "results": [{{"id": "댓글 번호", "감성": "긍정 또는 부정 또는 중립"}}],
+  "주요_불만": "공통 불만사항 한 줄"
+}}"""
+    
+    sentiments = {}
+    key_issues = None
+    try:
+        ai_response = call_ai_api(
+            prompt, max_tokens=min(budget["output"] * len(comments_list) + 100, 2048), task="comments"
+        )
+        data = json.loads(strip_code_fence(ai_response))
+        if isinstance(data, dict):
+            for item in data.get("results", []):
+                if isinstance(item, dict) and str(item.get("id")) in ids:
+                    sentiments[str(item["id"])] = _normalize_sentiment(item.get("감성"))
+            if isinstance(data.get("주요_불만"), str):
+                key_issues = clean_ai_response(data["주요_불만"])
+    except Exception as e:
+        print(f"      ⚠️ 댓글 일괄 분석 실패: {e}")
+    
+    if len(sentiments) < len(ids):
+        print(f"      ⚠️ 댓글 감성 {len(ids) - len(sentiments)}건 누락, 개별 분석으로 보완")
+    
+    return [
+        sentiments.get(cid) or analyze_comment_sentiment(comment['content'])
+        for cid, comment in zip(ids, comments_list)
+    ], key_issues
+
+
 def analyze_comments_batch(comments_list):
     """
     댓글 목록 일괄 분석
     
+    SENTIMENT_LOCAL_FIRST면 로컬 사전으로 먼저 채점하고,
+    불확실 구간에 있는 댓글만 모아서 AI 요청 1회로 확인
+    
     Returns:
         dict: 감성 통계 + 주요 부정 의견
     """
@@ -153,9 +242,28 @@ def analyze_comments_batch(comments_list):
     negative = []
     neutral = []
     
-    for comment in comments_list:
-        sentiment = analyze_comment_sentiment(comment['content'])
+    if SENTIMENT_LOCAL_FIRST:
+        scores = SENTIMENT_SCORER.score_batch([c['content'] for c in comments_list])
+        sentiments = [label for _, label in scores]
+        uncertain = [i for i, label in enumerate(sentiments) if label is None]
+        key_issues = None
         
+        if uncertain and (GEMINI_API_KEY or OPENAI_API_KEY) and not TOKEN_BUDGET.exhausted:
+            ai_sentiments, key_issues = classify_comments([comments_list[i] for i in uncertain])
+            for i, sentiment in zip(uncertain, ai_sentiments):
+                sentiments[i] = sentiment
+            SENTIMENT_SCORER.record(len(comments_list), len(uncertain))
+            # 로컬에서 부정으로 판정된 댓글은 AI 불만 요약에 포함되지 않았으므로 전체로 다시 요약
+            if any(label == "부정" for _, label in scores):
+                key_issues = None
+        else:
+            for i in uncertain:
+                sentiments[i] = SENTIMENT_SCORER.label(scores[i][0])
+            SENTIMENT_SCORER.record(len(comments_list), 0)
+    else:
+        sentiments, key_issues = classify_comments(comments_list)
+    
+    for comment, sentiment in zip(comments_list, sentiments):
         comment['sentiment'] = sentiment
         
         if sentiment == "긍정":
@@ -165,8 +273,11 @@ def analyze_comments_batch(comments_list):
         else:
             neutral.append(comment)
     
-    # 부정 의견 주요 이슈 추출
-    key_issues = extract_key_issues(negative) if negative else ""
+    # 부정 의견 주요 이슈 (일괄 응답에 없을 때만 별도 요청)
+    if not negative:
+        key_issues = ""
+    elif not key_issues:
+        key_issues = extract_key_issues(negative)
     
     return {
         "긍정_개수": len(positive),
@@ -193,56 +304,213 @@ def extract_key_issues(negative_comments):
 
 핵심 이슈만 간단히 (예: 알러지 반응, 기호성 낮음):"""
 
-        return call_ai_api(prompt, max_tokens=50)
+        return call_ai_api(prompt, max_tokens=50, task="key_issues")
     
     except:
         return ""
 
 
-def call_ai_api(prompt, max_tokens=100):
-    """AI API 호출 (Gemini 또는 OpenAI)"""
+def get_ai_cache():
+    """AI 응답 캐시 (최초 호출 시 생성, 비활성화면 None)"""
+    global _ai_cache
+    if _ai_cache is None and AI_CACHE_ENABLED:
+        _ai_cache = AICache(
+            os.path.join(STATE_DIR, "ai_cache.sqlite3"),
+            ttl_seconds=AI_CACHE_TTL_HOURS * 3600,
+            max_entries=AI_CACHE_MAX_ENTRIES
+        )
+    return _ai_cache
+
+
+def get_ai_limiter(provider):
+    """공급자별 호출 한도 (모든 AI 호출이 공유, 최초 호출 시 생성)"""
+    limiter = _ai_limiters.get(provider)
+    if limiter is None:
+        limits = AI_RATE_LIMITS.get(provider, {})
+        limiter = _ai_limiters.setdefault(
+            provider, ProviderRateLimiter(limits.get("rpm", 60), limits.get("tpm"))
+        )
+    return limiter
+
+
+def format_ai_limiter_stats():
+    """사용한 공급자별 429/감속 상태"""
+    return ", ".join(f"{name}: {limiter.format_stats()}" for name, limiter in _ai_limiters.items())
+
+
+def _retry_after_seconds(response):
+    """
+    재시도 대기 시간 (서버가 알려준 값, 없으면 None)
+    - Retry-After 헤더 (초 또는 HTTP 날짜)
+    - Gemini 오류 본문의 RetryInfo.retryDelay (예: "32s")
+    """
+    value = response.headers.get("Retry-After")
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    
+    try:
+        for detail in response.json().get("error", {}).get("details", []):
+            delay = detail.get("retryDelay")
+            if delay:
+                return float(delay.rstrip("s"))
+    except Exception:
+        pass
+    return None
+
+
+def _post_ai_request(provider, url, estimated_tokens, **kwargs):
+    """
+    공급자 한도에 맞춰 AI API 요청 (429/5xx/네트워크 오류는 백오프 후 재시도)
+    
+    Returns:
+        requests.Response: 마지막 응답 (재시도를 다 써도 실패하면 그 응답 그대로)
+    """
+    with metrics.timer("ai.call"):
+        response = _post_ai_request_with_retry(provider, url, estimated_tokens, **kwargs)
+    if response.status_code != 200:
+        metrics.count("ai.errors")
+    return response
+
+
+def _post_ai_request_with_retry(provider, url, estimated_tokens, **kwargs):
+    """_post_ai_request의 재시도 루프 (대기·재시도를 포함한 전체 시간은 호출 측에서 측정)"""
+    limiter = get_ai_limiter(provider)
     
-    if AI_PROVIDER == "gemini" and GEMINI_API_KEY:
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent?key={GEMINI_API_KEY}"
+    for attempt in range(AI_MAX_RETRIES + 1):
+        limiter.acquire(estimated_tokens)
+        backoff = min(60, AI_BACKOFF_BASE * (2 ** attempt)) * random.uniform(0.5, 1.5)
+        if attempt:
+            metrics.count("ai.retries")
+        
+        try:
+            metrics.count("ai.requests")
+            response = http_client.post(url, **kwargs)
+        except requests.RequestException as e:
+            if attempt >= AI_MAX_RETRIES:
+                metrics.count("ai.errors")
+                raise
+            print(f"      ⚠️ {provider} 연결 실패, {backoff:.1f}초 후 재시도 ({attempt + 1}/{AI_MAX_RETRIES}): {str(e)[:50]}")
+            time.sleep(backoff)
+            continue
+        
+        metrics.count("ai.bytes", len(response.content))
+        if response.status_code == 429 or response.status_code >= 500:
+            if attempt >= AI_MAX_RETRIES:
+                return response
+            delay = _retry_after_seconds(response)
+            delay = backoff if delay is None else delay + random.uniform(0, 1)
+            print(f"      ⏳ {provider} {response.status_code}, {delay:.1f}초 후 재시도 ({attempt + 1}/{AI_MAX_RETRIES})")
+            if response.status_code == 429:
+                # 다른 스레드도 같이 대기하고 이후 속도를 낮춤
+                limiter.throttle(delay)
+            else:
+                time.sleep(delay)
+            continue
+        
+        if response.status_code == 200:
+            limiter.success()
+        return response
+
+
+def call_ai_api(prompt, max_tokens=100, temperature=0.2, timeout=10, provider=None, task="other"):
+    """
+    AI API 호출 (Gemini 또는 OpenAI) - 응답 캐시 우선 조회
+    
+    Args:
+        provider: 지정 시 AI_PROVIDER 대신 사용 ("gemini" 또는 "openai")
+        task: 토큰 사용량 집계용 작업 이름 (예: "blog", "cafe", "comments")
+    
+    Raises:
+        TokenBudgetExceeded: 실행당 토큰 상한 도달 (요청하지 않음)
+    """
+    provider = provider or AI_PROVIDER
+    model = GEMINI_MODEL if provider == "gemini" else OPENAI_MODEL
+    
+    # 캐시 오류(다른 샤드 프로세스가 쓰는 중 등)는 캐시 없이 진행
+    try:
+        cache = get_ai_cache()
+        if cache:
+            key = AICache.make_key(provider, model, prompt, {"temperature": temperature, "max_tokens": max_tokens})
+            cached = cache.get(key)
+            if cached is not None:
+                metrics.count("ai.cache_hits")
+                return cached
+    except Exception as e:
+        print(f"      ⚠️ AI 캐시 조회 실패 (캐시 없이 요청): {e}")
+        cache = None
+    
+    TOKEN_BUDGET.check(task, estimate_tokens(prompt) + max_tokens)
+    response_text = _request_ai_api(prompt, max_tokens, temperature, timeout, provider, model, task)
+    
+    if cache:
+        try:
+            cache.set(key, response_text)
+        except Exception as e:
+            print(f"      ⚠️ AI 캐시 저장 실패: {e}")
+    return response_text
+
+
+def _request_ai_api(prompt, max_tokens, temperature, timeout, provider, model, task):
+    """AI API 실제 요청 (캐시 미스 시)"""
+    if provider == "gemini" and GEMINI_API_KEY:
+        url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={GEMINI_API_KEY}"
         
         data = {
             "contents": [{"parts": [{"text": prompt}]}],
             "generationConfig": {
-                "temperature": 0.2,
+                "temperature": temperature,
                 "maxOutputTokens": max_tokens
             }
         }
         
-        response = requests.post(url, json=data, timeout=10)
+        estimated = estimate_tokens(prompt) + max_tokens
+        response = _post_ai_request(provider, url, estimated, json=data, timeout=timeout)
         
         if response.status_code == 200:
             result = response.json()
+            usage = result.get('usageMetadata', {}).get('totalTokenCount')
+            get_ai_limiter(provider).record_usage(estimated, usage)
+            TOKEN_BUDGET.record(task, estimated, usage)
+            metrics.count("ai.tokens", usage or estimated)
             return result['candidates'][0]['content']['parts'][0]['text'].strip()
         else:
             raise Exception(f"Gemini API error: {response.status_code}")
     
-    elif AI_PROVIDER == "openai" and OPENAI_API_KEY:
+    elif provider == "openai" and OPENAI_API_KEY:
         headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {OPENAI_API_KEY}"
         }
         
         data = {
-            "model": "gpt-4o-mini",
+            "model": model,
             "messages": [{"role": "user", "content": prompt}],
-            "temperature": 0.2,
+            "temperature": temperature,
             "max_tokens": max_tokens
         }
         
-        response = requests.post(
+        estimated = estimate_tokens(prompt) + max_tokens
+        response = _post_ai_request(
+            provider,
             "https://api.openai.com/v1/chat/completions",
+            estimated,
             headers=headers,
             json=data,
-            timeout=10
+            timeout=timeout
         )
         
         if response.status_code == 200:
             result = response.json()
+            usage = result.get('usage', {}).get('total_tokens')
+            get_ai_limiter(provider).record_usage(estimated, usage)
+            TOKEN_BUDGET.record(task, estimated, usage)
+            metrics.count("ai.tokens", usage or estimated)
             return result['choices'][0]['message']['content'].strip()
         else:
             raise Exception(f"OpenAI API error: {response.status_code}")
@@ -287,6 +555,17 @@ COMPETITORS = [
     "고 네추럴", "고 사료", "Go! Solutions", "Go 사료"
 ]
 
+# 전체 필터 목록을 하나의 Aho-Corasick 오토마톤으로 컴파일 (import 시 1회)
+# - 텍스트 1회 순회로 모든 목록의 매칭 위치를 구함 (목록이 커져도 비용은 텍스트 길이에 비례)
+KEYWORD_MATCHER = KeywordMatcher({
+    "exclude": EXCLUDE_KEYWORDS,
+    "required": REQUIRED_KEYWORDS,
+    "sponsored": SPONSORED_KEYWORDS,
+    "question": QUESTION_PATTERNS,
+    "core": CORE_KEYWORDS,
+    "brand": COMPETITORS,
+})
+
 
 def extract_keywords_hybrid(title, content):
     """
@@ -296,42 +575,42 @@ def extract_keywords_hybrid(title, content):
     Returns:
         str: 콤마로 구분된 키워드 문자열
     """
-    found_keywords = []
     full_text = (title + " " + content[:1000])
+    matched = KEYWORD_MATCHER.found_keywords(full_text, "core")
     
-    for keyword in CORE_KEYWORDS:
-        if keyword in full_text:
-            found_keywords.append(keyword)
+    # 출력 순서는 CORE_KEYWORDS 목록 순서 유지
+    found_keywords = [keyword for keyword in CORE_KEYWORDS if keyword in matched]
     
     return ", ".join(found_keywords) if found_keywords else ""
 
 
 def extract_brands_regex(text):
     """
-    텍스트에서 브랜드명 추출 (Regex/List 기반)
+    텍스트에서 브랜드명 추출 (키워드 목록 기반, 첫 등장 순서)
     """
-    found_brands = set()
-    for brand in COMPETITORS:
-        if brand in text:
-            found_brands.add(brand)
-    return list(found_brands)
+    positions = KEYWORD_MATCHER.first_positions(text, "brand")
+    return sorted(positions, key=lambda brand: (positions[brand], brand))
 
 def merge_and_sort_brands(ai_brands_str, text):
     """
     AI 추출 브랜드와 Regex 추출 브랜드를 병합하고 정렬
-    규칙: '보양대첩' 최우선, 그 외에는 발견된 순서 또는 가나다순
+    규칙: '보양대첩' 최우선, 그 외에는 본문에 처음 등장한 순서
+          (본문에서 찾을 수 없는 AI 추출 브랜드는 맨 뒤에 가나다순)
     """
-    # 1. Regex로 확실한 브랜드 찾기
-    regex_brands = extract_brands_regex(text)
+    # 1. 목록 기반으로 확실한 브랜드와 첫 등장 위치 찾기
+    positions = KEYWORD_MATCHER.first_positions(text, "brand")
     
     # 2. AI 결과를 리스트로 변환
     ai_brands = [b.strip() for b in ai_brands_str.split(',') if b.strip()]
     
-    # 3. 병합 (Set으로 중복 제거)
-    all_brands = set(regex_brands + ai_brands)
+    # 3. 병합 (목록에 없는 AI 브랜드는 본문 위치를 직접 찾음)
+    for brand in ai_brands:
+        if brand not in positions:
+            found_at = text.find(brand)
+            positions[brand] = found_at if found_at >= 0 else len(text)
     
-    # 4. 정렬
-    sorted_brands = sorted(list(all_brands))
+    # 4. 정렬 (첫 등장 위치 → 가나다순)
+    sorted_brands = sorted(positions, key=lambda brand: (positions[brand], brand))
     
     # 5. 보양대첩 최우선 처리
     if "보양대첩" in sorted_brands:
@@ -368,6 +647,69 @@ def clean_ai_response(text):
     return text
 
 
+def strip_code_fence(ai_response):
+    """AI 응답의 ```json ... ``` 코드블록 감싸기 제거"""
+    if "```" in ai_response:
+        ai_response = ai_response.split("```")[1]
+        if ai_response.startswith("json"):
+            ai_response = ai_response[4:]
+    return ai_response
+
+
+def parse_batch_response(ai_response, post_ids):
+    """
+    배치 분석 응답(JSON 배열) 파싱
+    
+    Args:
+        ai_response: AI 원본 응답 텍스트
+        post_ids: 요청에 포함된 글 ID 리스트
+    
+    Returns:
+        dict: {글 ID: 결과 dict} - 형식이 어긋난 항목은 제외 (전체 파싱 실패 시 빈 dict)
+    """
+    try:
+        items = json.loads(strip_code_fence(ai_response))
+    except Exception as e:
+        print(f"      ⚠️ 배치 JSON 파싱 실패: {e}")
+        return {}
+    
+    if isinstance(items, dict):
+        items = items.get("results", [])
+    if not isinstance(items, list):
+        return {}
+    
+    wanted = {str(pid) for pid in post_ids}
+    results = {}
+    for item in items:
+        if isinstance(item, dict) and str(item.get("id")) in wanted:
+            results[str(item["id"])] = item
+    return results
+
+
+def _finalize_cafe_analysis(analysis, title, content):
+    """카페 AI 분석 결과 후처리 (마크다운/이모지 제거, 브랜드 병합, 짧은 요약 폴백)"""
+    clean_content = remove_hashtags(content)
+    
+    # 마크다운, 이모지 제거 후처리
+    summary = clean_ai_response(analysis.get("요약", ""))[:150]
+    is_relevant = analysis.get("반려동물관련", True)
+    
+    # 브랜드 언급: AI 결과 + Regex 결과 병합
+    ai_brand_mention = clean_ai_response(analysis.get("브랜드언급", ""))
+    final_brand_mention = merge_and_sort_brands(ai_brand_mention, title + " " + content)
+    
+    # 빈 응답이면 폴백
+    if not summary or len(summary) < 10:
+        print(f"      ⚠️ AI 요약 너무 짧음, 본문으로 대체")
+        summary = clean_content[:100] if clean_content else title[:100]
+        
+    return {
+        "요약": summary, 
+        "반려동물관련": is_relevant,
+        "브랜드언급": final_brand_mention
+    }
+
+
 def analyze_cafe_content(title, content):
     """
     카페 게시글 AI 요약 (본문 요약만, 키워드는 별도 함수)
@@ -380,6 +722,7 @@ def analyze_cafe_content(title, content):
         clean_content = remove_hashtags(content)
         return {"요약": clean_content[:100] if clean_content else title[:100]}
     
+    budget = AI_TOKEN_BUDGETS["cafe"]
     try:
         # 해시태그 제거
         clean_title = remove_hashtags(title)
@@ -390,7 +733,7 @@ def analyze_cafe_content(title, content):
         prompt = f"""반려동물 사료 관련 카페 글을 요약해주세요.
 
 제목: {clean_title}
-본문: {clean_content[:500]}
+본문: {trim_to_budget(clean_content, budget['input'])}
 
 규칙:
 1. 이 글이 "강아지" 또는 "고양이"와 직접적으로 관련된 글인지 가장 먼저 판단하세요. (소라게, 햄스터, 사람 음식 등은 False)
@@ -406,38 +749,15 @@ def analyze_cafe_content(title, content):
   "브랜드언급": "보양대첩을 최우선으로 한 브랜드 목록 (없으면 빈칸)"
 }}"""
 
-        ai_response = call_ai_api(prompt, max_tokens=200)
+        ai_response = call_ai_api(prompt, max_tokens=budget["output"], task="cafe")
         
         # 디버깅: AI 원본 응답 출력
         print(f"      📝 AI 원본 응답: {ai_response[:100]}...")
         
         # JSON 파싱 시도
         try:
-            if "```" in ai_response:
-                ai_response = ai_response.split("```")[1]
-                if ai_response.startswith("json"):
-                    ai_response = ai_response[4:]
-            
-            analysis = json.loads(ai_response)
-            
-            # 마크다운, 이모지 제거 후처리
-            summary = clean_ai_response(analysis.get("요약", ""))[:150]
-            is_relevant = analysis.get("반려동물관련", True)
-            
-            # 브랜드 언급: AI 결과 + Regex 결과 병합
-            ai_brand_mention = clean_ai_response(analysis.get("브랜드언급", ""))
-            final_brand_mention = merge_and_sort_brands(ai_brand_mention, title + " " + content)
-            
-            # 빈 응답이면 폴백
-            if not summary or len(summary) < 10:
-                print(f"      ⚠️ AI 요약 너무 짧음, 본문으로 대체")
-                summary = clean_content[:100] if clean_content else title[:100]
-                
-            return {
-                "요약": summary, 
-                "반려동물관련": is_relevant,
-                "브랜드언급": final_brand_mention
-            }
+            analysis = json.loads(strip_code_fence(ai_response))
+            return _finalize_cafe_analysis(analysis, title, content)
             
         except Exception as json_err:
             print(f"      ⚠️ JSON 파싱 실패: {json_err}")
@@ -457,8 +777,264 @@ def analyze_cafe_content(title, content):
     except Exception as e:
         print(f"      ⚠️ AI 요약 실패: {e}")
         clean_content = remove_hashtags(content)
-        return {"요약": clean_content[:100] if clean_content else title[:100]}
+        return {
+            "요약": clean_content[:100] if clean_content else title[:100],
+            "반려동물관련": True,
+            "브랜드언급": merge_and_sort_brands("", title + " " + content)
+        }
+
+
+def analyze_cafe_contents_batch(posts, batch_size=None):
+    """
+    카페 게시글 여러 개를 한 번의 AI 요청으로 요약
+    
+    Args:
+        posts: [{"id": ..., "title": ..., "content": ...}] 리스트
+        batch_size: 요청당 글 수 (기본값 AI_BATCH_SIZE)
+    
+    Returns:
+        dict: {글 ID: analyze_cafe_content()와 같은 형식의 dict}
+        
+    배치 응답이 깨졌거나 누락된 글은 analyze_cafe_content()로 개별 재요청
+    """
+    batch_size = batch_size or AI_BATCH_SIZE
+    budget = AI_TOKEN_BUDGETS["cafe"]
+    results = {}
+    
+    if batch_size <= 1 or (not GEMINI_API_KEY and not OPENAI_API_KEY):
+        for post in posts:
+            results[post["id"]] = analyze_cafe_content(post["title"], post["content"])
+        return results
+    
+    for i in range(0, len(posts), batch_size):
+        chunk = posts[i:i + batch_size]
+        
+        posts_text = ""
+        for post in chunk:
+            posts_text += f"""
+[글 {post['id']}]
+제목: {remove_hashtags(post['title'])}
+본문: {trim_to_budget(remove_hashtags(post['content']), budget['input'])}
+"""
+        
+        prompt = f"""반려동물 사료 관련 카페 글 {len(chunk)}개를 각각 요약해주세요.
+{posts_text}
+규칙 (글마다 각각 적용):
+1. 이 글이 "강아지" 또는 "고양이"와 직접적으로 관련된 글인지 가장 먼저 판단하세요. (소라게, 햄스터, 사람 음식 등은 False)
+2. 전체 내용을 '음슴체'(~함, ~임)로 끝나는 완전한 문장으로 작성 (권장 100자, 최대 150자)
+3. 마크다운(**), 이모지, 해시태그 사용 금지
+4. "요약:", "결론:" 같은 라벨 없이 바로 내용만 작성
+5. '브랜드언급'에는 본문에 언급된 모든 사료/간식 브랜드명을 쉼표로 구분해 나열하세요. 단, "보양대첩"이 포함되어 있다면 반드시 맨 처음에 적으세요. (예: 보양대첩, 로얄캐닌, 건강백서)
+
+아래 JSON 배열 형식으로만 응답 (다른 말 없이 JSON만, 글마다 하나씩, "id"는 위의 글 번호 그대로):
+[
+  {{
+    "id": "글 번호",
+    "반려동물관련": true 또는 false,
+    "요약": "핵심 내용 요약 (음슴체)",
+    "브랜드언급": "보양대첩을 최우선으로 한 브랜드 목록 (없으면 빈칸)"
+  }}
+]"""
+        
+        try:
+            ai_response = call_ai_api(
+                prompt, max_tokens=min(budget["output"] * len(chunk) + 100, 8192), task="cafe"
+            )
+            parsed = parse_batch_response(ai_response, [post["id"] for post in chunk])
+        except Exception as e:
+            print(f"      ⚠️ 배치 요약 실패: {e}")
+            parsed = {}
+        
+        print(f"   🧠 배치 요약: {len(parsed)}/{len(chunk)}건 성공")
+        
+        for post in chunk:
+            item = parsed.get(str(post["id"]))
+            if item is not None:
+                try:
+                    results[post["id"]] = _finalize_cafe_analysis(item, post["title"], post["content"])
+                    continue
+                except Exception as e:
+                    print(f"      ⚠️ 배치 결과 처리 실패: {e}")
+            # 배치 결과가 없으면 개별 요청으로 폴백
+            results[post["id"]] = analyze_cafe_content(post["title"], post["content"])
+    
+    return results
+
 
+def _finalize_blog_analysis(analysis, title, content):
+    """블로그 AI 분석 결과 후처리 (마크다운/이모지 제거, 기본값, 브랜드 병합)"""
+    # 각 필드에서 마크다운/이모지 제거
+    for key in analysis:
+        if isinstance(analysis[key], str):
+            analysis[key] = clean_ai_response(analysis[key])
+    
+    # 기본값 True 처리 (필드가 없을 경우)
+    if "반려동물관련" not in analysis:
+        analysis["반려동물관련"] = True
+    
+    # 브랜드 언급: AI 결과 + Regex 결과 병합 (하이브리드 추출)
+    ai_brand_mention = analysis.get("브랜드언급", "")
+    final_brand_mention = merge_and_sort_brands(ai_brand_mention, title + " " + content)
+    analysis["브랜드언급"] = final_brand_mention
+        
+    return analysis
+
+
+def analyze_content_with_ai(title, content):
+    """AI로 블로그 본문 분석하여 구조화된 인사이트 추출"""
+    if not ENABLE_AI_ANALYSIS:
+        return {"요약": "", "주요내용": "", "경쟁사언급": "", "감성": "", "액션포인트": ""}
+    
+    if AI_PROVIDER == "gemini" and not GEMINI_API_KEY:
+        return {"요약": "", "주요내용": "", "경쟁사언급": "", "감성": "", "액션포인트": ""}
+    elif AI_PROVIDER == "openai" and not OPENAI_API_KEY:
+        return {"요약": "", "주요내용": "", "경쟁사언급": "", "감성": "", "액션포인트": ""}
+    
+    if not ANALYZE_ALL and "보양대첩" not in title and "보양대첩" not in content:
+        return {"요약": "", "주요내용": "", "경쟁사언급": "", "감성": "", "액션포인트": ""}
+    
+    budget = AI_TOKEN_BUDGETS["blog"]
+    try:
+        prompt = f"""반려동물 사료 관련 블로그 글을 분석해주세요.
+
+제목: {title}
+본문: {trim_to_budget(content, budget['input'])}
+
+3. 각 필드는 간결하게 작성하되, 문장이 중간에 끊기지 않도록 '음슴체'(~함, ~임)로 끝나는 완전한 문장으로 작성하세요. (권장 100자, 최대 150자)
+4. 해당 내용이 없으면 빈 문자열로 작성
+5. '브랜드언급'에는 본문에 언급된 모든 사료/간식 브랜드명을 쉼표로 구분해 나열하세요. 단, "보양대첩"이 포함되어 있다면 반드시 맨 처음에 적으세요. (예: 보양대첩, 로얄캐닌, 건강백서)
+
+아래 JSON 형식으로만 응답 (다른 말 없이 JSON만):
+{{
+  "반려동물관련": true 또는 false,
+  "요약": "핵심 내용 3-4문장 요약 (100~150자 내외 '음슴체'로 자연스럽게 매듭짓기)",
+  "주요내용": "언급된 제품 특징이나 효과 (간결한 명사형)",
+  "브랜드언급": "보양대첩을 최우선으로 한 브랜드 목록 (없으면 빈칸)"
+}}"""
+
+        try:
+            ai_response = call_ai_api(prompt, max_tokens=budget["output"], timeout=15, task="blog")
+        except Exception as api_err:
+            # 호출 실패/토큰 상한 도달 시에도 브랜드는 정규식으로 추출
+            print(f"      ⚠️ AI 호출 실패 ({api_err})")
+            return {
+                "반려동물관련": True, "요약": "", "주요내용": "",
+                "브랜드언급": merge_and_sort_brands("", title + " " + content)
+            }
+        
+        # JSON 파싱
+        try:
+            # 디버깅: AI 원본 응답 출력 (처음 200자)
+            print(f"      📝 AI 원본 응답: {ai_response[:200]}...")
+            
+            analysis = json.loads(strip_code_fence(ai_response))
+            return _finalize_blog_analysis(analysis, title, content)
+        except Exception as parse_err:
+            try:
+                # 파싱 실패 시 텍스트라도 건지기 위한 재시도 + Regex 브랜드 추출
+                fallback_brands_str = merge_and_sort_brands("", title + " " + content)
+                return {
+                    "반려동물관련": True, 
+                    "요약": clean_ai_response(ai_response)[:150], 
+                    "주요내용": "", 
+                    "브랜드언급": fallback_brands_str
+                }
+            except:
+                pass
+            print(f"      ⚠️ JSON 파싱 실패: {parse_err}")
+            # JSON 파싱 실패 시 빈 값 반환 (단, 브랜드는 Regex로라도 추출 시도)
+            try:
+                fallback_brands_str = merge_and_sort_brands("", title + " " + content)
+            except:
+                fallback_brands_str = ""
+                
+            return {"반려동물관련": True, "요약": "", "주요내용": "", "브랜드언급": fallback_brands_str}
+            
+    except Exception as e:
+        print(f"      ⚠️ AI 오류: {str(e)[:50]}")
+        return {"반려동물관련": True, "요약": "", "주요내용": "", "브랜드언급": ""}
+
+
+def analyze_contents_batch(posts, batch_size=None):
+    """
+    블로그 글 여러 개를 한 번의 AI 요청으로 분석
+    
+    Args:
+        posts: [{"id": ..., "title": ..., "content": ...}] 리스트
+        batch_size: 요청당 글 수 (기본값 AI_BATCH_SIZE)
+    
+    Returns:
+        dict: {글 ID: analyze_content_with_ai()와 같은 형식의 dict}
+        
+    배치 응답이 깨졌거나 누락된 글은 analyze_content_with_ai()로 개별 재요청
+    """
+    batch_size = batch_size or AI_BATCH_SIZE
+    budget = AI_TOKEN_BUDGETS["blog"]
+    has_key = GEMINI_API_KEY if AI_PROVIDER == "gemini" else OPENAI_API_KEY
+    results = {}
+    
+    # 배치 대상: AI 분석이 실제로 필요한 글만 (나머지는 개별 함수가 빈 결과 반환)
+    targets = []
+    for post in posts:
+        if (batch_size > 1 and ENABLE_AI_ANALYSIS and has_key
+                and (ANALYZE_ALL or "보양대첩" in post["title"] or "보양대첩" in post["content"])):
+            targets.append(post)
+        else:
+            results[post["id"]] = analyze_content_with_ai(post["title"], post["content"])
+    
+    for i in range(0, len(targets), batch_size):
+        chunk = targets[i:i + batch_size]
+        
+        posts_text = ""
+        for post in chunk:
+            posts_text += f"""
+[글 {post['id']}]
+제목: {post['title']}
+본문: {trim_to_budget(post['content'], budget['input'])}
+"""
+        
+        prompt = f"""반려동물 사료 관련 블로그 글 {len(chunk)}개를 각각 분석해주세요.
+{posts_text}
+규칙 (글마다 각각 적용):
+1. 각 필드는 간결하게 작성하되, 문장이 중간에 끊기지 않도록 '음슴체'(~함, ~임)로 끝나는 완전한 문장으로 작성하세요. (권장 100자, 최대 150자)
+2. 해당 내용이 없으면 빈 문자열로 작성
+3. '브랜드언급'에는 본문에 언급된 모든 사료/간식 브랜드명을 쉼표로 구분해 나열하세요. 단, "보양대첩"이 포함되어 있다면 반드시 맨 처음에 적으세요. (예: 보양대첩, 로얄캐닌, 건강백서)
+
+아래 JSON 배열 형식으로만 응답 (다른 말 없이 JSON만, 글마다 하나씩, "id"는 위의 글 번호 그대로):
+[
+  {{
+    "id": "글 번호",
+    "반려동물관련": true 또는 false,
+    "요약": "핵심 내용 3-4문장 요약 (100~150자 내외 '음슴체'로 자연스럽게 매듭짓기)",
+    "주요내용": "언급된 제품 특징이나 효과 (간결한 명사형)",
+    "브랜드언급": "보양대첩을 최우선으로 한 브랜드 목록 (없으면 빈칸)"
+  }}
+]"""
+        
+        try:
+            ai_response = call_ai_api(
+                prompt, max_tokens=min(budget["output"] * len(chunk), 8192), timeout=30, task="blog"
+            )
+            parsed = parse_batch_response(ai_response, [post["id"] for post in chunk])
+        except Exception as e:
+            print(f"      ⚠️ 배치 분석 실패: {e}")
+            parsed = {}
+        
+        print(f"   🧠 배치 분석: {len(parsed)}/{len(chunk)}건 성공")
+        
+        for post in chunk:
+            item = parsed.get(str(post["id"]))
+            if item is not None:
+                try:
+                    item.pop("id", None)
+                    results[post["id"]] = _finalize_blog_analysis(item, post["title"], post["content"])
+                    continue
+                except Exception as e:
+                    print(f"      ⚠️ 배치 결과 처리 실패: {e}")
+            # 배치 결과가 없으면 개별 요청으로 폴백
+            results[post["id"]] = analyze_content_with_ai(post["title"], post["content"])
+    
+    return results
 
 
 def analyze_daily_summary(blog_rows, cafe_rows):
@@ -470,7 +1046,7 @@ def analyze_daily_summary(blog_rows, cafe_rows):
         cafe_rows: 카페 수집 데이터 리스트
         
     Returns:
-        str: 전문가 분석 리포트 텍스트
+        str: 전문가 분석 리포트 텍스트 (실행당 토큰 상한에 도달했으면 None)
     """
     if not GEMINI_API_KEY and not OPENAI_API_KEY:
         return "AI API가 설정되지 않아 통합 분석을 수행할 수 없습니다."
@@ -501,14 +1077,16 @@ def analyze_daily_summary(blog_rows, cafe_rows):
     keyword_counts = Counter(all_keywords).most_common(15)
     stats_summary = ", ".join([f"{k}({v})" for k, v in keyword_counts])
         
-    # 2. 본문 요약 구성
-    content_summary = "【블로그 데이터】\n"
-    for row in blog_rows[:15]:
-        content_summary += f"- {row[2]} (요약: {row[5]})\n"
-        
-    content_summary += "\n【카페 데이터】\n"
-    for row in cafe_rows[:15]:
-        content_summary += f"- {row[3]} (요약: {row[6]})\n"
+    # 2. 본문 요약 구성 (입력 예산 안에서 가능한 많은 글 - 카페 글이 있으면 블로그는 예산의 절반까지)
+    budget = AI_TOKEN_BUDGETS["daily_summary"]
+    blog_lines = [f"- {row[2]} (요약: {row[5]})" for row in blog_rows]
+    cafe_lines = [f"- {row[3]} (요약: {row[6]})" for row in cafe_rows]
+    
+    blog_part = _take_lines(blog_lines, budget["input"] // 2 if cafe_lines else budget["input"])
+    cafe_part = _take_lines(cafe_lines, budget["input"] - sum(estimate_tokens(line) for line in blog_part))
+    
+    content_summary = "【블로그 데이터】\n" + "".join(line + "\n" for line in blog_part)
+    content_summary += "\n【카페 데이터】\n" + "".join(line + "\n" for line in cafe_part)
         
     prompt = f"""당신은 반려동물 식품 브랜드 '보양대첩'의 마케팅 전략 전문가입니다.
 오늘 수집된 블로그와 카페의 '인기 게시글(관련도순)' 데이터를 분석하고 전략을 제안하세요.
@@ -548,11 +1126,26 @@ def analyze_daily_summary(blog_rows, cafe_rows):
 (내용)"""
 
     try:
-        return call_ai_api(prompt, max_tokens=1200)
+        return call_ai_api(prompt, max_tokens=budget["output"], task="daily_summary")
+    except TokenBudgetExceeded:
+        print("   ⚠️ 실행당 AI 토큰 상한 도달로 일일 리포트 생략")
+        return None
     except Exception as e:
         return f"통합 분석 생성 실패: {e}"
 
 
+def _take_lines(lines, max_tokens):
+    """앞에서부터 추정 토큰 합이 max_tokens 이하인 줄까지"""
+    taken = []
+    used = 0
+    for line in lines:
+        used += estimate_tokens(line)
+        if used > max_tokens:
+            break
+        taken.append(line)
+    return taken
+
+
 if __name__ == "__main__":
     # 테스트
     print("=== 협찬 감지 테스트 ===")
@@ -572,3 +1165,11 @@ if __name__ == "__main__":
     print("\n=== 댓글 감성 분석 테스트 ===")
     test3 = analyze_comment_sentiment("우리 아이는 설사가 나왔어요...")
     print(f"감성: {test3}")  # 부정
+    
+    print("\n=== 댓글 일괄 분석 테스트 ===")
+    test4 = analyze_comments_batch([
+        {"content": "우리 아이는 설사가 나왔어요..."},
+        {"content": "기호성 좋아요! 잘 먹네요"},
+        {"content": "저희는 안 먹어서 후회했어요"}
+    ])
+    print(f"결과: {test4}")  # 긍정 1, 부정 2
@@ -0,0 +1,106 @@
+"""
+로컬 중복 체크 인덱스 (SQLite)
+- 블로그 링크 / 카페 (제목, 날짜) 키를 로컬에 보관
+- 시트는 마지막으로 읽은 행 이후에 추가된 행만 읽어서 반영 (증분 동기화)
+- 주기적으로 전체 재동기화 (시트에서 행 삭제/수정된 경우 대비)
+"""
+
+import os
+import threading
+import time
+
+import state_db
+
+
+class DedupIndex:
+    """
+    시트별 중복 체크 키 인덱스
+
+    Args:
+        path: SQLite 파일 경로
+        full_resync_days: 전체 재동기화 주기 (일)
+    """
+
+    def __init__(self, path, full_resync_days=7):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.full_resync_seconds = full_resync_days * 86400
+        self._lock = threading.Lock()
+        self._conn = state_db.connect(path)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS dedup_keys (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )"""
+        )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS sync_state (
+                namespace TEXT PRIMARY KEY,
+                row_count INTEGER NOT NULL,
+                full_synced_at REAL NOT NULL
+            )"""
+        )
+        self._conn.commit()
+
+    def sync(self, namespace, sheet, key_fn, first_column="A", last_column="Z"):
+        """
+        시트에서 새로 추가된 행만 읽어 인덱스 갱신
+
+        Args:
+            namespace: 인덱스 구분자 (스프레드시트+시트 단위)
+            sheet: gspread 시트 객체
+            key_fn: 행(list, first_column부터) -> 키 문자열 (없으면 None)
+            first_column, last_column: 읽을 열 범위 (키 계산에 필요한 열만)
+
+        Returns:
+            int: 이번에 읽은 행 수
+        """
+        with self._lock:
+            state = self._conn.execute(
+                "SELECT row_count, full_synced_at FROM sync_state WHERE namespace = ?", (namespace,)
+            ).fetchone()
+
+        now = time.time()
+        full_sync = state is None or now - state[1] > self.full_resync_seconds
+        known_rows = 1 if full_sync else max(1, state[0])  # 1행은 헤더
+
+        start_row = known_rows + 1
+        values = sheet.get(f"{first_column}{start_row}:{last_column}")
+
+        keys = []
+        for row in values:
+            key = key_fn(row)
+            if key:
+                keys.append((namespace, key))
+
+        with self._lock:
+            if full_sync:
+                self._conn.execute("DELETE FROM dedup_keys WHERE namespace = ?", (namespace,))
+            self._conn.executemany("INSERT OR IGNORE INTO dedup_keys (namespace, key) VALUES (?, ?)", keys)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (namespace, row_count, full_synced_at) VALUES (?, ?, ?)",
+                (namespace, known_rows + len(values), now if full_sync else state[1]),
+            )
+            self._conn.commit()
+
+        return len(values)
+
+    def add(self, namespace, keys):
+        """
+        방금 시트에 추가한 행의 키를 인덱스에 반영
+
+        행 수(row_count)는 갱신하지 않음 → 다음 동기화 때 이 행들도 다시 읽어 확인
+        (그 사이 다른 곳에서 추가된 행을 건너뛰지 않기 위함)
+        """
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO dedup_keys (namespace, key) VALUES (?, ?)",
+                [(namespace, k) for k in keys if k],
+            )
+            self._conn.commit()
+
+    def keys(self, namespace):
+        """인덱스의 전체 키 집합"""
+        with self._lock:
+            rows = self._conn.execute("SELECT key FROM dedup_keys WHERE namespace = ?", (namespace,)).fetchall()
+        return {r[0] for r in rows}
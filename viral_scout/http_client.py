@@ -0,0 +1,111 @@
+"""
+공용 HTTP 클라이언트
+- 모든 외부 호출(Naver, Gemini, OpenAI, Telegram)이 하나의 Session 공유
+- 호스트별 keep-alive 커넥션 풀 → TCP/TLS 핸드셰이크 재사용
+- 기본 타임아웃 / gzip 응답 압축
+- 호스트별 커넥션 신규 생성 vs 재사용 통계
+"""
+
+import threading
+from collections import defaultdict
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+DEFAULT_TIMEOUT = (5, 15)  # (연결, 읽기) 초 - 호출 측에서 timeout 지정 시 그 값 사용
+POOL_CONNECTIONS = 10      # 풀을 유지할 호스트 수
+POOL_MAXSIZE = 10          # 호스트당 유지할 커넥션 수 (동시 요청 수 이상으로)
+
+_stats = defaultdict(lambda: {"requests": 0, "opened": 0})
+_stats_lock = threading.Lock()
+
+
+def _record(host, field):
+    with _stats_lock:
+        _stats[host][field] += 1
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        _record(self.host, "opened")
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        _record(self.host, "opened")
+        return super()._new_conn()
+
+
+class _PooledAdapter(HTTPAdapter):
+    """커넥션 생성 수를 세고 기본 타임아웃을 적용하는 어댑터"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs):
+        _record(urlparse(request.url).hostname, "requests")
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = DEFAULT_TIMEOUT
+        return super().send(request, **kwargs)
+
+
+def _create_session():
+    session = requests.Session()
+    adapter = _PooledAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    return session
+
+
+session = _create_session()
+
+
+def request(method, url, **kwargs):
+    """공용 Session으로 HTTP 요청 (requests.request와 동일한 인자)"""
+    return session.request(method, url, **kwargs)
+
+
+def get(url, **kwargs):
+    return request("GET", url, **kwargs)
+
+
+def post(url, **kwargs):
+    return request("POST", url, **kwargs)
+
+
+def get_connection_stats():
+    """
+    호스트별 커넥션 통계
+
+    Returns:
+        dict: {host: {"requests": 요청 수, "opened": 신규 커넥션, "reused": 재사용}}
+    """
+    with _stats_lock:
+        return {
+            host: {
+                "requests": s["requests"],
+                "opened": s["opened"],
+                "reused": max(0, s["requests"] - s["opened"]),
+            }
+            for host, s in _stats.items()
+        }
+
+
+def format_connection_stats():
+    """통계를 로그 출력용 문자열로 변환"""
+    stats = get_connection_stats()
+    if not stats:
+        return "   (외부 HTTP 호출 없음)"
+    lines = []
+    for host, s in sorted(stats.items()):
+        lines.append(f"   {host}: 요청 {s['requests']}회 / 신규 연결 {s['opened']} / 재사용 {s['reused']}")
+    return "\n".join(lines)
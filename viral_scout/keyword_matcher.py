@@ -0,0 +1,119 @@
+"""
+다중 패턴 키워드 매칭 (Aho-Corasick)
+- 여러 키워드 목록을 하나의 오토마톤으로 컴파일 (모듈 import 시 1회)
+- 텍스트를 한 번만 훑어서 모든 목록의 매칭 위치를 반환
+- 키워드 수가 늘어도 검색 비용은 텍스트 길이에 비례
+"""
+
+from collections import deque
+
+
+class KeywordMatcher:
+    """
+    그룹별 키워드 목록을 묶은 Aho-Corasick 오토마톤
+
+    매칭 기준은 파이썬 `keyword in text`와 동일 (대소문자 구분, 부분 문자열)
+
+    Args:
+        groups: {그룹명: [키워드, ...]} 예: {"brand": COMPETITORS, "sponsored": SPONSORED_KEYWORDS}
+    """
+
+    def __init__(self, groups):
+        self._goto = [{}]     # 상태별 전이 {문자: 다음 상태}
+        self._fail = [0]      # 실패 링크
+        self._output = [()]   # 상태에서 끝나는 (그룹, 키워드) 목록
+        self.groups = {name: list(keywords) for name, keywords in groups.items()}
+
+        for name, keywords in self.groups.items():
+            for keyword in keywords:
+                if keyword:
+                    self._add(keyword, name)
+        self._build()
+
+    def _add(self, keyword, group):
+        state = 0
+        for ch in keyword:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = nxt
+        if (group, keyword) not in self._output[state]:
+            self._output[state] = self._output[state] + ((group, keyword),)
+
+    def _build(self):
+        """BFS로 실패 링크 계산 + 출력 목록 병합"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+
+    def iter_matches(self, text):
+        """
+        텍스트 1회 순회로 모든 매칭 생성
+
+        Yields:
+            tuple: (그룹, 키워드, 시작 위치) - 끝 위치 순서
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                for group, keyword in output[state]:
+                    yield group, keyword, i - len(keyword) + 1
+
+    def find_all(self, text, groups=None):
+        """
+        모든 그룹의 매칭 위치
+
+        Args:
+            groups: 결과에 포함할 그룹 (None이면 전체)
+
+        Returns:
+            dict: {그룹: [(시작 위치, 키워드), ...]} - 시작 위치 순 정렬
+        """
+        result = {name: [] for name in (groups or self.groups)}
+        for group, keyword, start in self.iter_matches(text):
+            if group in result:
+                result[group].append((start, keyword))
+        for hits in result.values():
+            hits.sort()
+        return result
+
+    def first_positions(self, text, group):
+        """
+        그룹 키워드별 첫 등장 위치
+
+        Returns:
+            dict: {키워드: 첫 시작 위치}
+        """
+        positions = {}
+        for start, keyword in self.find_all(text, [group])[group]:
+            positions.setdefault(keyword, start)
+        return positions
+
+    def contains_any(self, text, group):
+        """그룹 키워드 중 하나라도 포함되면 True (첫 매칭에서 즉시 종료)"""
+        for matched_group, _, _ in self.iter_matches(text):
+            if matched_group == group:
+                return True
+        return False
+
+    def found_keywords(self, text, group):
+        """텍스트에 등장한 그룹 키워드 집합"""
+        return {keyword for matched_group, keyword, _ in self.iter_matches(text) if matched_group == group}
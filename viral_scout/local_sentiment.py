@@ -0,0 +1,126 @@
+"""
+로컬 댓글 감성 점수기 (AI 호출 없이 1차 판별)
+- 반려동물 사료 도메인 가중치 사전 + 부정어 처리 ("좋지 않아요", "설사 없어요")
+- 댓글 목록 전체를 하나의 텍스트로 이어 붙여 오토마톤 1회 순회로 일괄 채점
+- 점수가 애매한 구간(불확실 구간)에 있는 댓글만 AI로 넘김
+"""
+
+import bisect
+import math
+import threading
+
+from keyword_matcher import KeywordMatcher
+
+# 감성 사전 (표현: 가중치) - 양수 긍정 / 음수 부정
+SENTIMENT_LEXICON = {
+    # 긍정
+    "잘 먹": 2.0, "잘먹": 2.0, "흡입": 1.5, "환장": 1.5, "싹싹": 1.5, "기호성 좋": 2.0,
+    "좋아요": 1.5, "좋네요": 1.5, "좋지": 1.0, "좋아해": 1.5, "좋았": 1.5, "만족": 2.0, "추천": 1.0,
+    "괜찮": 1.0, "굿": 1.0, "최고": 2.0, "재구매": 2.0, "정착": 1.5, "효과": 1.0,
+    "변 상태 좋": 2.0, "변이 좋": 2.0, "응가 좋": 2.0, "윤기": 1.0, "건강해": 1.5,
+    "눈물자국 줄": 2.0, "눈물 줄": 1.5, "감사": 0.5,
+    # 부정
+    "별로": -1.5, "실망": -2.0, "안좋": -1.5, "안 좋": -1.5, "후회": -2.0, "최악": -3.0,
+    "안 먹": -2.0, "안먹": -2.0, "입도 안": -2.0, "거부": -2.0, "뱉": -1.5, "남겨": -1.0,
+    "설사": -2.0, "묽은 변": -1.5, "변비": -1.5, "구토": -2.5, "토했": -2.5, "토해": -2.5,
+    "알러지": -1.5, "알레르기": -1.5, "가려워": -1.5, "긁": -1.0, "부작용": -2.5,
+    "안맞": -1.5, "안 맞": -1.5, "환불": -2.0, "비싸": -1.0, "냄새 심": -1.5, "눈물자국 심": -1.5,
+}
+
+# 표현 뒤에 오면 의미를 뒤집는 부정어 ("좋지 않아요", "설사 없어요")
+NEGATION_SUFFIXES = ["지 않", "지않", "지 못", "지못", "지는 않", "않", "없", "아니", "안 했", "안했"]
+# 표현 바로 앞에 오면 의미를 뒤집는 부정어 ("안 괜찮", "못 느꼈")
+NEGATION_PREFIXES = ["안 ", "못 "]
+NEGATION_FACTOR = -0.8  # 부정 시 가중치 배율 (방향 반전 + 약간 약화)
+NEGATION_WINDOW = 6     # 표현 뒤 부정어를 찾는 범위 (글자 수)
+
+_SEPARATOR = "\n\x00\n"  # 댓글 경계 (사전 표현에 포함되지 않는 문자)
+
+
+class LocalSentimentScorer:
+    """
+    사전 기반 감성 점수기
+
+    점수는 -1(부정) ~ 1(긍정), |점수| < band 이면 불확실 (AI 확인 대상)
+
+    Args:
+        lexicon: {표현: 가중치}
+        band: 불확실 구간 (0 ~ 1)
+    """
+
+    def __init__(self, lexicon=None, band=0.35):
+        self.lexicon = dict(lexicon or SENTIMENT_LEXICON)
+        self.band = band
+        self.matcher = KeywordMatcher({"sentiment": list(self.lexicon)})
+        self.scored = 0     # 채점한 댓글 수
+        self.escalated = 0  # AI로 넘긴 댓글 수
+        self._lock = threading.Lock()
+
+    def _is_negated(self, text, start, end):
+        if any(text[max(0, start - len(p)):start] == p for p in NEGATION_PREFIXES):
+            return True
+        tail = text[end:end + NEGATION_WINDOW]
+        return any(tail.startswith(s) or tail.lstrip().startswith(s) for s in NEGATION_SUFFIXES)
+
+    def _raw_scores(self, texts):
+        """댓글 목록을 이어 붙여 1회 순회로 채점 (겹치는 표현은 가장 왼쪽·가장 긴 것만)"""
+        joined = _SEPARATOR.join(texts)
+        offsets = []
+        pos = 0
+        for text in texts:
+            offsets.append(pos)
+            pos += len(text) + len(_SEPARATOR)
+
+        matches = sorted(
+            ((start, -len(keyword), keyword) for _, keyword, start in self.matcher.iter_matches(joined))
+        )
+        raw = [0.0] * len(texts)
+        covered_until = 0
+        for start, neg_len, keyword in matches:
+            if start < covered_until:
+                continue
+            end = start - neg_len
+            covered_until = end
+            weight = self.lexicon[keyword]
+            if self._is_negated(joined, start, end):
+                weight *= NEGATION_FACTOR
+            raw[bisect.bisect_right(offsets, start) - 1] += weight
+        return raw
+
+    def score_batch(self, texts):
+        """
+        댓글 목록 일괄 채점
+
+        Returns:
+            list: [(점수, 라벨 또는 None)] - 라벨이 None이면 불확실 구간
+        """
+        results = []
+        for raw in self._raw_scores(list(texts)):
+            score = math.tanh(raw / 2)
+            if score >= self.band:
+                label = "긍정"
+            elif score <= -self.band:
+                label = "부정"
+            else:
+                label = None
+            results.append((score, label))
+        return results
+
+    def label(self, score):
+        """불확실 구간도 부호로 판정 (AI를 쓸 수 없을 때)"""
+        if score > 0:
+            return "긍정"
+        if score < 0:
+            return "부정"
+        return "중립"
+
+    def record(self, scored, escalated):
+        """AI 확인 비율 집계"""
+        with self._lock:
+            self.scored += scored
+            self.escalated += escalated
+
+    def format_stats(self):
+        """AI 확인 비율 (불확실 구간 조정용)"""
+        rate = (self.escalated / self.scored * 100) if self.scored else 0
+        return f"로컬 판정 {self.scored - self.escalated}건 / AI 확인 {self.escalated}건 (AI 비율 {rate:.0f}%, 불확실 구간 ±{self.band})"
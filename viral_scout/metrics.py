@@ -0,0 +1,182 @@
+"""
+실행 지표 수집 (단계별 소요시간 분포, 호출 수, 전송량, 재시도, AI 토큰)
+- timer(이름)으로 감싼 구간의 소요시간을 고정 구간 히스토그램에 누적 (원본 값은 저장하지 않음)
+- count(이름, n)으로 호출 수/바이트/재시도/토큰 등 누적
+- 실행 종료 시 JSON으로 저장 + 텔레그램 보고용 한 줄 요약
+
+여러 스레드에서 동시에 호출 가능 (기록 1건당 잠금 1회)
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# 히스토그램 구간 상한 (초) - 마지막 구간은 그 이상 전부
+BUCKET_BOUNDS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+class _Histogram:
+    __slots__ = ("count", "total", "min", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        for i, bound in enumerate(BUCKET_BOUNDS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def percentile(self, ratio):
+        """구간 상한으로 근사한 백분위수 (마지막 구간은 최댓값)"""
+        if not self.count:
+            return 0.0
+        target = ratio * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target:
+                return min(BUCKET_BOUNDS[i], self.max) if i < len(BUCKET_BOUNDS) else self.max
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "total_s": round(self.total, 3),
+            "avg_s": round(self.total / self.count, 4) if self.count else 0.0,
+            "min_s": round(self.min or 0.0, 4),
+            "max_s": round(self.max, 4),
+            "p50_s": round(self.percentile(0.5), 4),
+            "p90_s": round(self.percentile(0.9), 4),
+            "p99_s": round(self.percentile(0.99), 4),
+            "buckets": {
+                (f"<={bound}" if i < len(BUCKET_BOUNDS) else f">{BUCKET_BOUNDS[-1]}"): n
+                for i, (bound, n) in enumerate(zip(BUCKET_BOUNDS + (None,), self.buckets))
+                if n
+            },
+        }
+
+
+class Metrics:
+    """실행 1회의 지표 모음"""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self._started = time.monotonic()
+        self._timers = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name, seconds):
+        """소요시간 1건 기록"""
+        with self._lock:
+            histogram = self._timers.get(name)
+            if histogram is None:
+                histogram = self._timers[name] = _Histogram()
+            histogram.add(seconds)
+
+    @contextmanager
+    def timer(self, name):
+        """with 블록 소요시간 기록 (예외가 나도 기록)"""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(name, time.monotonic() - started)
+
+    def count(self, name, n=1):
+        """카운터 누적 (호출 수, 바이트, 재시도, 토큰 등)"""
+        if not n:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def get_count(self, name):
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def get_timer(self, name):
+        """
+        Returns:
+            dict: 해당 구간 통계 (기록이 없으면 None)
+        """
+        with self._lock:
+            histogram = self._timers.get(name)
+            return histogram.to_dict() if histogram else None
+
+    def snapshot(self):
+        """JSON 저장용 전체 지표"""
+        with self._lock:
+            return {
+                "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started_at)),
+                "wall_s": round(time.monotonic() - self._started, 3),
+                "timers": {name: h.to_dict() for name, h in sorted(self._timers.items())},
+                "counters": dict(sorted(self._counters.items())),
+            }
+
+    def save(self, directory, extra=None, keep=60):
+        """
+        지표를 JSON 파일로 저장
+
+        Args:
+            directory: 저장 폴더 (파일명은 실행 시작 시각)
+            extra: 함께 저장할 값 (예: 저장 건수)
+            keep: 폴더에 남길 최근 실행 수 (오래된 파일 삭제)
+
+        Returns:
+            str: 저장한 파일 경로
+        """
+        os.makedirs(directory, exist_ok=True)
+        data = self.snapshot()
+        if extra:
+            data.update(extra)
+        path = os.path.join(directory, time.strftime("run_%Y%m%d_%H%M%S.json", time.localtime(self.started_at)))
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+        runs = sorted(name for name in os.listdir(directory) if name.startswith("run_") and name.endswith(".json"))
+        for name in runs[:-keep]:
+            os.remove(os.path.join(directory, name))
+        return path
+
+    def format_summary(self):
+        """텔레그램 보고용 한 줄 요약 (소요시간이 큰 단계 위주)"""
+        wall = time.monotonic() - self._started
+        parts = [f"⏱️ {int(wall // 60)}분 {int(wall % 60)}초"]
+
+        def timer_part(name, label):
+            t = self.get_timer(name)
+            if t:
+                parts.append(f"{label} {t['count']}회·p90 {t['p90_s']:.2g}초")
+
+        timer_part("naver.search", "검색")
+        timer_part("cafe.search", "카페검색")
+        timer_part("cafe.detail", "카페상세")
+        timer_part("ai.call", "AI")
+
+        tokens = self.get_count("ai.tokens")
+        retries = self.get_count("ai.retries") + self.get_count("sheet.retries")
+        if tokens:
+            parts.append(f"토큰 {tokens / 1000:.1f}k")
+        if retries:
+            parts.append(f"재시도 {retries}회")
+
+        downloaded = self.get_count("naver.bytes") + self.get_count("cafe.detail.bytes") + self.get_count("ai.bytes")
+        if downloaded:
+            parts.append(f"수신 {downloaded / 1024 / 1024:.1f}MB")
+        return " | ".join(parts)
+
+
+# 실행 전체에서 공유하는 지표
+metrics = Metrics()
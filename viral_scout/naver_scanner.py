@@ -7,10 +7,10 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 import time
 import ssl
 import datetime
-import json
-import urllib.request
-import urllib.parse
 from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import shutil
 import gspread
 
 def normalize_cafe_url(url):
@@ -45,14 +45,19 @@ ssl._create_default_https_context = ssl._create_unverified_context
 
 from config import (
     NAVER_CLIENT_ID, NAVER_CLIENT_SECRET, 
-    SEARCH_KEYWORDS, DISPLAY_COUNT, SORT_MODE,
+    SEARCH_KEYWORDS, DISPLAY_COUNT, SORT_MODE, INCREMENTAL_CRAWL,
+    NAVER_SEARCH_CONCURRENCY, NAVER_API_QPS, NAVER_MAX_PAGES,
     GOOGLE_SHEET_URL, SERVICE_ACCOUNT_FILE,
     BLOG_SHEET_NAME, CAFE_SHEET_NAME,
     TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID,
-    EXCLUDE_KEYWORDS, REQUIRED_KEYWORDS, USE_AI_FILTER, OPENAI_API_KEY,
+    USE_AI_FILTER, OPENAI_API_KEY,
     ENABLE_CONTENT_SCRAPING, ENABLE_AI_ANALYSIS, ANALYZE_ALL,
-    ENABLE_CAFE_CRAWLING, CAFE_MAX_POSTS, PRIORITIZE_QUESTIONS, FILTER_SPONSORED, ANALYZE_COMMENTS,
-    AI_PROVIDER, GEMINI_API_KEY
+    ENABLE_CAFE_CRAWLING, CAFE_MAX_POSTS, CAFE_SKIP_IDS, CAFE_LINK_DEDUP_DAYS, PRIORITIZE_QUESTIONS, FILTER_SPONSORED, ANALYZE_COMMENTS,
+    AI_PROVIDER, GEMINI_API_KEY, AI_BATCH_SIZE,
+    AI_RATE_LIMITS, STATE_DIR, CASSETTE_DIR, SHARD_DIR, SHARD_MAX_AGE_HOURS, DEDUP_FULL_RESYNC_DAYS,
+    SHEET_FLUSH_ROWS, SHEET_FLUSH_INTERVAL, SHEET_WRITE_MAX_RETRIES,
+    PIPELINE_QUEUE_SIZE, PIPELINE_FILTER_WORKERS, PIPELINE_AI_WORKERS,
+    NEAR_DUP_ENABLED, NEAR_DUP_MAX_HAMMING, NEAR_DUP_MIN_CHARS, NEAR_DUP_RETENTION_DAYS
 )
 
 from content_filters import (
@@ -63,8 +68,35 @@ from content_filters import (
     extract_keywords_hybrid,
     analyze_comments_batch,
     merge_and_sort_brands,
-    analyze_daily_summary
+    analyze_daily_summary,
+    analyze_cafe_contents_batch,
+    analyze_contents_batch,
+    call_ai_api,
+    get_ai_cache,
+    format_ai_limiter_stats,
+    SENTIMENT_SCORER,
+    TOKEN_BUDGET,
+    KEYWORD_MATCHER
 )
+from rate_limit import RateLimiter, ProviderRateLimiter
+from dedup_index import DedupIndex
+from near_dup import NearDupIndex
+from cafe_registry import CafeRegistry
+from watermark import KST, WatermarkStore, normalize_post_date
+from run_journal import RunJournal
+from sheet_sink import BufferedSheetSink
+from pipeline import Pipeline, Stage, Checkpoint
+from cassette import Cassette, OfflineSheet, install as install_cassette, uninstall as uninstall_cassette
+from sharding import (
+    parse_shard, shard_keywords, save_shard_result, load_shard_results, remove_shard_results,
+    merge_rows, NullSink, run_shard_processes
+)
+import content_filters
+import http_client
+from metrics import metrics
+
+# 네이버 검색 API 초당 호출 한도 (모든 검색 스레드가 공유)
+naver_api_limiter = RateLimiter(NAVER_API_QPS)
 
 
 def scrape_blog_content(url):
@@ -76,13 +108,12 @@ def scrape_blog_content(url):
     for attempt in range(max_retries):
         try:
             from bs4 import BeautifulSoup
-            import requests
             
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
             }
             
-            response = requests.get(url, headers=headers, timeout=10)
+            response = http_client.get(url, headers=headers, timeout=10)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -122,17 +153,11 @@ def scrape_blog_content(url):
 
 def is_blacklisted(title):
     """제외 키워드가 제목에 있는지 확인"""
-    for keyword in EXCLUDE_KEYWORDS:
-        if keyword in title:
-            return True
-    return False
+    return KEYWORD_MATCHER.contains_any(title, "exclude")
 
 def has_required_keyword(title):
     """필수 키워드 중 하나라도 제목에 있는지 확인"""
-    for keyword in REQUIRED_KEYWORDS:
-        if keyword in title:
-            return True
-    return False
+    return KEYWORD_MATCHER.contains_any(title, "required")
 
 def check_relevance_with_ai(title, description):
     """AI를 사용해 반려동물 사료 관련 글인지 판단"""
@@ -140,8 +165,6 @@ def check_relevance_with_ai(title, description):
         return True
     
     try:
-        import requests
-        
         prompt = f"""다음 블로그 글이 "반려동물(강아지/고양이) 사료, 간식, 영양제" 관련 내용인지 판단해주세요.
 사람이 먹는 음식, 한식 레시피, 맛집, 인테리어 등은 관련 없습니다.
 
@@ -150,31 +173,8 @@ def check_relevance_with_ai(title, description):
 
 답변은 "YES" 또는 "NO"로만 해주세요."""
 
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {OPENAI_API_KEY}"
-        }
-        
-        data = {
-            "model": "gpt-4o-mini",
-            "messages": [{"role": "user", "content": prompt}],
-            "temperature": 0.1,
-            "max_tokens": 10
-        }
-        
-        response = requests.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers=headers,
-            json=data,
-            timeout=10
-        )
-        
-        if response.status_code == 200:
-            result = response.json()
-            answer = result['choices'][0]['message']['content'].strip().upper()
-            return "YES" in answer
-        else:
-            return True
+        answer = call_ai_api(prompt, max_tokens=10, temperature=0.1, provider="openai", task="relevance").upper()
+        return "YES" in answer
             
     except Exception as e:
         return True
@@ -198,135 +198,15 @@ def clean_ai_text(text):
     return re.sub(r'\s+', ' ', text).strip()
 
 
-def analyze_content_with_ai(title, content):
-    """AI로 블로그 본문 분석하여 구조화된 인사이트 추출"""
-    if not ENABLE_AI_ANALYSIS:
-        return {"요약": "", "주요내용": "", "경쟁사언급": "", "감성": "", "액션포인트": ""}
-    
-    if AI_PROVIDER == "gemini" and not GEMINI_API_KEY:
-        return {"요약": "", "주요내용": "", "경쟁사언급": "", "감성": "", "액션포인트": ""}
-    elif AI_PROVIDER == "openai" and not OPENAI_API_KEY:
-        return {"요약": "", "주요내용": "", "경쟁사언급": "", "감성": "", "액션포인트": ""}
-    
-    if not ANALYZE_ALL and "보양대첩" not in title and "보양대첩" not in content:
-        return {"요약": "", "주요내용": "", "경쟁사언급": "", "감성": "", "액션포인트": ""}
-    
-    try:
-        import requests
-        import json as json_module
-        
-        prompt = f"""반려동물 사료 관련 블로그 글을 분석해주세요.
-
-제목: {title}
-본문: {content[:1500]}
-
-3. 각 필드는 간결하게 작성하되, 문장이 중간에 끊기지 않도록 '음슴체'(~함, ~임)로 끝나는 완전한 문장으로 작성하세요. (권장 100자, 최대 150자)
-4. 해당 내용이 없으면 빈 문자열로 작성
-5. '브랜드언급'에는 본문에 언급된 모든 사료/간식 브랜드명을 쉼표로 구분해 나열하세요. 단, "보양대첩"이 포함되어 있다면 반드시 맨 처음에 적으세요. (예: 보양대첩, 로얄캐닌, 건강백서)
-
-아래 JSON 형식으로만 응답 (다른 말 없이 JSON만):
-{{
-  "반려동물관련": true 또는 false,
-  "요약": "핵심 내용 3-4문장 요약 (100~150자 내외 '음슴체'로 자연스럽게 매듭짓기)",
-  "주요내용": "언급된 제품 특징이나 효과 (간결한 명사형)",
-  "브랜드언급": "보양대첩을 최우선으로 한 브랜드 목록 (없으면 빈칸)"
-}}"""
-
-        if AI_PROVIDER == "gemini":
-            url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent?key={GEMINI_API_KEY}"
-
-            data = {
-                "contents": [{"parts": [{"text": prompt}]}],
-                "generationConfig": {"temperature": 0.2, "maxOutputTokens": 600}
-            }
-            response = requests.post(url, json=data, timeout=15)
-
-            if response.status_code == 200:
-                result = response.json()
-                ai_response = result['candidates'][0]['content']['parts'][0]['text'].strip()
-            else:
-                print(f"      ⚠️ Gemini 실패 ({response.status_code})")
-                return {"반려동물관련": True, "요약": "", "주요내용": "", "브랜드언급": ""}
-        
-        else:
-            headers = {"Content-Type": "application/json", "Authorization": f"Bearer {OPENAI_API_KEY}"}
-            data = {
-                "model": "gpt-4o-mini",
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0.2,
-                "max_tokens": 600
-            }
-            response = requests.post("https://api.openai.com/v1/chat/completions", headers=headers, json=data, timeout=15)
-            
-            if response.status_code == 200:
-                result = response.json()
-                ai_response = result['choices'][0]['message']['content'].strip()
-            else:
-                print(f"      ⚠️ OpenAI 실패 ({response.status_code})")
-                return {"반려동물관련": True, "요약": "", "주요내용": "", "브랜드언급": ""}
-        
-        # JSON 파싱
-        try:
-            # 디버깅: AI 원본 응답 출력 (처음 200자)
-            print(f"      📝 AI 원본 응답: {ai_response[:200]}...")
-            
-            if "```" in ai_response:
-                ai_response = ai_response.split("```")[1]
-                if ai_response.startswith("json"):
-                    ai_response = ai_response[4:]
-            
-            analysis = json_module.loads(ai_response)
-            # 각 필드에서 마크다운/이모지 제거
-            for key in analysis:
-                if isinstance(analysis[key], str):
-                    analysis[key] = clean_ai_text(analysis[key])
-            
-            # 기본값 True 처리 (필드가 없을 경우)
-            if "반려동물관련" not in analysis:
-                analysis["반려동물관련"] = True
-            
-            # 브랜드 언급: AI 결과 + Regex 결과 병합 (하이브리드 추출)
-            ai_brand_mention = analysis.get("브랜드언급", "")
-            final_brand_mention = merge_and_sort_brands(ai_brand_mention, title + " " + content)
-            analysis["브랜드언급"] = final_brand_mention
-                
-            return analysis
-        except Exception as parse_err:
-            try:
-                # 파싱 실패 시 텍스트라도 건지기 위한 재시도 + Regex 브랜드 추출
-                fallback_brands_str = merge_and_sort_brands("", title + " " + content)
-                return {
-                    "반려동물관련": True, 
-                    "요약": clean_ai_text(ai_response)[:150], 
-                    "주요내용": "", 
-                    "브랜드언급": fallback_brands_str
-                }
-            except:
-                pass
-            print(f"      ⚠️ JSON 파싱 실패: {parse_err}")
-            # JSON 파싱 실패 시 빈 값 반환 (단, 브랜드는 Regex로라도 추출 시도)
-            try:
-                fallback_brands_str = merge_and_sort_brands("", title + " " + content)
-            except:
-                fallback_brands_str = ""
-                
-            return {"반려동물관련": True, "요약": "", "주요내용": "", "브랜드언급": fallback_brands_str}
-            
-    except Exception as e:
-        print(f"      ⚠️ AI 오류: {str(e)[:50]}")
-        return {"반려동물관련": True, "요약": "", "주요내용": "", "브랜드언급": ""}
-
-
 def send_telegram_message(message, disable_notification=False):
     """텔레그램 메시지 발송"""
     try:
-        import requests
         url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
         data = {"chat_id": TELEGRAM_CHAT_ID, "text": message, "parse_mode": "HTML"}
         if disable_notification:
             data["disable_notification"] = True
             
-        response = requests.post(url, data=data, timeout=10)
+        response = http_client.post(url, data=data, timeout=10)
         
         if response.status_code == 200:
             print("✅ 텔레그램 발송 성공")
@@ -342,9 +222,321 @@ def format_date(date_str):
     except:
         return date_str
 
+RUN_JOURNAL_PATH = os.path.join(STATE_DIR, "run_journal.jsonl")
+
+def open_run_journal(resume, today_str, path=None):
+    """
+    실행 저널 열기
+    
+    Args:
+        resume: True면 직전 미완료 실행의 저널을 이어서 사용
+        today_str: 새 실행의 수집일시
+        path: 저널 파일 경로 (기본값 RUN_JOURNAL_PATH)
+    
+    Returns:
+        RunJournal: 재개할 실행이 없으면 새 저널
+    """
+    path = path or RUN_JOURNAL_PATH
+    if resume:
+        journal = RunJournal.load(path)
+        if journal and not journal.completed:
+            done_count = sum(len(v) for v in journal.done.values())
+            analyzed_count = sum(len(v) for v in journal.keys.values())
+            print(f"♻️ 이전 실행 재개 ({journal.today}): 완료 키워드 {done_count}개, 분석 완료 글 {analyzed_count}건")
+            return journal
+        print("ℹ️ 재개할 미완료 실행이 없어 새로 시작합니다.")
+    return RunJournal.start(path, today_str)
+
+def open_sheet_sink(sheet, journal, journal_sheet, dedup_kind, key_fn, link_fn, value_input_option, name,
+                    existing_keys_fn=None):
+    """
+    시트 버퍼 저장기 생성 (저장 성공 시 저널/중복 체크 인덱스/유사글 지문 갱신)
+    
+    재개 시 저장 완료 기록 전에 중단된 배치(시트에는 이미 추가됨)를 다시 쓰지 않도록
+    미저장 행의 앞부분을 시트의 기존 키와 비교해서 이미 있는 행은 저장 완료로 기록
+    
+    Args:
+        sheet: gspread 시트 객체
+        journal: 실행 저널
+        journal_sheet: 저널의 시트 구분 ("blog" / "cafe")
+        dedup_kind: 중복 체크 인덱스 키 종류 ("link" / "cafe_key")
+        key_fn: 행 -> 중복 체크 키
+        link_fn: 행 -> 유사글 지문 링크 (find_near_duplicate에 넘긴 링크)
+        value_input_option: append_rows 옵션
+        name: 로그 표시용 이름
+        existing_keys_fn: 시트의 기존 키 집합을 돌려주는 함수 (key_fn과 같은 형식, 재개 시에만 호출)
+    
+    Returns:
+        BufferedSheetSink: 재개 시 이전 실행에서 저장하지 못한 행이 먼저 들어 있음
+    """
+    already_flushed = journal.flushed.get(journal_sheet, 0)
+    pending = journal.pending_rows(journal_sheet)
+    if pending and existing_keys_fn:
+        # 배치는 순서대로 저장되므로 이미 저장된 행은 미저장 행의 앞부분에만 있음
+        existing = existing_keys_fn()
+        skipped = 0
+        while skipped < len(pending) and key_fn(pending[skipped]) in existing:
+            skipped += 1
+        if skipped:
+            print(f"   ♻️ [{name}] 이미 시트에 있는 {skipped}건은 다시 저장하지 않음 (저장 완료 기록 전 중단)")
+            already_flushed += skipped
+            journal.mark_flushed(journal_sheet, already_flushed)
+            pending = pending[skipped:]
+    
+    def on_flush(batch, written):
+        journal.mark_flushed(journal_sheet, already_flushed + written)
+        add_to_dedup_index(sheet, dedup_kind, [key_fn(row) for row in batch])
+        register_near_duplicates([link_fn(row) for row in batch])
+    
+    sink = BufferedSheetSink(
+        sheet, value_input_option,
+        flush_rows=SHEET_FLUSH_ROWS, flush_interval=SHEET_FLUSH_INTERVAL,
+        max_retries=SHEET_WRITE_MAX_RETRIES, on_flush=on_flush, name=name
+    )
+    sink.extend(pending)
+    return sink
+
+_dedup_index = None
+
+def get_dedup_index():
+    """로컬 중복 체크 인덱스 (최초 호출 시 생성)"""
+    global _dedup_index
+    if _dedup_index is None:
+        _dedup_index = DedupIndex(
+            os.path.join(STATE_DIR, "dedup_index.sqlite3"),
+            full_resync_days=DEDUP_FULL_RESYNC_DAYS
+        )
+    return _dedup_index
+
+_near_dup_index = None
+
+def get_near_dup_index():
+    """유사 게시글 인덱스 (최초 호출 시 생성, 비활성화면 None)"""
+    global _near_dup_index
+    if _near_dup_index is None and NEAR_DUP_ENABLED:
+        _near_dup_index = NearDupIndex(
+            os.path.join(STATE_DIR, "near_dup.sqlite3"),
+            max_hamming=NEAR_DUP_MAX_HAMMING,
+            min_chars=NEAR_DUP_MIN_CHARS,
+            retention_days=NEAR_DUP_RETENTION_DAYS
+        )
+    return _near_dup_index
+
+_cafe_registry = None
+
+def get_cafe_registry():
+    """카페 정보 저장소 (최초 호출 시 생성, 열지 못하면 None - 저장소 없이 크롤링)"""
+    global _cafe_registry
+    if _cafe_registry is None:
+        try:
+            _cafe_registry = CafeRegistry(os.path.join(STATE_DIR, "cafe_registry.sqlite3"), skip_ids=CAFE_SKIP_IDS)
+        except Exception as e:
+            print(f"   ⚠️ 카페 저장소 열기 실패 (저장소 없이 진행): {e}")
+    return _cafe_registry
+
+_watermarks = None
+
+def get_watermarks():
+    """키워드별 수집 기준점 (최신순 검색 + INCREMENTAL_CRAWL일 때만, 아니면 None)"""
+    global _watermarks
+    if _watermarks is None and INCREMENTAL_CRAWL and SORT_MODE == "date":
+        try:
+            _watermarks = WatermarkStore(os.path.join(STATE_DIR, "watermarks.sqlite3"))
+        except Exception as e:
+            print(f"   ⚠️ 수집 기준점 열기 실패 (전체 수집으로 진행): {e}")
+    return _watermarks
+
+def blog_watermark_entry(item):
+    """블로그 검색 item -> (날짜, 링크)"""
+    return item.get('postdate'), item.get('link')
+
+def cafe_watermark_entry(post):
+    """카페 카드/게시글 -> (날짜, 정규화 링크)"""
+    return normalize_post_date(post.get('date')), normalize_cafe_url(post.get('link'))
+
+def watermark_stop_at(source, keyword, entry_fn):
+    """
+    이전 실행에서 이미 본 글 판별 함수 (기준점이 없으면 None → 끝까지 수집)
+    
+    Args:
+        source: "blog" / "cafe"
+        keyword: 검색 키워드
+        entry_fn: 검색 결과 항목 -> (날짜, 링크)
+    """
+    watermarks = get_watermarks()
+    if not watermarks:
+        return None
+    is_seen = watermarks.seen_checker(source, keyword)
+    if not is_seen:
+        return None
+    
+    def stop_at(entry):
+        if is_seen(*entry_fn(entry)):
+            watermarks.stopped += 1
+            return True
+        return False
+    
+    return stop_at
+
+def find_near_duplicate(text, link, source):
+    """
+    이전에 수집한 글(카페/블로그 공통)과 내용이 거의 같은지 확인
+    
+    지문은 시트에 저장된 뒤에만 등록 (register_near_duplicates)
+    
+    Returns:
+        str: 원본 글 링크 (유사글이 아니거나 확인 실패 시 None)
+    """
+    try:
+        index = get_near_dup_index()
+        if not index:
+            return None
+        match = index.check(text, link, source)
+        return match[0] if match else None
+    except Exception as e:
+        print(f"      ⚠️ 유사글 확인 실패: {e}")
+        return None
+
+def register_near_duplicates(links):
+    """시트에 저장된 글의 유사글 지문 등록 (find_near_duplicate에서 확인한 글만)"""
+    try:
+        index = get_near_dup_index()
+        if index:
+            index.add(links)
+    except Exception as e:
+        print(f"      ⚠️ 유사글 지문 등록 실패: {e}")
+
+def drop_near_duplicate_rows(rows, link_fn, fingerprints):
+    """
+    샤드 결과 행 중 다른 샤드/이전 실행의 글과 내용이 거의 같은 행 제외 (병합 단계)
+    
+    샤드는 각자 이전 실행의 지문과만 비교하므로 샤드끼리의 유사글은 여기서 처음 비교됨
+    남은 행의 지문은 시트 저장 후 등록 (open_sheet_sink)
+    
+    Args:
+        rows: 병합된 행 리스트 (키워드 순)
+        link_fn: 행 -> 지문 링크
+        fingerprints: {링크: (지문, 출처)} - 샤드 결과의 "fingerprints"
+    
+    Returns:
+        tuple: (남은 행 리스트, 제외한 행 수)
+    """
+    kept = []
+    for row in rows:
+        link = link_fn(row)
+        entry = fingerprints.get(link)
+        match = None
+        if entry:
+            try:
+                index = get_near_dup_index()
+                match = index.check_fingerprint(entry[0], link, entry[1]) if index else None
+            except Exception as e:
+                print(f"      ⚠️ 유사글 확인 실패: {e}")
+        if match:
+            print(f"   🔁 유사글 제외: {link} ≈ {match[0]}")
+            continue
+        kept.append(row)
+    return kept, len(rows) - len(kept)
+
+def discard_near_duplicate(link):
+    """저장하지 않는 글(AI 판단 제외 등)의 지문 버리기"""
+    if _near_dup_index:
+        _near_dup_index.discard(link)
+
+def complete_keyword(journal, checkpoint):
+    """
+    키워드 완료 표시 처리 (싱크에서 호출 - 이 키워드의 글이 모두 저장/제외된 뒤)
+    
+    - 저널에 키워드 완료 기록
+    - 수집 기준점 갱신 (검색 직후가 아니라 여기서 → 아직 처리 중이거나 실패한 글을 넘어가지 않음)
+    - 처리 도중 실패한 글이 있으면 둘 다 하지 않음 → --resume/다음 실행에서 그 키워드를 다시 수집
+    
+    Args:
+        journal: 실행 저널
+        checkpoint: Checkpoint((단계, 키워드, 본 글의 (날짜, 링크) 목록, 수집 실패한 글의 (날짜, 링크) 목록))
+    """
+    phase, keyword, seen, failed = checkpoint.payload
+    if checkpoint.failed:
+        print(f"   ⚠️ [{keyword}] 처리 실패 {checkpoint.failed}건 → 키워드 완료/기준점 갱신 안 함")
+        return
+    journal.mark_keyword_done(phase, keyword)
+    if get_watermarks():
+        get_watermarks().advance(phase, keyword, seen, failed=failed)
+
+def use_state_dir(path):
+    """상태 파일 폴더 변경 (중복 체크/유사글 인덱스, 카페 저장소, 수집 기준점, AI 캐시, 저널을 새 폴더에서 다시 생성)"""
+    global STATE_DIR, RUN_JOURNAL_PATH, _dedup_index, _near_dup_index, _cafe_registry, _watermarks
+    STATE_DIR = path
+    RUN_JOURNAL_PATH = os.path.join(path, "run_journal.jsonl")
+    _dedup_index = None
+    _near_dup_index = None
+    _cafe_registry = None
+    _watermarks = None
+    content_filters.STATE_DIR = path
+    content_filters._ai_cache = None
+
+def open_cassette(record_name, replay_name):
+    """
+    네트워크 녹화/재생 준비 (--record / --replay)
+    
+    - 공용 HTTP 세션 요청을 카세트로 연결
+    - 상태 파일은 카세트 폴더 안에서 매번 비운 채로 시작 → 녹화와 재생이 같은 글을 같은 순서로 처리
+    
+    Returns:
+        tuple: (Cassette, 원래 HTTP 어댑터) - 카세트 모드가 아니면 (None, None)
+    """
+    if not (record_name or replay_name):
+        return None, None
+    mode, name = ("record", record_name) if record_name else ("replay", replay_name)
+    cassette = Cassette(os.path.join(CASSETTE_DIR, name), mode)
+    
+    state_dir = os.path.join(cassette.path, "state")
+    shutil.rmtree(state_dir, ignore_errors=True)
+    use_state_dir(state_dir)
+    
+    original_adapters = install_cassette(http_client.session, cassette)
+    print(f"📼 카세트 {'재생' if cassette.replaying else '녹화'}: {cassette.path}")
+    return cassette, original_adapters
+
+def configure_shard(index, count):
+    """
+    샤드 실행 준비 (--shard i/N)
+    
+    - 실행 저널은 샤드별 파일 (--resume도 샤드별로 이어서 실행)
+    - 네이버 검색/AI 호출 한도는 N등분 (N개 프로세스가 동시에 호출해도 전체 한도 유지)
+    """
+    global RUN_JOURNAL_PATH, naver_api_limiter
+    RUN_JOURNAL_PATH = os.path.join(STATE_DIR, f"run_journal_shard_{index}_of_{count}.jsonl")
+    naver_api_limiter = RateLimiter(NAVER_API_QPS / count)
+    for provider, limits in AI_RATE_LIMITS.items():
+        tpm = limits.get("tpm")
+        content_filters._ai_limiters[provider] = ProviderRateLimiter(
+            limits.get("rpm", 60) / count, tpm / count if tpm else None
+        )
+    print(f"🧩 샤드 {index}/{count}: 네이버 {NAVER_API_QPS / count:.1f}회/초, AI 호출 한도 1/{count}")
+
+def _dedup_namespace(sheet, kind):
+    """인덱스 구분자: 스프레드시트 ID + 시트 ID + 키 종류"""
+    return f"{getattr(sheet, 'spreadsheet_id', '')}:{sheet.id}:{kind}"
+
+def _column_letter(index):
+    """0-based 열 인덱스 -> 시트 열 문자 (0 -> A)"""
+    letters = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+def make_cafe_key(title, date):
+    """카페 글 중복 체크 키 (제목+날짜)"""
+    return f"{title.strip()}\t{date.strip()}"
+
 def get_existing_links(sheet, link_column_index):
     """
-    구글 시트에서 기존 링크 목록 추출 (중복 체크용)
+    기존 링크 목록 추출 (중복 체크용)
+    
+    로컬 인덱스를 사용하고, 시트에서는 마지막 동기화 이후 추가된 행의 링크 열만 읽음
     
     Args:
         sheet: gspread 시트 객체
@@ -354,43 +546,94 @@ def get_existing_links(sheet, link_column_index):
         set: 기존 링크 집합 (정규화됨)
     """
     try:
-        all_values = sheet.get_all_values()
-        if len(all_values) <= 1:
-            return set()
+        index = get_dedup_index()
+        namespace = _dedup_namespace(sheet, "link")
+        column = _column_letter(link_column_index)
         
-        links = set()
-        for row in all_values[1:]:
-            if len(row) > link_column_index and row[link_column_index]:
+        with metrics.timer("dedup.load"):
+            synced = index.sync(
+                namespace, sheet,
                 # URL 정규화하여 저장 (비교 정확도 향상)
-                links.add(normalize_cafe_url(row[link_column_index]))
-        return links
+                key_fn=lambda row: normalize_cafe_url(row[0]) if row and row[0] else None,
+                first_column=column, last_column=column
+            )
+        print(f"      🔄 시트 신규 행 {synced}건 인덱스 반영")
+        return index.keys(namespace)
     except Exception as e:
         print(f"      ⚠️ 기존 링크 조회 실패: {e}")
         return set()
 
 def get_existing_cafe_keys(sheet):
     """
-    구글 시트에서 기존 카페 글 키(제목+날짜) 추출 (중복 체크용)
+    기존 카페 글 키(제목+날짜) 추출 (중복 체크용)
     제목: D열 (index 3)
     날짜: E열 (index 4)
+    
+    로컬 인덱스를 사용하고, 시트에서는 마지막 동기화 이후 추가된 행의 D:E열만 읽음
     """
     try:
-        all_values = sheet.get_all_values()
-        if len(all_values) <= 1:
-            return set()
+        index = get_dedup_index()
+        namespace = _dedup_namespace(sheet, "cafe_key")
         
-        keys = set()
-        for row in all_values[1:]:
-            if len(row) > 4:
-                title = row[3].strip()
-                date = row[4].strip()
-                if title and date:
-                    keys.add((title, date))
-        return keys
+        def key_fn(row):
+            if len(row) > 1 and row[0].strip() and row[1].strip():
+                return make_cafe_key(row[0], row[1])
+            return None
+        
+        with metrics.timer("dedup.load"):
+            synced = index.sync(namespace, sheet, key_fn, first_column="D", last_column="E")
+        print(f"      🔄 시트 신규 행 {synced}건 인덱스 반영")
+        return {tuple(k.split("\t", 1)) for k in index.keys(namespace)}
     except Exception as e:
         print(f"      ⚠️ 기존 카페 글 키 로드 실패: {e}")
         return set()
 
+def get_recent_cafe_links(sheet):
+    """
+    최근 CAFE_LINK_DEDUP_DAYS일 동안 수집된 카페 글의 (제목, 링크) 집합 (중복 체크 보조)
+    
+    이전 버전은 검색 결과의 모든 글에 첫 글의 날짜를 저장 → 그때 저장된 행은 (제목, 날짜) 키가 맞지 않아
+    같은 글이 올바른 날짜로 한 번 더 수집될 수 있음. 링크는 정확히 저장됐으므로 제목+링크로 한 번 더 확인
+    
+    시트의 A(수집일시), D(제목), F(링크) 열에서 읽음 (로컬 인덱스로 증분 동기화, .state가 없어지면 시트에서 다시 읽음)
+    
+    Returns:
+        set: (제목, 정규화 링크) 튜플 집합 (비활성화 또는 실패 시 빈 집합)
+    """
+    if CAFE_LINK_DEDUP_DAYS <= 0:
+        return set()
+    try:
+        index = get_dedup_index()
+        namespace = _dedup_namespace(sheet, "cafe_title_link")
+        
+        def key_fn(row):
+            if len(row) > 5 and row[3].strip() and row[5].strip():
+                collected = normalize_post_date(row[0]) or ""
+                return "\t".join([collected, row[3].strip(), normalize_cafe_url(row[5].strip())])
+            return None
+        
+        with metrics.timer("dedup.load"):
+            index.sync(namespace, sheet, key_fn, first_column="A", last_column="F")
+        
+        cutoff = (datetime.datetime.now(KST) - datetime.timedelta(days=CAFE_LINK_DEDUP_DAYS)).strftime("%Y%m%d")
+        recent = set()
+        for key in index.keys(namespace):
+            collected, rest = key.split("\t", 1)
+            # 수집일시를 읽을 수 없는 행은 최근 행으로 취급
+            if not collected or collected >= cutoff:
+                recent.add(tuple(rest.rsplit("\t", 1)))
+        return recent
+    except Exception as e:
+        print(f"      ⚠️ 기존 카페 글 링크 로드 실패: {e}")
+        return set()
+
+def add_to_dedup_index(sheet, kind, keys):
+    """시트에 추가한 행의 키를 로컬 인덱스에 반영 (kind: "link" 또는 "cafe_key")"""
+    try:
+        get_dedup_index().add(_dedup_namespace(sheet, kind), keys)
+    except Exception as e:
+        print(f"      ⚠️ 중복 체크 인덱스 갱신 실패: {e}")
+
 
 def load_keywords_from_sheet(spreadsheet):
     """
@@ -452,13 +695,14 @@ def filter_new_posts(posts, existing_links, source_type="카페"):
     print(f"   📋 중복 제외하고 {len(new_posts)}건 수집 (중복: {duplicates}건)")
     return new_posts
 
-def filter_new_cafe_posts(posts, existing_keys):
+def filter_new_cafe_posts(posts, existing_keys, recent_links=()):
     """
     신규 카페 게시글만 필터링 (제목+날짜 기준 중복 제외)
     
     Args:
         posts: 게시글 리스트
         existing_keys: (제목, 날짜) 튜플 집합
+        recent_links: 최근 수집된 글의 (제목, 정규화 링크) 집합 (get_recent_cafe_links)
     
     Returns:
         list: 중복 제외된 신규 게시글
@@ -469,7 +713,7 @@ def filter_new_cafe_posts(posts, existing_keys):
         # 제목과 날짜로 키 생성
         key = (p.get('title', '').strip(), p.get('date', '').strip())
         
-        if key not in existing_keys:
+        if key not in existing_keys and (key[0], normalize_cafe_url(p.get('link'))) not in recent_links:
             new_posts.append(p)
             
     duplicates = len(posts) - len(new_posts)
@@ -607,24 +851,382 @@ def init_google_sheets():
         print(f"❌ 시트 연결 실패: {e}")
         return None, None, None
 
-def search_naver_blog(query):
-    """네이버 블로그 검색"""
-    encText = urllib.parse.quote(query)
-    url = f"https://openapi.naver.com/v1/search/blog?query={encText}&display={DISPLAY_COUNT}&sort={SORT_MODE}"
+# 네이버 검색 API 페이지네이션 한도
+NAVER_API_MAX_START = 1000
+
+def search_naver_blog(query, start=1):
+    """네이버 블로그 검색 (start: 검색 시작 위치, 1부터)"""
+    naver_api_limiter.acquire()
     
-    request = urllib.request.Request(url)
-    request.add_header("X-Naver-Client-Id", NAVER_CLIENT_ID)
-    request.add_header("X-Naver-Client-Secret", NAVER_CLIENT_SECRET)
+    url = "https://openapi.naver.com/v1/search/blog"
+    params = {"query": query, "display": DISPLAY_COUNT, "start": start, "sort": SORT_MODE}
+    headers = {
+        "X-Naver-Client-Id": NAVER_CLIENT_ID,
+        "X-Naver-Client-Secret": NAVER_CLIENT_SECRET
+    }
     
     try:
-        response = urllib.request.urlopen(request)
-        if response.getcode() == 200:
-            return json.loads(response.read().decode('utf-8'))
+        with metrics.timer("naver.search"):
+            response = http_client.get(url, params=params, headers=headers)
+        metrics.count("naver.bytes", len(response.content))
+        response.raise_for_status()
+        return response.json()
     except Exception as e:
+        metrics.count("naver.errors")
         print(f"   ❌ API 오류: {e}")
     return None
 
-def main():
+def iter_naver_blog_pages(query, first_page=None, known_links=None, max_pages=None, stop_at=None):
+    """
+    블로그 검색 결과를 페이지 단위로 스트리밍 (start 파라미터 순회)
+    
+    현재 페이지를 yield하는 동안 다음 페이지를 백그라운드에서 미리 요청하므로
+    호출 측의 필터링/AI 분석과 다음 페이지 네트워크 대기가 겹쳐서 진행됨
+    
+    Args:
+        query: 검색 키워드
+        first_page: 이미 받아둔 1페이지 결과 (없으면 직접 요청)
+        known_links: 이미 수집된 링크 집합 (새 글 판별용)
+        max_pages: 키워드당 최대 페이지 수 (기본값 NAVER_MAX_PAGES)
+        stop_at: 이전 실행에서 이미 본 item이면 True인 함수 (최신순 검색일 때, 그 item 앞까지만 반환)
+    
+    Yields:
+        list: 페이지별 검색 결과 item 리스트
+    
+    종료 조건:
+        - 페이지 예산 소진 / API start 한도 도달 / 전체 결과 소진
+        - 페이지에 새 링크가 하나도 없음 (이전 페이지 또는 known_links와 모두 중복)
+        - stop_at에 해당하는 item 도달 (다음 페이지는 요청하지 않음)
+    """
+    max_pages = max_pages or NAVER_MAX_PAGES
+    known_links = known_links if known_links is not None else set()
+    seen_links = set()
+    
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        start = 1
+        page = first_page if first_page is not None else search_naver_blog(query, start)
+        
+        for page_no in range(1, max_pages + 1):
+            if not page or not page.get('items'):
+                return
+            
+            items = page['items']
+            total = page.get('total', 0)
+            next_start = start + len(items)
+            has_next = (
+                page_no < max_pages
+                and len(items) >= DISPLAY_COUNT
+                and next_start <= min(total, NAVER_API_MAX_START)
+            )
+            
+            if stop_at:
+                seen_at = next((i for i, item in enumerate(items) if stop_at(item)), None)
+                if seen_at is not None:
+                    print(f"   ⏹️ {page_no}페이지 {seen_at + 1}번째부터 이전 실행에서 본 글, 페이지 탐색 중단")
+                    if seen_at:
+                        yield items[:seen_at]
+                    return
+            
+            # 다음 페이지 미리 요청 (현재 페이지 처리와 병렬 진행)
+            future = prefetcher.submit(search_naver_blog, query, next_start) if has_next else None
+            
+            new_links = {item['link'] for item in items} - seen_links
+            seen_links.update(new_links)
+            if page_no > 1 and not (new_links - known_links):
+                print(f"   ⏹️ {page_no}페이지에 새 글 없음, 페이지 탐색 중단")
+                if future:
+                    future.cancel()
+                return
+            
+            yield items
+            
+            if not future:
+                return
+            start = next_start
+            page = future.result()
+
+
+def iter_naver_blog_results(keywords):
+    """
+    여러 키워드의 블로그 검색을 동시에 실행하고 키워드 순서대로 결과 반환
+    
+    - 최대 NAVER_SEARCH_CONCURRENCY개 요청을 동시에 진행
+    - 초당 호출 수는 naver_api_limiter로 전체 공유
+    - 앞 키워드 결과가 도착하는 즉시 처리 가능 (뒤 키워드는 계속 검색 중)
+    - 2페이지 이후는 iter_naver_blog_pages(first_page=...)로 이어서 순회
+    
+    Yields:
+        tuple: (keyword, 1페이지 검색 결과 dict 또는 None)
+    """
+    workers = max(1, min(NAVER_SEARCH_CONCURRENCY, len(keywords)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # executor.map은 입력 순서대로 결과를 반환 → 시트 출력 순서 고정
+        for keyword, result in zip(keywords, executor.map(search_naver_blog, keywords)):
+            yield keyword, result
+
+def send_run_report(blog_rows, cafe_rows, total_count, blog_total, cafe_total, run_summary):
+    """
+    텔레그램 수집 보고 + 일일 전문가 분석 리포트 발송
+    
+    Args:
+        blog_rows: 이번 실행에서 추가한 블로그 행
+        cafe_rows: 이번 실행에서 추가한 카페 행
+        total_count: 시트에 저장한 행 수
+        blog_total: 블로그 누적 글 수 (기존 + 신규)
+        cafe_total: 카페 누적 글 수 (기존 + 신규)
+        run_summary: 보고 마지막 줄 (실행 지표 요약)
+    """
+    blog_new_count = len(blog_rows)
+    cafe_new_count = len(cafe_rows)
+    
+    # 제목 30자 자르기 함수
+    def truncate_title(title, max_len=30):
+        return title[:max_len] + "..." if len(title) > max_len else title
+    
+    msg = f"오늘 총 {total_count}개의 글이 수집되었습니다!\n\n"
+    msg += f"블로그 : +{blog_new_count}/{blog_total}\n"
+    msg += f"카페 : +{cafe_new_count}/{cafe_total}\n\n"
+    
+    # 블로그 목록 (최대 5개)
+    if blog_rows:
+        msg += "【블로그】\n"
+        for row in blog_rows[:5]:
+            keyword = row[1]  # B열: 키워드
+            title = row[2]    # C열: 제목
+            msg += f" - [{keyword}] {truncate_title(title)}\n"
+        if len(blog_rows) > 5:
+            msg += f" ... 외 {len(blog_rows) - 5}개\n"
+        msg += "\n"
+    
+    # 카페 목록 (최대 5개)
+    if cafe_rows:
+        msg += "【카페】\n"
+        for row in cafe_rows[:5]:
+            keyword = row[1]  # B열: 키워드
+            title = row[3]    # D열: 제목
+            msg += f" - [{keyword}] {truncate_title(title)}\n"
+        if len(cafe_rows) > 5:
+            msg += f" ... 외 {len(cafe_rows) - 5}개\n"
+        msg += "\n"
+    
+    msg += f"👉 {GOOGLE_SHEET_URL}\n\n"
+    msg += run_summary
+    send_telegram_message(msg)
+    
+    # --- 추가: 일일 통합 분석 (전문가 모드) ---
+    if ENABLE_AI_ANALYSIS:
+        print("🧠 일일 전문가 분석 리포트 생성 중...")
+        try:
+            summary_report = analyze_daily_summary(blog_rows, cafe_rows)
+            if summary_report:
+                send_telegram_message(summary_report, disable_notification=True)
+                print("✅ 전문가 분석 리포트 발송 완료 (무음)")
+        except Exception as e:
+            print(f"❌ 전문가 분석 리포트 발송 실패: {e}")
+
+def merge_shards(count):
+    """
+    샤드 결과 병합 (--merge N)
+    
+    - 여러 키워드에 걸린 같은 글(샤드 간 중복)과 샤드 실행 이후 시트에 추가된 글 제외
+    - 시트 저장 → 텔레그램 보고 → 수집 기준점 갱신을 한 번씩
+    - 모든 샤드가 성공하고 시트 저장까지 끝나면 샤드 결과 파일 삭제 (실패 시 남겨두고 --merge 다시 실행 가능)
+    
+    Returns:
+        bool: 모든 샤드 결과가 빠짐없이 저장되었는지
+    """
+    print(f"🧩 샤드 결과 병합 시작 (샤드 {count}개)")
+    results, missing = load_shard_results(SHARD_DIR, count, max_age_seconds=SHARD_MAX_AGE_HOURS * 3600)
+    if missing:
+        print(f"   ⚠️ 결과가 없는 샤드: {missing}")
+    failed = [result["shard"][0] for result in results if not result.get("ok")]
+    if failed:
+        print(f"   ⚠️ 일부 단계가 실패한 샤드: {failed} (해당 샤드를 --resume으로 이어서 실행 후 다시 병합 가능)")
+    if not results:
+        print("❌ 병합할 샤드 결과가 없습니다. 프로그램을 종료합니다.")
+        sys.exit(1)
+    
+    with metrics.timer("sheet.init"):
+        blog_sheet, cafe_sheet, spreadsheet = init_google_sheets()
+    if not blog_sheet:
+        print("❌ 시트 연결 실패로 프로그램을 종료합니다.")
+        sys.exit(1)
+    
+    keywords = results[0]["keywords"]
+    # 수집일시는 가장 먼저 시작한 샤드 기준으로 통일
+    today_str = min(result["today"] for result in results)
+    
+    blog_rows, blog_duplicates = merge_rows(
+        [result["blog_rows"] for result in results], keywords, 1, lambda row: normalize_cafe_url(row[4])
+    )
+    cafe_rows, cafe_duplicates = merge_rows(
+        [result["cafe_rows"] for result in results], keywords, 1, lambda row: make_cafe_key(row[3], row[4])
+    )
+    
+    # 샤드 실행 이후 (다른 실행에서) 시트에 추가된 글 제외
+    existing_blog_links = get_existing_links(blog_sheet, 4)
+    existing_cafe_keys = get_existing_cafe_keys(cafe_sheet)
+    recent_cafe_links = get_recent_cafe_links(cafe_sheet)
+    blog_rows = [row for row in blog_rows if normalize_cafe_url(row[4]) not in existing_blog_links]
+    cafe_rows = [
+        row for row in cafe_rows
+        if (row[3].strip(), row[4].strip()) not in existing_cafe_keys
+        and (row[3].strip(), normalize_cafe_url(row[5])) not in recent_cafe_links
+    ]
+    
+    # 샤드끼리 겹친 유사글 제외 (각 샤드는 자기 실행 중의 글과 이전 실행의 지문만 비교했음)
+    fingerprints = {
+        link: (fingerprint, source)
+        for result in results for link, fingerprint, source in result.get("fingerprints", [])
+    }
+    blog_rows, blog_near_dups = drop_near_duplicate_rows(blog_rows, lambda row: row[4], fingerprints)
+    cafe_rows, cafe_near_dups = drop_near_duplicate_rows(
+        cafe_rows, lambda row: normalize_cafe_url(row[5]), fingerprints
+    )
+    for row in blog_rows + cafe_rows:
+        row[0] = today_str
+    print(f"   📋 블로그 {len(blog_rows)}건 (샤드 간 중복 {blog_duplicates}건, 유사글 {blog_near_dups}건) / "
+          f"카페 {len(cafe_rows)}건 (샤드 간 중복 {cafe_duplicates}건, 유사글 {cafe_near_dups}건)")
+    
+    # 병합 전용 저널 (일반 실행의 --resume 저널을 덮어쓰지 않음)
+    journal = open_run_journal(False, today_str, path=os.path.join(SHARD_DIR, f"merge_journal_{count}.jsonl"))
+    blog_sink = open_sheet_sink(
+        blog_sheet, journal, "blog", "link", lambda row: normalize_cafe_url(row[4]), lambda row: row[4],
+        value_input_option='RAW', name="블로그"
+    )
+    cafe_sink = open_sheet_sink(
+        cafe_sheet, journal, "cafe", "cafe_key", lambda row: make_cafe_key(row[3], row[4]),
+        lambda row: normalize_cafe_url(row[5]),
+        value_input_option='USER_ENTERED', name="카페"
+    )
+    for row in blog_rows:
+        journal.record_row("blog", row[4], row)
+        blog_sink.append(row)
+    for row in cafe_rows:
+        journal.record_row("cafe", make_cafe_key(row[3], row[4]), row)
+        cafe_sink.append(row)
+    
+    saved_ok = True
+    for sink in (blog_sink, cafe_sink):
+        if sink.close():
+            if sink.written:
+                print(f"✅ {sink.name} {sink.written}건 저장 완료!")
+        else:
+            print(f"❌ {sink.name} 저장 실패: {sink.pending}건 미저장 ({sink.error})")
+            saved_ok = False
+    
+    total_count = journal.flushed.get("blog", 0) + journal.flushed.get("cafe", 0)
+    print(f"\n🎉 총 {total_count}건 저장 완료!")
+    
+    if total_count > 0:
+        wall = max(result.get("wall_s", 0) for result in results)
+        tokens = sum(result.get("ai_tokens", 0) for result in results)
+        run_summary = f"🧩 샤드 {len(results)}/{count}개 | ⏱️ 최장 {int(wall // 60)}분 {int(wall % 60)}초"
+        if tokens:
+            run_summary += f" | 토큰 {tokens / 1000:.1f}k"
+        cafe_total = len(existing_cafe_keys) + len(cafe_rows) if ENABLE_CAFE_CRAWLING else 0
+        send_run_report(
+            blog_rows, cafe_rows, total_count, len(existing_blog_links) + len(blog_rows), cafe_total, run_summary
+        )
+    else:
+        print("신규 데이터 없음")
+    
+    run_ok = saved_ok and not missing and not failed
+    if saved_ok:
+        journal.complete()
+        # 성공한 샤드의 기준점만 반영 (실패한 샤드의 키워드는 다음 실행에서 다시 수집)
+        watermarks = get_watermarks()
+        if watermarks:
+            try:
+                for result in results:
+                    if result.get("ok"):
+                        watermarks.import_pending(result.get("watermarks", []))
+                saved = watermarks.commit()
+                print(f"🔖 수집 기준점 갱신: 키워드 {saved}개")
+            except Exception as e:
+                print(f"⚠️ 수집 기준점 저장 실패: {e}")
+    else:
+        journal.close()
+    
+    if run_ok:
+        remove_shard_results(SHARD_DIR, count)
+    else:
+        print(f"\n⚠️ 샤드 결과 파일을 남겨둡니다 ({SHARD_DIR}). 빠진 샤드를 다시 실행한 뒤 --merge {count}로 병합할 수 있습니다.")
+    
+    try:
+        metrics_path = metrics.save(
+            os.path.join(STATE_DIR, "metrics"),
+            extra={
+                "saved": {"blog": journal.flushed.get("blog", 0), "cafe": journal.flushed.get("cafe", 0)},
+                "shards": {"count": count, "merged": len(results), "missing": missing, "failed": failed},
+            }
+        )
+        print(f"📈 실행 지표: {metrics.format_summary()} (상세: {metrics_path})")
+    except Exception as e:
+        print(f"⚠️ 실행 지표 저장 실패: {e}")
+    return run_ok
+
+def run_workers(count, resume=False):
+    """
+    로컬에서 샤드 N개를 별도 프로세스로 동시에 실행한 뒤 병합 (--workers N)
+    
+    Args:
+        count: 샤드 수 N
+        resume: True면 이미 성공한 샤드는 건너뛰고 나머지만 --resume으로 실행
+    
+    Returns:
+        bool: 병합까지 모두 성공했는지
+    """
+    indexes = list(range(1, count + 1))
+    if resume:
+        results, _ = load_shard_results(SHARD_DIR, count, max_age_seconds=SHARD_MAX_AGE_HOURS * 3600)
+        done = {result["shard"][0] for result in results if result.get("ok")}
+        if done:
+            print(f"♻️ 이미 완료된 샤드 건너뜀: {sorted(done)}")
+        indexes = [index for index in indexes if index not in done]
+    else:
+        # 이전 실행에서 남은 결과가 섞이지 않도록 정리
+        remove_shard_results(SHARD_DIR, count)
+    
+    if indexes:
+        print(f"🧩 샤드 {len(indexes)}개 동시 실행: {indexes}")
+        started = time.monotonic()
+        codes = run_shard_processes(os.path.abspath(__file__), count, indexes, ["--resume"] if resume else [])
+        crashed = [index for index, code in codes.items() if code != 0]
+        print(f"\n🧩 샤드 실행 완료 ({time.monotonic() - started:.0f}초)"
+              + (f", 비정상 종료: {crashed}" if crashed else ""))
+    return merge_shards(count)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Viral Scout: 네이버 블로그/카페 수집")
+    parser.add_argument("--resume", action="store_true",
+                        help="직전 실행이 중간에 실패한 경우 완료된 키워드/분석된 글은 건너뛰고 이어서 실행")
+    mode_group = parser.add_mutually_exclusive_group()
+    mode_group.add_argument("--record", metavar="NAME",
+                            help="네이버/AI/카페 응답을 카세트로 녹화 (시트·텔레그램에는 쓰지 않음)")
+    mode_group.add_argument("--replay", metavar="NAME",
+                            help="녹화한 카세트로 네트워크 없이 실행")
+    mode_group.add_argument("--shard", metavar="i/N", type=parse_shard,
+                            help="키워드를 N개로 나눈 i번째 조각만 수집 (결과는 샤드 파일로, 시트·텔레그램은 --merge에서)")
+    mode_group.add_argument("--merge", metavar="N", type=int,
+                            help="N개 샤드 결과를 합쳐 중복 제거 후 시트·텔레그램에 한 번 기록")
+    mode_group.add_argument("--workers", metavar="N", type=int,
+                            help="N개 샤드 프로세스를 동시에 실행한 뒤 병합")
+    args = parser.parse_args(argv)
+    if args.resume and (args.record or args.replay or args.merge):
+        parser.error("--resume은 --record/--replay/--merge와 함께 쓸 수 없습니다.")
+    if (args.merge is not None and args.merge < 1) or (args.workers is not None and args.workers < 1):
+        parser.error("샤드 수는 1 이상이어야 합니다.")
+    
+    if args.workers:
+        return run_workers(args.workers, args.resume)
+    if args.merge:
+        return merge_shards(args.merge)
+    
+    shard = args.shard
+    if shard:
+        configure_shard(*shard)
+    
     print("🚀 Viral Scout: Naver & Google Sheet Scanning Started...")
     
     # API 키 체크
@@ -634,28 +1236,185 @@ def main():
         elif AI_PROVIDER == "openai":
             print(f"✅ AI Provider: OpenAI" + (" (API 키 확인됨)" if OPENAI_API_KEY else " ⚠️ API 키 없음"))
     
-    blog_sheet, cafe_sheet, spreadsheet = init_google_sheets()
-    if not blog_sheet:
-        print("❌ 시트 연결 실패로 프로그램을 종료합니다.")
-        sys.exit(1)  # GitHub Actions에서 실패로 처리되도록 Exit Code 1 반환
+    cassette, original_adapters = open_cassette(args.record, args.replay)
+    cassette_meta = cassette.load_meta() if cassette and cassette.replaying else {}
+    
+    if cassette:
+        # 녹화/재생 결과는 빈 메모리 시트에 저장 (녹화 시 실제 시트에서는 키워드만 읽음)
+        blog_sheet = OfflineSheet(1, BLOG_SHEET_NAME)
+        cafe_sheet = OfflineSheet(2, CAFE_SHEET_NAME)
+        spreadsheet = None if cassette.replaying else init_google_sheets()[2]
+    else:
+        with metrics.timer("sheet.init"):
+            blog_sheet, cafe_sheet, spreadsheet = init_google_sheets()
+        if not blog_sheet:
+            print("❌ 시트 연결 실패로 프로그램을 종료합니다.")
+            sys.exit(1)  # GitHub Actions에서 실패로 처리되도록 Exit Code 1 반환
 
-    print("✅ 시트 연결 성공!")
+        print("✅ 시트 연결 성공!")
 
-    # [검색설정] 탭에서 키워드 로드 (없으면 config.py 기본값)
-    search_keywords = load_keywords_from_sheet(spreadsheet) or SEARCH_KEYWORDS
+    # [검색설정] 탭에서 키워드 로드 (없으면 config.py 기본값, 재생 시 녹화 당시 키워드)
+    search_keywords = cassette_meta.get("keywords") or load_keywords_from_sheet(spreadsheet) or SEARCH_KEYWORDS
     
     if not search_keywords:
         print("❌ 검색 키워드가 없습니다. 프로그램을 종료합니다.")
         sys.exit(1)
         
     print(f"🔎 검색 키워드: {search_keywords}")
+    
+    all_keywords = search_keywords
+    if shard:
+        search_keywords = shard_keywords(search_keywords, *shard)
+        print(f"🧩 샤드 {shard[0]}/{shard[1]} 키워드 {len(search_keywords)}개: {search_keywords}")
 
     # KST (UTC+9) 설정
     kst = datetime.timezone(datetime.timedelta(hours=9))
-    today_str = datetime.datetime.now(kst).strftime("%Y-%m-%d %H:%M:%S")
-    blog_rows = []  # 블로그 데이터
-    cafe_rows = []  # 카페 데이터
+    today_str = cassette_meta.get("today") or datetime.datetime.now(kst).strftime("%Y-%m-%d %H:%M:%S")
+    if cassette and not cassette.replaying:
+        cassette.save_meta(keywords=search_keywords, today=today_str)
+    
+    # 녹화/재생은 단일 워커 + 가득 찬 배치로 처리 (배치 구성이 매번 같아야 AI 요청이 녹화본과 일치)
+    if cassette:
+        filter_workers, ai_workers, batch_wait = 1, 1, None
+    else:
+        filter_workers, ai_workers, batch_wait = PIPELINE_FILTER_WORKERS, PIPELINE_AI_WORKERS, 0.5
+    
+    # 분석 결과를 즉시 로컬에 기록 (실패 시 --resume으로 이어서 실행)
+    journal = open_run_journal(args.resume, today_str)
+    today_str = journal.today or today_str
+    run_ok = True  # 중간 실패가 있으면 저널을 완료 처리하지 않음
+    
+    blog_rows = list(journal.rows.get("blog", []))  # 블로그 데이터 (재개 시 이전 분석분 포함)
+    cafe_rows = list(journal.rows.get("cafe", []))  # 카페 데이터
+    resumed_flushed = dict(journal.flushed)  # 재개 전에 이미 시트에 저장된 행 수 (기존 글 수에 포함됨)
     briefing_lines = []
+    
+    # 분석된 행은 백그라운드에서 N행/T초마다 시트에 바로 저장 (샤드 실행은 병합 단계에서 한 번에)
+    if shard:
+        blog_sink, cafe_sink = NullSink("블로그"), NullSink("카페")
+    else:
+        blog_sink = open_sheet_sink(
+            blog_sheet, journal, "blog", "link", lambda row: normalize_cafe_url(row[4]), lambda row: row[4],
+            value_input_option='RAW', name="블로그",
+            existing_keys_fn=lambda: get_existing_links(blog_sheet, 4)
+        )
+        # USER_ENTERED로 변경하여 IMAGE 함수가 작동하도록 함
+        cafe_sink = open_sheet_sink(
+            cafe_sheet, journal, "cafe", "cafe_key", lambda row: make_cafe_key(row[3], row[4]),
+            lambda row: normalize_cafe_url(row[5]),
+            value_input_option='USER_ENTERED', name="카페",
+            existing_keys_fn=lambda: {make_cafe_key(*key) for key in get_existing_cafe_keys(cafe_sheet)}
+        )
+
+    # ---- 블로그 파이프라인 단계: 검색(소스) → 필터 → AI 분석 → 행 추가(싱크) ----
+    blog_keyword_counts = {}
+    
+    def blog_source():
+        """키워드별 검색 결과 항목 (1페이지부터, 다음 페이지는 백그라운드로 미리 요청)"""
+        nonlocal run_ok
+        for keyword, result in iter_naver_blog_results(blog_keywords):
+            print(f"\n🔎 검색어: '{keyword}'")
+            
+            if result and 'items' in result:
+                seen_items = []
+                if not result['items']:
+                    print("   (결과 없음)")
+                else:
+                    for items in iter_naver_blog_pages(
+                        keyword, first_page=result, known_links=existing_blog_links,
+                        stop_at=watermark_stop_at("blog", keyword, blog_watermark_entry)
+                    ):
+                        seen_items.extend(items)
+                        for item in items:
+                            yield {"keyword": keyword, "item": item}
+                # 이 키워드의 글이 모두 저장된 뒤에 완료 처리 + 기준점 갱신
+                yield Checkpoint(("blog", keyword, [blog_watermark_entry(item) for item in seen_items], []))
+            else:
+                print("   (API 실패)")
+                run_ok = False
+    
+    def filter_blog_item(entry):
+        """중복/블랙리스트/필수키워드 필터 (통과 못하면 None)"""
+        item = entry['item']
+        title = item['title'].replace('<b>', '').replace('</b>', '').replace('&quot;', '"')
+        link = item['link']
+        postdate = format_date(item['postdate'])
+        description = item.get('description', '').replace('<b>', '').replace('</b>', '').replace('&quot;', '"')
+        
+        # 중복 체크 (재개 시 이전 실행에서 분석한 글 포함)
+        if link in existing_blog_links or journal.has_key("blog", link):
+            return None
+        
+        if is_blacklisted(title):
+            print(f"   🚫 제외(블랙리스트): {title[:40]}")
+            return None
+        
+        if not has_required_keyword(title):
+            print(f"   🚫 제외(필수키워드): {title[:40]}")
+            return None
+        
+        # 다른 블로그/카페에 이미 수집된 거의 같은 글이면 AI 분석 전에 제외
+        original = find_near_duplicate(title + " " + description, link, "blog")
+        if original:
+            print(f"   🔁 제외(유사글): {title[:40]} ≈ {original}")
+            return None
+        
+        # description을 본문으로 사용 (150자 미리보기, 크롤링보다 안정적)
+        return {
+            "keyword": entry['keyword'],
+            "title": title,
+            "content": description,
+            "link": link,
+            "postdate": postdate
+        }
+    
+    def analyze_blog_batch(posts):
+        """필터를 통과한 블로그 글을 배치로 AI 분석"""
+        print(f"   🧠 AI 분석 ({len(posts)}건 배치)...")
+        for i, post in enumerate(posts, 1):
+            post['id'] = str(i)
+        analyses = analyze_contents_batch(posts)
+        return [(post, analyses[post['id']]) for post in posts]
+    
+    def add_blog_row(result):
+        """분석 결과를 행으로 만들어 저널/시트 버퍼에 추가 (입력 순서대로 호출됨)"""
+        if isinstance(result, Checkpoint):
+            complete_keyword(journal, result)
+            return
+        
+        post, analysis = result
+        keyword = post['keyword']
+        title = post['title']
+        content = post['content']
+        
+        # AI가 반려동물 관련 없다고 판단하면 제외
+        if not analysis.get("반려동물관련", True):
+            print(f"   🚫 제외(AI판단): {title[:40]}")
+            journal.record_row("blog", post['link'], None)
+            discard_near_duplicate(post['link'])
+            return
+
+        # 블로그 데이터 (변경: F=요약, G=키워드, H=브랜드언급)
+        # 헤더: 수집일시, 키워드, 제목, 날짜, 링크, 요약, 주요내용(키워드), 브랜드언급
+        keywords_str = extract_keywords_hybrid(title, content)
+        
+        row_data = [
+            today_str, keyword, title, post['postdate'], post['link'],
+            analysis.get("요약", ""),
+            keywords_str,  # 주요내용 -> 키워드 대체
+            analysis.get("브랜드언급", "")
+        ]
+        
+        blog_rows.append(row_data)
+        journal.record_row("blog", post['link'], row_data)
+        blog_sink.append(row_data)
+        print(f"   ✅ 준비: {title[:40]}")
+        if analysis.get("요약"):
+            print(f"      💡 {analysis['요약'][:50]}...")
+        
+        blog_keyword_counts[keyword] = blog_keyword_counts.get(keyword, 0) + 1
+        if blog_keyword_counts[keyword] <= 2:
+            briefing_lines.append(f"- [{keyword}] {title}")
 
     # Phase 2: 블로그 검색 (활성화)
     # 중복 체크를 위해 기존 링크 로드 (E열=링크, 인덱스 4)
@@ -663,243 +1422,282 @@ def main():
     print(f"\n📝 Phase 2: 블로그 검색 시작...")
     print(f"   📋 기존 블로그 글: {len(existing_blog_links)}건")
     
-    for keyword in search_keywords:
-        print(f"\n🔎 검색어: '{keyword}'")
-        result = search_naver_blog(keyword)
-        
-        keyword_count = 0
-        if result and 'items' in result:
-            items = result['items']
-            if not items:
-                print("   (결과 없음)")
-                continue
-
-            for item in items:
-                title = item['title'].replace('<b>', '').replace('</b>', '').replace('&quot;', '"')
-                link = item['link']
-                postdate = format_date(item['postdate'])
-                description = item.get('description', '').replace('<b>', '').replace('</b>', '').replace('&quot;', '"')
-                
-                # 중복 체크
-                if link in existing_blog_links:
-                    continue
-                
-                if is_blacklisted(title):
-                    print(f"   🚫 제외(블랙리스트): {title[:40]}")
-                    continue
-                
-                if not has_required_keyword(title):
-                    print(f"   🚫 제외(필수키워드): {title[:40]}")
-                    continue
-                
-                # description을 본문으로 사용 (150자 미리보기, 크롤링보다 안정적)
-                content = description
-                
-                print(f"   🧠 AI 분석 ({len(content)}자)...")
-                analysis = analyze_content_with_ai(title, content)
-                
-                # AI가 반려동물 관련 없다고 판단하면 제외
-                if not analysis.get("반려동물관련", True):
-                    print(f"   🚫 제외(AI판단): {title[:40]}")
-                    continue
-
-                # 블로그 데이터 (변경: F=요약, G=키워드, H=브랜드언급)
-                # 헤더: 수집일시, 키워드, 제목, 날짜, 링크, 요약, 주요내용(키워드), 브랜드언급
-                keywords_str = extract_keywords_hybrid(title, content)
-                
-                row_data = [
-                    today_str, keyword, title, postdate, link,
-                    analysis.get("요약", ""),
-                    keywords_str,  # 주요내용 -> 키워드 대체
-                    analysis.get("브랜드언급", "")
-                ]
-                
-                blog_rows.append(row_data)
-                print(f"   ✅ 준비: {title[:40]}")
-                if analysis.get("요약"):
-                    print(f"      💡 {analysis['요약'][:50]}...")
-                
-                keyword_count += 1
-                if keyword_count <= 2:
-                    briefing_lines.append(f"- [{keyword}] {title}")
-                
-                time.sleep(0.5)
-
-        else:
-            print("   (API 실패)")
-        
-        time.sleep(1)
+    blog_keywords = [k for k in search_keywords if not journal.is_keyword_done("blog", k)]
+    if len(blog_keywords) < len(search_keywords):
+        print(f"   ♻️ 완료된 키워드 {len(search_keywords) - len(blog_keywords)}개 건너뜀")
+    
+    blog_pipeline = Pipeline(
+        [
+            Stage("필터", filter_blog_item, workers=filter_workers),
+            Stage("AI", analyze_blog_batch, workers=ai_workers, batch_size=AI_BATCH_SIZE, batch_wait=batch_wait),
+        ],
+        sink=add_blog_row, queue_size=PIPELINE_QUEUE_SIZE, name="블로그"
+    )
+    with metrics.timer("phase.blog"):
+        blog_pipeline.run(blog_source())
+    print(f"\n   📊 블로그 단계별 시간: {blog_pipeline.format_stats()}")
+    if blog_pipeline.failed:
+        print(f"   ⚠️ 블로그 처리 실패 {blog_pipeline.failed}건 (다음 실행에서 다시 수집)")
+        run_ok = False
     
     # Phase 3: 카페 크롤링
     if ENABLE_CAFE_CRAWLING:
+        cafe_session = None
         try:
-            from cafe_scanner import search_cafe_posts
+            from cafe_scanner import search_cafe_posts, CafeCrawlerSession
             
             print(f"\n\n🏢 Phase 3: 카페 검색 시작...")
             cafe_briefing = []
             
             # 중복 체크를 위해 기존 글 키(제목+날짜) 로드
             existing_cafe_keys = get_existing_cafe_keys(cafe_sheet)
+            recent_cafe_links = get_recent_cafe_links(cafe_sheet)
             print(f"   📋 기존 카페 글: {len(existing_cafe_keys)}건 (제목+날짜 기준)")
             
-            for keyword in search_keywords:
-                print(f"\n🔍 [카페] '{keyword}'")
-                cafe_posts = search_cafe_posts(keyword, max_posts=CAFE_MAX_POSTS)
-                
-                # 중복 제외 (제목+날짜 기준)
-                new_posts = filter_new_cafe_posts(cafe_posts, existing_cafe_keys)
-                
-                for post in new_posts:
-                    # 1. 댓글 수 확인
-                    comment_count = post.get('comment_count', 0)
-                    is_question = is_genuine_question(post['title'], post['content'])
-                    
-                    # 댓글 0개인 글은 질문형태가 아니면 제외
-                    if comment_count == 0 and not is_question:
-                        print(f"   🚫 댓글없음(비질문): {post['title'][:40]}")
-                        continue
-                    
-                    # 2. 협찬 필터링 (선택)
-                    if FILTER_SPONSORED:
-                        if detect_sponsored_content(post['title'], post['content']):
-                            print(f"   🚫 협찬글 제외: {post['title'][:40]}")
-                            continue
-                    
-                    # 3. AI 요약
-                    print(f"   🧠 AI 요약 중...")
-                    from content_filters import analyze_cafe_content
-                    ai_analysis = analyze_cafe_content(post['title'], post['content'])
-                    
-                    # AI가 반려동물 관련 없다고 판단하면 제외
-                    if not ai_analysis.get("반려동물관련", True):
-                        print(f"   🚫 제외(AI판단): {post['title'][:40]}")
+            # 브라우저는 카페 단계 전체에서 한 번만 실행
+            cafe_session = CafeCrawlerSession(cassette=cassette, registry=get_cafe_registry()).start()
+            
+            # ---- 카페 파이프라인 단계: 크롤링(소스) → 필터 → AI 요약 → 행 추가(싱크) ----
+            def cafe_source():
+                """키워드별 새 카페 글 (Playwright는 호출 스레드에서만 사용)"""
+                for keyword in search_keywords:
+                    if journal.is_keyword_done("cafe", keyword):
+                        print(f"\n♻️ [카페] '{keyword}' 완료된 키워드 건너뜀")
                         continue
                     
-                    # 4. 핵심 키워드 추출 (I열: 지정 키워드만)
-                    keywords_str = extract_keywords_hybrid(post['title'], post['content'])
-                    
-                    # 5. 브랜드 언급 추출 (J열: AI 추출)
-                    brand_mention = ai_analysis.get("브랜드언급", "")
-                    
-                    # 카페 데이터 (이미지 열 제거)
-                    # A: 수집일시, B: 키워드, C: 카페명
-                    # D: 제목, E: 날짜, F: 링크
-                    # G: 본문내용요약 (AI 요약, 100자)
-                    # H: 댓글수
-                    # I: 핵심연관키워드 (지정 키워드에서 매칭)
-                    # J: 브랜드언급 (AI 추출, 보양대첩 우선)
-                    
-                    row_data = [
-                        today_str,                                  # A: 수집일시
-                        keyword,                                    # B: 키워드
-                        post['cafe_name'],                          # C: 카페명
-                        post['title'],                              # D: 제목
-                        post['date'],                               # E: 날짜
-                        post['link'],                               # F: 링크
-                        ai_analysis.get("요약", "")[:100],          # G: 본문내용요약 (100자)
-                        comment_count,                              # H: 댓글수
-                        keywords_str,                               # I: 핵심연관키워드
-                        brand_mention                               # J: 브랜드언급
-                    ]
-                    
-                    cafe_rows.append(row_data)
-                    print(f"   ✅ 준비: {post['title'][:40]}")
-                    if brand_mention:
-                        print(f"      🏆 브랜드 언급: {brand_mention}")
+                    print(f"\n🔍 [카페] '{keyword}'")
+                    failed_cards = []  # 상세 페이지 실패 → 기준점이 이 글을 넘어가지 않게 (다음 실행에서 재시도)
+                    cafe_posts = search_cafe_posts(
+                        keyword, max_posts=CAFE_MAX_POSTS, session=cafe_session,
+                        is_seen=watermark_stop_at("cafe", keyword, cafe_watermark_entry), failed=failed_cards
+                    )
                     
-                    if is_question:
-                        cafe_briefing.append(f"- [질문/{post['cafe_name']}] {post['title'][:40]}")
+                    # 중복 제외 (제목+날짜 기준, 재개 시 이전 실행에서 분석한 글 포함)
+                    for post in filter_new_cafe_posts(cafe_posts, existing_cafe_keys, recent_cafe_links):
+                        if not journal.has_key("cafe", make_cafe_key(post['title'], post['date'])):
+                            post['keyword'] = keyword
+                            yield post
                     
-                    time.sleep(0.5)
+                    yield Checkpoint((
+                        "cafe", keyword,
+                        [cafe_watermark_entry(post) for post in cafe_posts],
+                        [cafe_watermark_entry(card) for card in failed_cards],
+                    ))
+            
+            def filter_cafe_post(post):
+                """댓글/질문/협찬 필터 (통과 못하면 None)"""
+                # 1. 댓글 수 확인
+                comment_count = post.get('comment_count', 0)
+                is_question = is_genuine_question(post['title'], post['content'])
+                
+                # 댓글 0개인 글은 질문형태가 아니면 제외
+                if comment_count == 0 and not is_question:
+                    print(f"   🚫 댓글없음(비질문): {post['title'][:40]}")
+                    return None
+                
+                # 2. 협찬 필터링 (선택)
+                if FILTER_SPONSORED:
+                    if detect_sponsored_content(post['title'], post['content']):
+                        print(f"   🚫 협찬글 제외: {post['title'][:40]}")
+                        return None
                 
-                time.sleep(2)  # 카페 간 delay
+                # 3. 다른 카페/블로그에 퍼나른 글, 살짝 고친 글 제외 (AI 분석 전)
+                original = find_near_duplicate(
+                    post['title'] + " " + post['content'], normalize_cafe_url(post['link']), "cafe"
+                )
+                if original:
+                    print(f"   🔁 유사글 제외: {post['title'][:40]} ≈ {original}")
+                    return None
+                
+                post['is_question'] = is_question
+                return post
+            
+            def analyze_cafe_batch(posts):
+                """4. AI 요약 (필터 통과 글을 AI_BATCH_SIZE개씩 묶어서 요청)"""
+                print(f"   🧠 AI 요약 중... ({len(posts)}건)")
+                for i, post in enumerate(posts, 1):
+                    post['id'] = str(i)
+                analyses = analyze_cafe_contents_batch(posts)
+                return [(post, analyses[post['id']]) for post in posts]
+            
+            def add_cafe_row(result):
+                """분석 결과를 행으로 만들어 저널/시트 버퍼에 추가 (입력 순서대로 호출됨)"""
+                if isinstance(result, Checkpoint):
+                    complete_keyword(journal, result)
+                    return
+                
+                post, ai_analysis = result
+                comment_count = post.get('comment_count', 0)
+                
+                # AI가 반려동물 관련 없다고 판단하면 제외
+                if not ai_analysis.get("반려동물관련", True):
+                    print(f"   🚫 제외(AI판단): {post['title'][:40]}")
+                    journal.record_row("cafe", make_cafe_key(post['title'], post['date']), None)
+                    discard_near_duplicate(normalize_cafe_url(post['link']))
+                    return
+                
+                # 5. 핵심 키워드 추출 (I열: 지정 키워드만)
+                keywords_str = extract_keywords_hybrid(post['title'], post['content'])
+                
+                # 6. 브랜드 언급 추출 (J열: AI 추출)
+                brand_mention = ai_analysis.get("브랜드언급", "")
+                
+                # 카페 데이터 (이미지 열 제거)
+                # A: 수집일시, B: 키워드, C: 카페명
+                # D: 제목, E: 날짜, F: 링크
+                # G: 본문내용요약 (AI 요약, 100자)
+                # H: 댓글수
+                # I: 핵심연관키워드 (지정 키워드에서 매칭)
+                # J: 브랜드언급 (AI 추출, 보양대첩 우선)
+                
+                row_data = [
+                    today_str,                                  # A: 수집일시
+                    post['keyword'],                            # B: 키워드
+                    post['cafe_name'],                          # C: 카페명
+                    post['title'],                              # D: 제목
+                    post['date'],                               # E: 날짜
+                    post['link'],                               # F: 링크
+                    ai_analysis.get("요약", "")[:100],          # G: 본문내용요약 (100자)
+                    comment_count,                              # H: 댓글수
+                    keywords_str,                               # I: 핵심연관키워드
+                    brand_mention                               # J: 브랜드언급
+                ]
+                
+                cafe_rows.append(row_data)
+                journal.record_row("cafe", make_cafe_key(post['title'], post['date']), row_data)
+                cafe_sink.append(row_data)
+                print(f"   ✅ 준비: {post['title'][:40]}")
+                if brand_mention:
+                    print(f"      🏆 브랜드 언급: {brand_mention}")
+                
+                if post['is_question']:
+                    cafe_briefing.append(f"- [질문/{post['cafe_name']}] {post['title'][:40]}")
+            
+            cafe_pipeline = Pipeline(
+                [
+                    Stage("필터", filter_cafe_post, workers=filter_workers),
+                    Stage("AI", analyze_cafe_batch, workers=ai_workers, batch_size=AI_BATCH_SIZE, batch_wait=batch_wait),
+                ],
+                sink=add_cafe_row, queue_size=PIPELINE_QUEUE_SIZE, name="카페"
+            )
+            try:
+                with metrics.timer("phase.cafe"):
+                    cafe_pipeline.run(cafe_source())
+            finally:
+                print(f"\n   📊 카페 단계별 시간: {cafe_pipeline.format_stats()}")
+            if cafe_pipeline.failed:
+                print(f"   ⚠️ 카페 처리 실패 {cafe_pipeline.failed}건 (다음 실행에서 다시 수집)")
+                run_ok = False
             
             if cafe_briefing:
                 briefing_lines.extend(cafe_briefing[:5])
         
         except Exception as e:
             print(f"\n⚠️ 카페 크롤링 실패: {e}")
+            run_ok = False
+        finally:
+            if cafe_session:
+                print(f"\n   📊 카페 로딩 통계: {cafe_session.format_totals()}")
+                if cafe_session.registry is not None:
+                    print(f"   🏷️ 카페 저장소: {cafe_session.registry.format_stats()}")
+                cafe_session.close()
 
-    # 분리 저장
-    total_count = 0
-    
-    # 블로그 데이터 저장
-    if blog_rows:
-        print(f"\n📚 블로그 {len(blog_rows)}건 저장 중...")
-        try:
-            blog_sheet.append_rows(blog_rows, value_input_option='RAW')
-            print(f"✅ 블로그 {len(blog_rows)}건 저장 완료!")
-            total_count += len(blog_rows)
-        except Exception as e:
-            print(f"❌ 블로그 배치 실패: {e}")
+    # 남은 버퍼 저장 후 종료 (재개 시 이전 실행에서 이미 저장된 행은 제외됨)
+    for sink in (blog_sink, cafe_sink):
+        if sink.close():
+            if sink.written:
+                print(f"✅ {sink.name} {sink.written}건 저장 완료!")
+        else:
+            print(f"❌ {sink.name} 저장 실패: {sink.pending}건 미저장 ({sink.error})")
+            run_ok = False
     
-    # 카페 데이터 저장
-    if cafe_rows:
-        print(f"\n🏪 카페 {len(cafe_rows)}건 저장 중...")
-        try:
-            # USER_ENTERED로 변경하여 IMAGE 함수가 작동하도록 함
-            cafe_sheet.append_rows(cafe_rows, value_input_option='USER_ENTERED')
-            print(f"✅ 카페 {len(cafe_rows)}건 저장 완료!")
-            total_count += len(cafe_rows)
-        except Exception as e:
-            print(f"❌ 카페 배치 실패: {e}")
-    print(f"\n🎉 총 {total_count}건 저장 완료!")
+    total_count = journal.flushed.get("blog", 0) + journal.flushed.get("cafe", 0)
+    if not shard:
+        print(f"\n🎉 총 {total_count}건 저장 완료!")
     
     # 텔레그램 보고 메시지 생성
     blog_new_count = len(blog_rows)
     cafe_new_count = len(cafe_rows)
     
-    # 누적 개수 계산 (기존 + 신규)
-    blog_total = len(existing_blog_links) + blog_new_count
-    cafe_total = len(existing_cafe_keys) + cafe_new_count if ENABLE_CAFE_CRAWLING else 0
+    # 누적 개수 계산 (기존 + 신규, 재개 전에 저장된 행은 기존 글에 이미 포함)
+    blog_total = len(existing_blog_links) + blog_new_count - resumed_flushed.get("blog", 0)
+    cafe_total = (
+        len(existing_cafe_keys) + cafe_new_count - resumed_flushed.get("cafe", 0) if ENABLE_CAFE_CRAWLING else 0
+    )
     
-    if total_count > 0:
-        # 제목 30자 자르기 함수
-        def truncate_title(title, max_len=30):
-            return title[:max_len] + "..." if len(title) > max_len else title
-        
-        msg = f"오늘 총 {total_count}개의 글이 수집되었습니다!\n\n"
-        msg += f"블로그 : +{blog_new_count}/{blog_total}\n"
-        msg += f"카페 : +{cafe_new_count}/{cafe_total}\n\n"
-        
-        # 블로그 목록 (최대 5개)
-        if blog_rows:
-            msg += "【블로그】\n"
-            for row in blog_rows[:5]:
-                keyword = row[1]  # B열: 키워드
-                title = row[2]    # C열: 제목
-                msg += f" - [{keyword}] {truncate_title(title)}\n"
-            if len(blog_rows) > 5:
-                msg += f" ... 외 {len(blog_rows) - 5}개\n"
-            msg += "\n"
-        
-        # 카페 목록 (최대 5개)
-        if cafe_rows:
-            msg += "【카페】\n"
-            for row in cafe_rows[:5]:
-                keyword = row[1]  # B열: 키워드
-                title = row[3]    # D열: 제목
-                msg += f" - [{keyword}] {truncate_title(title)}\n"
-            if len(cafe_rows) > 5:
-                msg += f" ... 외 {len(cafe_rows) - 5}개\n"
-            msg += "\n"
-        
-        msg += f"👉 {GOOGLE_SHEET_URL}"
-        send_telegram_message(msg)
-        
-        # --- 추가: 일일 통합 분석 (전문가 모드) ---
-        if ENABLE_AI_ANALYSIS:
-            print("🧠 일일 전문가 분석 리포트 생성 중...")
+    if shard:
+        # 시트/텔레그램 대신 샤드 결과 파일 (기준점도 병합 단계에서 시트 저장 후 갱신)
+        shard_result_path = save_shard_result(SHARD_DIR, *shard, {
+            "ok": run_ok,
+            "today": today_str,
+            "keywords": all_keywords,
+            "blog_rows": blog_rows,
+            "cafe_rows": cafe_rows,
+            "wall_s": metrics.snapshot()["wall_s"],
+            "ai_tokens": TOKEN_BUDGET.used,
+            "watermarks": _watermarks.export_pending() if _watermarks else [],
+            # 유사글 지문은 시트에 저장될 때 등록되므로 병합 단계로 넘김
+            "fingerprints": _near_dup_index.export_pending() if _near_dup_index else [],
+        })
+        print(f"\n🧩 샤드 결과 저장: 블로그 {len(blog_rows)}건 / 카페 {len(cafe_rows)}건 → {shard_result_path}")
+    elif total_count > 0:
+        run_summary = metrics.format_summary()
+        if TOKEN_BUDGET.used:
+            run_summary += f"\n🪙 {TOKEN_BUDGET.format_stats()}"
+        send_run_report(blog_rows, cafe_rows, total_count, blog_total, cafe_total, run_summary)
+    else:
+        print("신규 데이터 없음")
+    
+    if run_ok:
+        journal.complete()
+        # 정상 종료했을 때만 기준점 저장 (실패 시 다음 실행이 같은 구간을 다시 수집)
+        if _watermarks and not shard:
             try:
-                summary_report = analyze_daily_summary(blog_rows, cafe_rows)
-                if summary_report:
-                    time.sleep(10)  # 10초 대기
-                    send_telegram_message(summary_report, disable_notification=True)
-                    print("✅ 전문가 분석 리포트 발송 완료 (무음)")
+                saved = _watermarks.commit()
+                print(f"🔖 수집 기준점 갱신: 키워드 {saved}개 (이미 본 글에서 탐색 중단 {_watermarks.stopped}회)")
             except Exception as e:
-                print(f"❌ 전문가 분석 리포트 발송 실패: {e}")
+                print(f"⚠️ 수집 기준점 저장 실패: {e}")
     else:
-        print("신규 데이터 없음")
+        journal.close()
+        print("\n⚠️ 일부 단계가 실패했습니다. 'python naver_scanner.py --resume'으로 남은 작업을 이어서 실행할 수 있습니다.")
+    
+    print("\n🔌 HTTP 커넥션 통계 (호스트별):")
+    print(http_client.format_connection_stats())
+    
+    ai_cache = get_ai_cache()
+    if ai_cache:
+        print(f"💾 AI 응답 캐시: {ai_cache.format_stats()}")
+    
+    limiter_stats = format_ai_limiter_stats()
+    if limiter_stats:
+        print(f"🚦 AI 호출 한도: {limiter_stats}")
+    
+    if TOKEN_BUDGET.used or TOKEN_BUDGET.exhausted:
+        print(f"🪙 AI 토큰 (작업별): {TOKEN_BUDGET.format_stats()}")
+    
+    if SENTIMENT_SCORER.scored:
+        print(f"💬 댓글 감성: {SENTIMENT_SCORER.format_stats()}")
+    
+    if _near_dup_index and _near_dup_index.duplicates:
+        print(f"🔁 유사글 제외: {_near_dup_index.duplicates}건 (AI 분석 생략)")
+    
+    try:
+        metrics_path = metrics.save(
+            os.path.join(STATE_DIR, "metrics"),
+            extra={
+                "saved": {"blog": journal.flushed.get("blog", 0), "cafe": journal.flushed.get("cafe", 0)},
+                "ai_tokens": TOKEN_BUDGET.snapshot(),
+            }
+        )
+        print(f"📈 실행 지표: {metrics.format_summary()} (상세: {metrics_path})")
+    except Exception as e:
+        print(f"⚠️ 실행 지표 저장 실패: {e}")
+    
+    if cassette:
+        rows_path = cassette.save_rows({"blog": blog_sheet.rows, "cafe": cafe_sheet.rows})
+        print(f"📼 카세트: {cassette.format_stats()} / 결과 행: {rows_path}")
+        uninstall_cassette(http_client.session, original_adapters)
 
 if __name__ == "__main__":
-    main()
+    # --workers/--merge는 실패 시 False 반환 → 종료 코드 1 (CI에서 실패로 표시)
+    sys.exit(0 if main() is not False else 1)
@@ -0,0 +1,256 @@
+"""
+유사 게시글(근접 중복) 인덱스 (SimHash + SQLite)
+- 제목+본문을 글자 3-gram으로 쪼개 64비트 SimHash 지문 생성
+- 지문을 (허용 거리 + 1)개 구간으로 나눠 저장 → 비둘기집 원리로
+  해밍 거리가 허용치 이하인 지문은 최소 한 구간이 정확히 일치 (전체 비교 없이 조회)
+- 카페/블로그 구분 없이 실행 간 유지 (다른 카페에 퍼나른 글, 살짝 고친 글 감지)
+- 조회(check)와 등록(add)은 분리: 시트에 저장된 글만 지문을 남김
+  (AI가 제외했거나 저장에 실패한 글이 이후 실행에서 비슷한 글을 막지 않도록)
+  저장 전 지문은 이번 실행 동안 메모리에서만 비교
+"""
+
+import hashlib
+import os
+import re
+import threading
+import time
+
+import state_db
+
+SHINGLE_SIZE = 3
+_BITS = 64
+_MASK = (1 << _BITS) - 1
+
+
+def _normalize(text):
+    """비교용 정규화 (소문자, 한글/영문/숫자만 남김)"""
+    return re.sub(r"[^0-9a-z가-힣]", "", (text or "").lower())
+
+
+def _to_signed(value):
+    """SQLite INTEGER(부호 있는 64비트) 저장용"""
+    return value - (1 << _BITS) if value >= (1 << (_BITS - 1)) else value
+
+
+def _to_unsigned(value):
+    return value & _MASK
+
+
+def hamming_distance(a, b):
+    return bin((a ^ b) & _MASK).count("1")
+
+
+class NearDupIndex:
+    """
+    SimHash 지문 인덱스
+
+    Args:
+        path: SQLite 파일 경로
+        max_hamming: 이 거리 이하면 유사글로 판정 (64비트 중 다른 비트 수)
+        min_chars: 정규화 후 글자 수가 이보다 짧으면 판정하지 않음 (짧은 글 오탐 방지)
+        retention_days: 지문 보관 기간 (일)
+    """
+
+    def __init__(self, path, max_hamming=3, min_chars=40, retention_days=90):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.max_hamming = max_hamming
+        self.min_chars = min_chars
+        self.bands = self._band_masks(max_hamming + 1)
+        self.duplicates = 0  # 이번 실행에서 찾은 유사글 수
+        self._pending = {}   # 링크 -> (지문, 출처) - 조회는 했지만 아직 저장되지 않은 글
+        self._lock = threading.Lock()
+        self._conn = state_db.connect(path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS fingerprints (
+                link TEXT PRIMARY KEY,
+                simhash INTEGER NOT NULL,
+                source TEXT,
+                created_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS fingerprint_bands (
+                band INTEGER NOT NULL,
+                value INTEGER NOT NULL,
+                link TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_fingerprint_bands ON fingerprint_bands(band, value);
+            CREATE TABLE IF NOT EXISTS near_duplicates (
+                link TEXT PRIMARY KEY,
+                duplicate_of TEXT NOT NULL,
+                distance INTEGER NOT NULL,
+                created_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS near_dup_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            """
+        )
+        self._prepare(retention_days)
+
+    @staticmethod
+    def _band_masks(count):
+        """64비트를 count개 구간으로 나눈 (시프트, 마스크) 목록"""
+        width = _BITS // count
+        bands = []
+        for i in range(count):
+            shift = i * width
+            bits = _BITS - shift if i == count - 1 else width
+            bands.append((shift, (1 << bits) - 1))
+        return bands
+
+    def _band_values(self, fingerprint):
+        return [(i, (fingerprint >> shift) & mask) for i, (shift, mask) in enumerate(self.bands)]
+
+    def _prepare(self, retention_days):
+        """오래된 지문 삭제 + 허용 거리 설정이 바뀌었으면 구간 테이블 재구성"""
+        with self._lock:
+            cutoff = time.time() - retention_days * 86400
+            self._conn.execute("DELETE FROM fingerprints WHERE created_at < ?", (cutoff,))
+            self._conn.execute("DELETE FROM near_duplicates WHERE created_at < ?", (cutoff,))
+
+            row = self._conn.execute("SELECT value FROM near_dup_meta WHERE key = 'bands'").fetchone()
+            rebuild = row is None or int(row[0]) != len(self.bands)
+            if not rebuild:
+                self._conn.execute(
+                    "DELETE FROM fingerprint_bands WHERE link NOT IN (SELECT link FROM fingerprints)"
+                )
+            else:
+                self._conn.execute("DELETE FROM fingerprint_bands")
+                rows = self._conn.execute("SELECT link, simhash FROM fingerprints").fetchall()
+                self._conn.executemany(
+                    "INSERT INTO fingerprint_bands (band, value, link) VALUES (?, ?, ?)",
+                    [(band, value, link)
+                     for link, simhash in rows
+                     for band, value in self._band_values(_to_unsigned(simhash))],
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO near_dup_meta (key, value) VALUES ('bands', ?)", (str(len(self.bands)),)
+                )
+            self._conn.commit()
+
+    def fingerprint(self, text):
+        """
+        64비트 SimHash (정규화 후 글자 수가 min_chars 미만이면 None)
+        """
+        normalized = _normalize(text)
+        if len(normalized) < self.min_chars:
+            return None
+
+        counts = {}
+        for i in range(len(normalized) - SHINGLE_SIZE + 1):
+            shingle = normalized[i:i + SHINGLE_SIZE]
+            counts[shingle] = counts.get(shingle, 0) + 1
+
+        vector = [0] * _BITS
+        for shingle, weight in counts.items():
+            h = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+            for bit in range(_BITS):
+                if h >> bit & 1:
+                    vector[bit] += weight
+                else:
+                    vector[bit] -= weight
+
+        result = 0
+        for bit, total in enumerate(vector):
+            if total > 0:
+                result |= 1 << bit
+        return result
+
+    def _find(self, fingerprint, exclude_link):
+        candidates = set()
+        for band, value in self._band_values(fingerprint):
+            for link, simhash in self._conn.execute(
+                "SELECT b.link, f.simhash FROM fingerprint_bands b JOIN fingerprints f ON f.link = b.link "
+                "WHERE b.band = ? AND b.value = ?",
+                (band, value),
+            ):
+                if link != exclude_link:
+                    candidates.add((link, _to_unsigned(simhash)))
+        for link, (simhash, _) in self._pending.items():
+            if link != exclude_link:
+                candidates.add((link, simhash))
+
+        best = None
+        for link, simhash in candidates:
+            distance = hamming_distance(fingerprint, simhash)
+            if distance <= self.max_hamming and (best is None or distance < best[1]):
+                best = (link, distance)
+        return best
+
+    def check(self, text, link, source=""):
+        """
+        유사글 조회 (저장된 지문 + 이번 실행에서 조회한 글)
+
+        유사글이 아니면 지문을 메모리에 보관 → 동시에 처리 중인 같은 글도 감지, 시트 저장 후 add()로 등록
+        같은 링크로 이미 등록된 지문은 자기 자신이므로 유사글로 보지 않음 (재개 실행 대비)
+
+        Returns:
+            tuple: (원본 링크, 해밍 거리) - 유사글이 없거나 판정 불가면 None
+        """
+        fingerprint = self.fingerprint(text)
+        if fingerprint is None:
+            return None
+        return self.check_fingerprint(fingerprint, link, source)
+
+    def check_fingerprint(self, fingerprint, link, source=""):
+        """지문으로 유사글 조회 (check()와 같음 - 샤드 결과 병합처럼 지문만 있는 경우)"""
+        if fingerprint is None or not link:
+            return None
+
+        with self._lock:
+            match = self._find(fingerprint, exclude_link=link)
+            if match:
+                self.duplicates += 1
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO near_duplicates (link, duplicate_of, distance, created_at) VALUES (?, ?, ?, ?)",
+                    (link, match[0], match[1], time.time()),
+                )
+                self._conn.commit()
+            else:
+                self._pending[link] = (fingerprint, source)
+        return match
+
+    def add(self, links):
+        """
+        시트에 저장된 글의 지문 등록 (check()에서 보관한 지문만, 이미 등록된 링크는 그대로)
+
+        Returns:
+            int: 새로 등록한 지문 수
+        """
+        now = time.time()
+        added = 0
+        with self._lock:
+            for link in links:
+                entry = self._pending.pop(link, None)
+                if entry is None:
+                    continue
+                fingerprint, source = entry
+                if self._conn.execute("SELECT 1 FROM fingerprints WHERE link = ?", (link,)).fetchone():
+                    continue
+                self._conn.execute(
+                    "INSERT INTO fingerprints (link, simhash, source, created_at) VALUES (?, ?, ?, ?)",
+                    (link, _to_signed(fingerprint), source, now),
+                )
+                self._conn.executemany(
+                    "INSERT INTO fingerprint_bands (band, value, link) VALUES (?, ?, ?)",
+                    [(band, value, link) for band, value in self._band_values(fingerprint)],
+                )
+                added += 1
+            self._conn.commit()
+        return added
+
+    def export_pending(self):
+        """
+        아직 등록하지 않은 지문 목록 (샤드 실행 결과에 담아 병합 단계에서 check_fingerprint/add)
+
+        Returns:
+            list: [링크, 지문, 출처] 리스트
+        """
+        with self._lock:
+            return [[link, fingerprint, source] for link, (fingerprint, source) in self._pending.items()]
+
+    def discard(self, link):
+        """저장하지 않기로 한 글의 지문 버리기 (AI 판단으로 제외 등)"""
+        with self._lock:
+            self._pending.pop(link, None)
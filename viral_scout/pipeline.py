@@ -0,0 +1,229 @@
+"""
+단계별 생산자/소비자 파이프라인
+- 검색 → 필터 → AI 분석 → 저장 단계를 크기 제한 큐로 연결
+- 단계마다 워커 수를 따로 지정 (느린 AI 단계만 여러 개)
+- 큐가 가득 차면 앞 단계가 대기 (백프레셔)
+- 결과는 입력 순서대로 싱크에 전달, 종료 시 남은 항목을 모두 처리 후 정리
+- 예외로 처리하지 못한 항목은 필터 제외(dropped)와 따로 집계 (failed)
+- 전체 실행 시간 ≈ 가장 느린 단계의 시간 (단계 시간의 합이 아님)
+
+소스(이터레이터)는 호출한 스레드에서 소비하므로 Playwright(sync API)처럼
+스레드를 넘길 수 없는 크롤링도 소스로 사용 가능
+"""
+
+import queue
+import threading
+import time
+
+_DONE = object()      # 종료 신호
+_DROPPED = object()   # 앞 단계에서 제외된 항목 (순서 유지용 자리표시)
+_FAILED = object()    # 앞 단계에서 예외로 처리하지 못한 항목 (순서 유지용 자리표시)
+
+
+class Checkpoint:
+    """
+    단계를 거치지 않고 순서만 지켜서 싱크에 전달되는 표시 항목
+
+    예: 키워드 완료 표시 - 해당 키워드의 글이 모두 싱크에 전달된 뒤에 도착
+
+    Attributes:
+        failed: 직전 표시 항목 이후 예외로 처리하지 못한 항목 수 (싱크에 전달될 때 채워짐)
+    """
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.failed = 0
+
+
+class Stage:
+    """
+    파이프라인 단계 1개
+
+    Args:
+        name: 로그/통계 표시용 이름
+        fn: batch_size가 없으면 fn(항목) -> 결과 (None이면 제외)
+            batch_size가 있으면 fn([항목, ...]) -> [결과, ...] (같은 길이, None이면 제외)
+        workers: 워커 스레드 수
+        batch_size: 한 번에 묶어서 처리할 최대 항목 수
+        batch_wait: 배치를 채우기 위해 기다리는 최대 시간(초)
+            None이면 배치가 가득 차거나 입력이 끝날 때까지 대기 (배치 구성이 처리 속도와 무관하게 고정)
+    """
+
+    def __init__(self, name, fn, workers=1, batch_size=None, batch_wait=0.5):
+        self.name = name
+        self.fn = fn
+        self.workers = max(1, workers)
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.busy_seconds = 0.0
+        self.processed = 0
+        self.dropped = 0   # fn이 None을 반환해 제외된 항목 수 (필터 제외)
+        self.failed = 0    # fn에서 예외가 나서 처리하지 못한 항목 수
+
+
+class Pipeline:
+    """
+    Args:
+        stages: Stage 목록 (순서대로 연결)
+        sink: 최종 결과를 받는 함수 sink(결과) - 입력 순서대로 단일 스레드에서 호출
+        queue_size: 단계 사이 큐의 최대 크기
+        name: 로그 표시용 이름
+    """
+
+    def __init__(self, stages, sink, queue_size=50, name="파이프라인"):
+        self.stages = list(stages)
+        self.sink = sink
+        self.queue_size = queue_size
+        self.name = name
+        self.wall_seconds = 0.0
+        self.sink_seconds = 0.0
+        self.sink_failed = 0
+        self._lock = threading.Lock()
+
+    def run(self, source):
+        """
+        소스를 끝까지 처리 (호출 스레드에서 소스 소비)
+
+        소스에서 예외가 나도 이미 넣은 항목은 모두 처리한 뒤 예외를 다시 발생
+        """
+        started = time.monotonic()
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        collect_queue = queue.Queue(maxsize=self.queue_size)
+        downstream = queues[1:] + [collect_queue]
+
+        threads = []
+        for index, stage in enumerate(self.stages):
+            next_workers = self.stages[index + 1].workers if index + 1 < len(self.stages) else 1
+            remaining = [stage.workers]
+            for n in range(stage.workers):
+                t = threading.Thread(
+                    target=self._work,
+                    args=(stage, queues[index], downstream[index], collect_queue, remaining, next_workers),
+                    name=f"{stage.name}-{n + 1}",
+                    daemon=True,
+                )
+                t.start()
+                threads.append(t)
+
+        collector = threading.Thread(target=self._collect, args=(collect_queue,), name="sink", daemon=True)
+        collector.start()
+
+        seq = 0
+        try:
+            for item in source:
+                if isinstance(item, Checkpoint):
+                    collect_queue.put((seq, item))
+                else:
+                    queues[0].put((seq, item))
+                seq += 1
+        finally:
+            for _ in range(self.stages[0].workers):
+                queues[0].put(_DONE)
+            for t in threads:
+                t.join()
+            collector.join()
+            self.wall_seconds += time.monotonic() - started
+
+    def _work(self, stage, in_queue, out_queue, collect_queue, remaining, next_workers):
+        try:
+            finished = False
+            while not finished:
+                entry = in_queue.get()
+                if entry is _DONE:
+                    break
+                batch = [entry]
+                if stage.batch_size:
+                    deadline = None if stage.batch_wait is None else time.monotonic() + stage.batch_wait
+                    while len(batch) < stage.batch_size:
+                        timeout = None if deadline is None else deadline - time.monotonic()
+                        if timeout is not None and timeout <= 0:
+                            break
+                        try:
+                            entry = in_queue.get(timeout=timeout)
+                        except queue.Empty:
+                            break
+                        if entry is _DONE:
+                            finished = True
+                            break
+                        batch.append(entry)
+                self._process(stage, batch, out_queue, collect_queue)
+        finally:
+            with self._lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last:
+                for _ in range(next_workers):
+                    out_queue.put(_DONE)
+
+    def _process(self, stage, batch, out_queue, collect_queue):
+        started = time.monotonic()
+        failed = False
+        try:
+            if stage.batch_size:
+                results = stage.fn([item for _, item in batch])
+            else:
+                results = [stage.fn(batch[0][1])]
+        except Exception as e:
+            print(f"   ⚠️ [{self.name}/{stage.name}] 처리 실패 ({len(batch)}건 제외): {e}")
+            results = [None] * len(batch)
+            failed = True
+
+        with self._lock:
+            stage.busy_seconds += time.monotonic() - started
+            stage.processed += len(batch)
+            if failed:
+                stage.failed += len(batch)
+
+        for (seq, _), result in zip(batch, results):
+            if result is None:
+                if not failed:
+                    with self._lock:
+                        stage.dropped += 1
+                # 제외된 항목은 뒤 단계를 건너뛰고 순서 자리만 전달
+                collect_queue.put((seq, _FAILED if failed else _DROPPED))
+            else:
+                out_queue.put((seq, result))
+
+    def _collect(self, collect_queue):
+        """입력 순서대로 정렬해서 싱크에 전달"""
+        next_seq = 0
+        pending = {}
+        failed = 0  # 직전 Checkpoint 이후 실패 항목 수
+        while True:
+            entry = collect_queue.get()
+            if entry is _DONE:
+                break
+            seq, item = entry
+            pending[seq] = item
+            while next_seq in pending:
+                item = pending.pop(next_seq)
+                next_seq += 1
+                if item is _DROPPED:
+                    continue
+                if item is _FAILED:
+                    failed += 1
+                    continue
+                if isinstance(item, Checkpoint):
+                    item.failed, failed = failed, 0
+                started = time.monotonic()
+                try:
+                    self.sink(item)
+                except Exception as e:
+                    self.sink_failed += 1
+                    failed += 1
+                    print(f"   ⚠️ [{self.name}/저장] 처리 실패: {e}")
+                self.sink_seconds += time.monotonic() - started
+
+    @property
+    def failed(self):
+        """예외로 처리하지 못한 항목 수 (단계 + 싱크) - 0이 아니면 다시 수집해야 하는 글이 있음"""
+        return sum(stage.failed for stage in self.stages) + self.sink_failed
+
+    def format_stats(self):
+        """단계별 처리 시간 (워커 합산) / 전체 경과 시간"""
+        parts = [
+            f"{stage.name} {stage.busy_seconds:.1f}초({stage.processed}건, 워커 {stage.workers})"
+            for stage in self.stages
+        ]
+        parts.append(f"싱크 {self.sink_seconds:.1f}초")
+        return " / ".join(parts) + f" → 전체 {self.wall_seconds:.1f}초"
@@ -0,0 +1,136 @@
+"""
+호출 속도 제한기 (Token Bucket)
+- 여러 스레드가 공유하는 초당 호출 한도 관리
+- AI 공급자별 분당 요청 수(RPM) / 분당 토큰 수(TPM) 한도 + 429 응답 시 자동 감속
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    스레드 안전 토큰 버킷
+
+    Args:
+        rate: 초당 보충되는 토큰 수 (= 초당 허용 호출 수)
+        capacity: 버킷 최대 크기 (순간 버스트 허용량, 기본값 rate)
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(rate, 1))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+
+    def acquire(self, tokens=1):
+        """토큰이 생길 때까지 대기 후 차감"""
+        if self.rate <= 0:
+            return
+        tokens = min(tokens, self.capacity)  # 버킷보다 큰 요청은 가득 찰 때까지만 대기
+
+        while True:
+            with self._lock:
+                self._refill()
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                else:
+                    wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def adjust(self, tokens):
+        """
+        이미 통과한 요청의 사용량 보정 (양수: 추가 차감, 음수: 환불)
+
+        실제 사용량이 예상보다 많으면 잔량이 음수가 되어 다음 요청이 그만큼 대기
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens - tokens)
+
+    def set_rate(self, rate):
+        with self._lock:
+            self._refill()
+            self.rate = float(rate)
+
+    def pause(self, seconds):
+        """지정 시간 동안 모든 스레드의 acquire 대기 (Retry-After 반영)"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class ProviderRateLimiter:
+    """
+    AI 공급자 1곳의 분당 요청 수 / 분당 토큰 수 한도 (모든 AI 호출이 공유)
+
+    429를 받으면 속도를 줄이고(곱셈 감소) 성공이 이어지면 설정값까지 서서히 복구(덧셈 증가)
+
+    Args:
+        rpm: 분당 요청 수 한도
+        tpm: 분당 토큰 수 한도 (None이면 제한 없음)
+        burst_seconds: 순간 버스트 허용량 (몇 초 분량까지 몰아서 보낼지)
+        min_ratio: 감속 하한 (설정값 대비 비율)
+    """
+
+    DECREASE = 0.7   # 429 1회당 속도 배율
+    INCREASE = 0.05  # 성공 1회당 설정값 대비 복구 비율
+
+    def __init__(self, rpm, tpm=None, burst_seconds=10, min_ratio=0.1):
+        self.base_rpm = float(rpm)
+        self.base_tpm = float(tpm) if tpm else None
+        self.min_ratio = min_ratio
+        self.ratio = 1.0
+        self.throttled = 0  # 받은 429 횟수
+        self._lock = threading.Lock()
+
+        self.requests = RateLimiter(self.base_rpm / 60, capacity=max(1, self.base_rpm / 60 * burst_seconds))
+        self.tokens = None
+        if self.base_tpm:
+            self.tokens = RateLimiter(self.base_tpm / 60, capacity=max(1, self.base_tpm / 60 * burst_seconds))
+
+    def acquire(self, tokens=0):
+        """요청 1회 + 예상 토큰 수만큼 한도가 생길 때까지 대기"""
+        self.requests.acquire(1)
+        if self.tokens and tokens:
+            self.tokens.acquire(tokens)
+
+    def record_usage(self, estimated, actual):
+        """응답의 실제 토큰 사용량으로 보정"""
+        if self.tokens and actual:
+            self.tokens.adjust(actual - estimated)
+
+    def _apply_ratio(self):
+        self.requests.set_rate(self.base_rpm / 60 * self.ratio)
+        if self.tokens:
+            self.tokens.set_rate(self.base_tpm / 60 * self.ratio)
+
+    def throttle(self, retry_after):
+        """429 응답: retry_after초 동안 전체 대기 + 속도 감소"""
+        with self._lock:
+            self.throttled += 1
+            self.ratio = max(self.min_ratio, self.ratio * self.DECREASE)
+            self._apply_ratio()
+        self.requests.pause(retry_after)
+
+    def success(self):
+        """성공 응답: 감속 상태면 조금씩 복구"""
+        if self.ratio >= 1.0:
+            return
+        with self._lock:
+            self.ratio = min(1.0, self.ratio + self.INCREASE)
+            self._apply_ratio()
+
+    def format_stats(self):
+        return f"429 {self.throttled}회, 현재 속도 {self.ratio * 100:.0f}% ({self.base_rpm * self.ratio:.0f} RPM)"
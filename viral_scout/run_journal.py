@@ -0,0 +1,150 @@
+"""
+실행 저널 (크래시 복구용)
+- 분석 완료된 행 / 완료된 키워드 / 시트 저장 완료 지점을 로컬 파일에 즉시 기록
+- 실행이 중간에 죽어도 --resume으로 이어서 실행 (유료 AI 분석 재사용)
+
+파일 형식: JSON Lines (한 줄 = 한 레코드, 추가 전용)
+    {"type": "start", "today": "..."}
+    {"type": "row", "sheet": "blog", "key": "...", "row": [...]}   # row가 null이면 분석 후 제외된 글
+    {"type": "keyword_done", "phase": "blog", "keyword": "..."}
+    {"type": "flushed", "sheet": "blog", "count": 12}               # 해당 시트 행 중 앞 count개 저장 완료
+    {"type": "complete"}
+"""
+
+import json
+import os
+import threading
+import time
+
+
+class RunJournal:
+    """
+    추가 전용 실행 저널
+
+    Attributes:
+        today: 실행 시작 시각 문자열 (재개 시 원래 실행의 값 유지)
+        rows: {시트: [행, ...]} 분석 완료된 행 (기록 순서)
+        keys: {시트: set(키)} 분석을 마친 글 키 (제외된 글 포함)
+        done: {단계: set(키워드)} 완료된 키워드
+        flushed: {시트: 저장 완료된 행 수}
+        completed: 실행이 정상 종료되었는지 여부
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.today = None
+        self.rows = {}
+        self.keys = {}
+        self.done = {}
+        self.flushed = {}
+        self.completed = False
+        self._lock = threading.Lock()
+        self._file = None
+
+    @classmethod
+    def start(cls, path, today):
+        """
+        새 저널 시작
+
+        이전 실행이 비정상 종료된 저널이 있으면 지우지 않고 백업 파일로 보관
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        if os.path.exists(path):
+            previous = cls.load(path)
+            if previous and not previous.completed:
+                backup = f"{path}.{time.strftime('%Y%m%d%H%M%S')}.bak"
+                os.replace(path, backup)
+                print(f"⚠️ 완료되지 않은 이전 실행 저널을 백업: {backup} (--resume으로 이어서 실행 가능)")
+            else:
+                os.remove(path)
+
+        journal = cls(path)
+        journal.today = today
+        journal._append({"type": "start", "today": today})
+        return journal
+
+    @classmethod
+    def load(cls, path):
+        """
+        기존 저널 읽기 (파일이 없으면 None)
+
+        마지막 줄이 기록 도중 잘린 경우 해당 줄은 무시하고 파일에서도 잘라냄
+        (이어서 기록할 레코드가 잘린 줄에 붙지 않도록)
+        """
+        if not os.path.exists(path):
+            return None
+
+        journal = cls(path)
+        with open(path, "rb") as f:
+            data = f.read()
+
+        valid_end = data.rfind(b"\n") + 1
+        for line in data[:valid_end].decode("utf-8", errors="replace").splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            journal._apply(record)
+
+        if valid_end < len(data):
+            with open(path, "r+b") as f:
+                f.truncate(valid_end)
+        return journal
+
+    def _apply(self, record):
+        kind = record.get("type")
+        if kind == "start":
+            self.today = record.get("today")
+        elif kind == "row":
+            sheet = record["sheet"]
+            self.keys.setdefault(sheet, set()).add(record["key"])
+            if record.get("row") is not None:
+                self.rows.setdefault(sheet, []).append(record["row"])
+        elif kind == "keyword_done":
+            self.done.setdefault(record["phase"], set()).add(record["keyword"])
+        elif kind == "flushed":
+            self.flushed[record["sheet"]] = record["count"]
+        elif kind == "complete":
+            self.completed = True
+
+    def _append(self, record):
+        """레코드 1줄 기록 후 디스크까지 즉시 반영"""
+        with self._lock:
+            self._apply(record)
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def record_row(self, sheet, key, row):
+        """분석 완료된 글 기록 (row=None이면 분석 후 제외된 글)"""
+        self._append({"type": "row", "sheet": sheet, "key": key, "row": row})
+
+    def mark_keyword_done(self, phase, keyword):
+        self._append({"type": "keyword_done", "phase": phase, "keyword": keyword})
+
+    def mark_flushed(self, sheet, count):
+        """시트 저장 완료 지점 기록 (해당 시트의 앞 count개 행)"""
+        self._append({"type": "flushed", "sheet": sheet, "count": count})
+
+    def complete(self):
+        """정상 종료 기록 후 파일 닫기"""
+        self._append({"type": "complete"})
+        self.close()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def is_keyword_done(self, phase, keyword):
+        return keyword in self.done.get(phase, set())
+
+    def has_key(self, sheet, key):
+        return key in self.keys.get(sheet, set())
+
+    def pending_rows(self, sheet):
+        """아직 시트에 저장되지 않은 행"""
+        return self.rows.get(sheet, [])[self.flushed.get(sheet, 0):]
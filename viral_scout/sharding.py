@@ -0,0 +1,185 @@
+"""
+키워드 분할 실행 (샤드)
+- --shard i/N: 키워드 목록의 i번째 조각만 수집/분석하고 결과 행을 샤드 결과 파일로 저장 (시트/텔레그램에는 쓰지 않음)
+- --merge N: N개 샤드 결과를 모아 샤드 간 중복을 제거하고 시트/텔레그램에 한 번만 기록
+- --workers N: 로컬에서 N개 샤드 프로세스를 동시에 실행한 뒤 병합
+
+키워드는 순서대로 번갈아 나눔 (i/N → i, i+N, i+2N ... 번째 키워드) → 같은 키워드 목록이면 항상 같은 조각
+"""
+
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+
+def parse_shard(text):
+    """
+    "i/N" 형식의 샤드 지정 해석 (i는 1부터 N까지, argparse type으로 사용)
+
+    Returns:
+        tuple: (i, N)
+
+    Raises:
+        argparse.ArgumentTypeError: 형식이 잘못된 경우
+    """
+    try:
+        index, count = (int(part) for part in text.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"샤드는 i/N 형식이어야 합니다: {text}")
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"샤드 번호는 1~N 사이여야 합니다: {text}")
+    return index, count
+
+
+def shard_keywords(keywords, index, count):
+    """키워드 목록 중 i/N 샤드가 맡을 키워드 (원래 순서 유지)"""
+    return list(keywords)[index - 1::count]
+
+
+def shard_path(directory, index, count):
+    return os.path.join(directory, f"shard_{index}_of_{count}.json")
+
+
+def save_shard_result(directory, index, count, result):
+    """
+    샤드 결과 저장 (임시 파일에 쓴 뒤 교체 → 병합 단계가 쓰다 만 파일을 읽지 않음)
+
+    Returns:
+        str: 저장한 파일 경로
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = shard_path(directory, index, count)
+    data = dict(result, shard=[index, count], finished_at=time.time())
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_shard_results(directory, count, max_age_seconds=None):
+    """
+    N개 샤드 결과 읽기
+
+    Args:
+        directory: 샤드 결과 폴더
+        count: 샤드 수 N
+        max_age_seconds: 이보다 오래된 결과는 없는 것으로 처리 (이전 실행에서 남은 파일)
+
+    Returns:
+        tuple: (샤드 번호 순 결과 리스트, 결과가 없는 샤드 번호 리스트)
+    """
+    results, missing = [], []
+    for index in range(1, count + 1):
+        try:
+            with open(shard_path(directory, index, count), "r", encoding="utf-8") as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            missing.append(index)
+            continue
+        if max_age_seconds is not None and time.time() - result.get("finished_at", 0) > max_age_seconds:
+            print(f"   ⚠️ 샤드 {index}/{count} 결과가 오래되어 제외")
+            missing.append(index)
+            continue
+        results.append(result)
+    return results, missing
+
+
+def remove_shard_results(directory, count):
+    for path in glob.glob(os.path.join(directory, f"shard_*_of_{count}.json*")):
+        os.remove(path)
+
+
+def merge_rows(row_lists, keywords, keyword_column, key_fn):
+    """
+    샤드별 행 합치기 (키워드 순서대로 정렬, 같은 글은 먼저 나온 행만)
+
+    여러 키워드 검색에 같은 글이 걸리면 서로 다른 샤드에서 각각 수집될 수 있음
+
+    Args:
+        row_lists: 샤드별 행 리스트
+        keywords: 전체 키워드 목록 (정렬 기준)
+        keyword_column: 행에서 키워드가 있는 열 인덱스
+        key_fn: 행 -> 중복 판별 키
+
+    Returns:
+        tuple: (합친 행 리스트, 제외한 중복 행 수)
+    """
+    order = {keyword: i for i, keyword in enumerate(keywords)}
+    rows = sorted(
+        (row for rows in row_lists for row in rows),
+        key=lambda row: order.get(row[keyword_column], len(order))
+    )
+    merged, seen = [], set()
+    for row in rows:
+        key = key_fn(row)
+        if key in seen:
+            continue
+        seen.add(key)
+        merged.append(row)
+    return merged, len(rows) - len(merged)
+
+
+class NullSink:
+    """
+    샤드 실행용 시트 저장기 자리표시 (행은 샤드 결과 파일로만 저장, 시트에는 병합 단계에서 한 번에)
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.written = 0
+        self.pending = 0
+        self.error = None
+
+    def append(self, row):
+        pass
+
+    def extend(self, rows):
+        pass
+
+    def close(self):
+        return True
+
+
+def _relay_output(process, prefix):
+    for line in process.stdout:
+        sys.stdout.write(f"{prefix} {line}")
+        sys.stdout.flush()
+
+
+def run_shard_processes(script, count, indexes=None, extra_args=()):
+    """
+    샤드를 별도 프로세스로 동시에 실행 (출력은 줄마다 [i/N] 붙여서 그대로 표시)
+
+    Args:
+        script: 실행할 스크립트 경로 (--shard i/N 인자를 받음)
+        count: 샤드 수 N
+        indexes: 실행할 샤드 번호 (기본값 1~N 전체)
+        extra_args: 모든 샤드에 함께 넘길 인자
+
+    Returns:
+        dict: 샤드 번호 -> 종료 코드
+    """
+    env = dict(os.environ, PYTHONUNBUFFERED="1", PYTHONIOENCODING="utf-8")
+    indexes = list(indexes) if indexes is not None else list(range(1, count + 1))
+    processes, relays = [], []
+    for index in indexes:
+        process = subprocess.Popen(
+            [sys.executable, script, "--shard", f"{index}/{count}", *extra_args],
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            cwd=os.path.dirname(os.path.abspath(script)), env=env, text=True, encoding="utf-8", errors="replace"
+        )
+        relay = threading.Thread(target=_relay_output, args=(process, f"[{index}/{count}]"), daemon=True)
+        relay.start()
+        processes.append(process)
+        relays.append(relay)
+
+    codes = {index: process.wait() for index, process in zip(indexes, processes)}
+    for relay in relays:
+        relay.join()
+    return codes
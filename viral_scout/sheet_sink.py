@@ -0,0 +1,141 @@
+"""
+구글 시트 버퍼 저장 (백그라운드 스트리밍)
+- 분석이 끝난 행을 버퍼에 쌓고 N행 또는 T초마다 백그라운드 스레드에서 append_rows
+- 실패한 배치는 지수 백오프로 재시도, 행 순서는 항상 추가된 순서 그대로 유지
+- 실행 종료 시 한 번에 큰 요청을 보내지 않고, 수집 직후 시트에서 바로 확인 가능
+"""
+
+import random
+import threading
+import time
+
+from metrics import metrics
+
+
+class BufferedSheetSink:
+    """
+    시트 1개에 대한 버퍼 저장기
+
+    Args:
+        sheet: gspread 시트 객체
+        value_input_option: append_rows 옵션 ('RAW' / 'USER_ENTERED')
+        flush_rows: 버퍼가 이 행 수에 도달하면 저장 (1회 요청 최대 행 수)
+        flush_interval: 첫 행이 버퍼에 들어온 뒤 이 시간(초)이 지나면 저장
+        max_retries: 배치당 최대 재시도 횟수
+        backoff_base: 재시도 대기 시간 기준(초), 시도마다 2배 + 지터
+        on_flush: 배치 저장 성공 시 호출 (batch, written) - written은 누적 저장 행 수
+        name: 로그 표시용 이름
+    """
+
+    MAX_BACKOFF = 60
+
+    def __init__(self, sheet, value_input_option="RAW", flush_rows=20, flush_interval=30,
+                 max_retries=5, backoff_base=2, on_flush=None, name="시트"):
+        self.sheet = sheet
+        self.value_input_option = value_input_option
+        self.flush_rows = max(1, flush_rows)
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.on_flush = on_flush
+        self.name = name
+
+        self.written = 0      # 저장 완료 행 수
+        self.error = None     # 재시도 후에도 실패한 경우 마지막 예외
+
+        self._buffer = []
+        self._first_buffered_at = None
+        self._closing = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name=f"sheet-sink-{name}", daemon=True)
+        self._thread.start()
+
+    def append(self, row):
+        """행 1개 추가 (저장은 백그라운드에서)"""
+        self.extend([row])
+
+    def extend(self, rows):
+        """여러 행 추가 (순서 유지)"""
+        rows = list(rows)
+        if not rows:
+            return
+        with self._cond:
+            if not self._buffer:
+                self._first_buffered_at = time.monotonic()
+            self._buffer.extend(rows)
+            if len(self._buffer) >= self.flush_rows:
+                self._cond.notify()
+
+    @property
+    def pending(self):
+        """아직 저장되지 않은 행 수"""
+        with self._cond:
+            return len(self._buffer)
+
+    def close(self, timeout=None):
+        """
+        남은 행을 모두 저장하고 스레드 종료
+
+        Returns:
+            bool: 모든 행 저장 성공 여부 (실패 시 남은 행은 self.pending)
+        """
+        with self._cond:
+            self._closing = True
+            self._cond.notify()
+        self._thread.join(timeout)
+        return self.error is None and self.pending == 0
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self.error is not None:
+                        return  # 순서 보장을 위해 실패 이후 배치는 저장하지 않음
+                    if len(self._buffer) >= self.flush_rows:
+                        break
+                    if self._buffer and (
+                        self._closing or time.monotonic() - self._first_buffered_at >= self.flush_interval
+                    ):
+                        break
+                    if self._closing:
+                        return
+                    if self._buffer:
+                        wait = self.flush_interval - (time.monotonic() - self._first_buffered_at)
+                        self._cond.wait(max(0.05, wait))
+                    else:
+                        self._cond.wait()
+                batch = self._buffer[:self.flush_rows]
+
+            if self._write(batch):
+                with self._cond:
+                    del self._buffer[:len(batch)]
+                    self._first_buffered_at = time.monotonic() if self._buffer else None
+                    self.written += len(batch)
+                    written = self.written
+                if self.on_flush:
+                    try:
+                        self.on_flush(batch, written)
+                    except Exception as e:
+                        print(f"      ⚠️ [{self.name}] 저장 후처리 실패: {e}")
+
+    def _write(self, batch):
+        """배치 1개 저장 (실패 시 백오프 재시도)"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                with metrics.timer("sheet.write"):
+                    self.sheet.append_rows(batch, value_input_option=self.value_input_option)
+                metrics.count("sheet.rows", len(batch))
+                print(f"      💾 [{self.name}] {len(batch)}건 시트 저장")
+                return True
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    metrics.count("sheet.errors")
+                    print(f"      ❌ [{self.name}] {len(batch)}건 저장 실패 (재시도 {self.max_retries}회 초과): {e}")
+                    with self._cond:
+                        self.error = e
+                    return False
+                metrics.count("sheet.retries")
+                delay = min(self.MAX_BACKOFF, self.backoff_base * (2 ** attempt)) * random.uniform(0.8, 1.2)
+                print(f"      ⚠️ [{self.name}] 저장 실패, {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries}): {e}")
+                time.sleep(delay)
+        return False
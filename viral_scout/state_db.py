@@ -0,0 +1,26 @@
+"""
+상태 저장소 SQLite 연결 (AI 캐시 / 중복 체크 인덱스 / 유사글 / 카페 저장소 / 수집 기준점 공용)
+- --workers N으로 여러 샤드 프로세스가 같은 .state 파일을 동시에 씀
+- WAL 모드: 읽기가 쓰기를 기다리지 않음
+- busy timeout: 다른 프로세스가 쓰는 중이면 "database is locked"로 바로 실패하지 않고 대기
+"""
+
+import sqlite3
+
+BUSY_TIMEOUT_SECONDS = 30
+
+
+def connect(path):
+    """
+    상태 저장소 연결 (여러 스레드에서 같은 연결 사용, 각 저장소의 lock으로 직렬화)
+
+    Args:
+        path: SQLite 파일 경로
+
+    Returns:
+        sqlite3.Connection
+    """
+    conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_SECONDS * 1000}")
+    return conn
@@ -0,0 +1,25 @@
+"""
+단위 테스트 공용 설정
+- viral_scout 모듈은 평면 import (naver_scanner.py와 같은 방식으로 경로 추가)
+- config.py 필수 환경변수 검사를 통과하기 위한 더미 값 (벤치마크와 동일, 외부 호출 없음)
+- config.py가 없으면 (저장소에는 예시만 있음) config.py.example을 config 모듈로 로드
+"""
+
+import importlib.machinery
+import importlib.util
+import os
+import sys
+
+SCOUT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCOUT_DIR)
+
+for _name in ("NAVER_CLIENT_ID", "NAVER_CLIENT_SECRET", "GEMINI_API_KEY", "TELEGRAM_BOT_TOKEN", "TELEGRAM_CHAT_ID"):
+    os.environ.setdefault(_name, "test")
+
+if "config" not in sys.modules and not os.path.exists(os.path.join(SCOUT_DIR, "config.py")):
+    _spec = importlib.util.spec_from_loader(
+        "config", importlib.machinery.SourceFileLoader("config", os.path.join(SCOUT_DIR, "config.py.example"))
+    )
+    _config = importlib.util.module_from_spec(_spec)
+    sys.modules["config"] = _config
+    _spec.loader.exec_module(_config)
@@ -0,0 +1,49 @@
+"""parse_cafe_search_results: 저장해 둔 카페 검색 결과 페이지(debug_page.html) 파싱"""
+
+import os
+import re
+
+import pytest
+
+from cafe_scanner import cafe_id_from_url, parse_cafe_search_results
+
+SEARCH_PAGE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "debug_page.html")
+
+
+@pytest.fixture(scope="module")
+def cards():
+    with open(SEARCH_PAGE, "r", encoding="utf-8") as f:
+        return parse_cafe_search_results(f.read())
+
+
+def _article_id(link):
+    return link.split("?")[0].rsplit("/", 1)[1]
+
+
+def test_card_count_and_links(cards):
+    assert len(cards) == 30
+    assert all(card["link"].startswith("https://cafe.naver.com/") for card in cards)
+    assert len({card["link"] for card in cards}) == 30
+    assert [_article_id(card["link"]) for card in cards[:3]] == ["17447305", "17444166", "17141073"]
+    assert all(card["title"] and card["description"] for card in cards)
+
+
+def test_each_card_has_its_own_date(cards):
+    """카드마다 자기 카드 안의 날짜 (페이지 첫 날짜를 모든 카드가 공유하지 않음)"""
+    assert all(re.fullmatch(r"\d{4}\.\d{2}\.\d{2}\.", card["date"]) for card in cards)
+    assert [card["date"] for card in cards[:5]] == ["2021.12.26.", "2021.12.24.", "2021.05.19.", "2021.12.25.", "2021.05.22."]
+    assert len({card["date"] for card in cards}) > 20
+
+
+def test_cafe_names(cards):
+    names = {cafe_id_from_url(card["link"]): card["cafe_name"] for card in cards}
+    assert names == {"dogpalza": "강사모", "clubpet": "냥이네"}
+
+    clubpet = [card for card in cards if cafe_id_from_url(card["link"]) == "clubpet"]
+    assert len(clubpet) == 1
+    assert clubpet[0]["date"] == "2023.01.03."
+    assert clubpet[0]["title"] == "아비도 드디어 보양대첩 먹었어요"
+
+
+def test_empty_page():
+    assert parse_cafe_search_results("<html><body></body></html>") == []
@@ -0,0 +1,47 @@
+"""KeywordMatcher: 매칭 결과가 `keyword in text` / str.find와 같은지"""
+
+from keyword_matcher import KeywordMatcher
+
+
+def _naive_positions(text, keyword):
+    positions = []
+    start = text.find(keyword)
+    while start >= 0:
+        positions.append(start)
+        start = text.find(keyword, start + 1)
+    return positions
+
+
+def test_overlapping_keywords_all_found():
+    """서로 겹치거나 포함 관계인 키워드도 모두 찾음 (실패 링크 출력 병합)"""
+    keywords = ["he", "she", "his", "hers", "사료", "고양이사료", "이사"]
+    matcher = KeywordMatcher({"kw": keywords})
+    text = "ushers 고양이사료 이사 hishe"
+
+    hits = matcher.find_all(text)["kw"]
+    expected = sorted((pos, kw) for kw in keywords for pos in _naive_positions(text, kw))
+    assert hits == expected
+
+
+def test_same_keyword_in_several_groups():
+    matcher = KeywordMatcher({"brand": ["로얄캐닌"], "exclude": ["로얄캐닌", "광고"]})
+    text = "광고 아님, 로얄캐닌 후기"
+
+    assert matcher.find_all(text) == {"brand": [(7, "로얄캐닌")], "exclude": [(0, "광고"), (7, "로얄캐닌")]}
+    assert matcher.found_keywords(text, "exclude") == {"광고", "로얄캐닌"}
+
+
+def test_first_positions_and_contains_any():
+    matcher = KeywordMatcher({"brand": ["ANF", "나우", "나우프레시"], "other": ["후기"]})
+    text = "나우프레시 후기, 다음엔 ANF / 나우"
+
+    assert matcher.first_positions(text, "brand") == {"나우": 0, "나우프레시": 0, "ANF": 14}
+    assert matcher.contains_any(text, "other")
+    assert not matcher.contains_any("anf 나 우", "brand")  # 대소문자/부분 문자열 기준은 `in`과 동일
+
+
+def test_empty_keywords_and_text():
+    matcher = KeywordMatcher({"kw": ["", "a"], "none": []})
+
+    assert matcher.find_all("") == {"kw": [], "none": []}
+    assert matcher.find_all("aa")["kw"] == [(0, "a"), (1, "a")]
@@ -0,0 +1,48 @@
+"""LocalSentimentScorer: 부정어 처리, 일괄 채점 경계, 불확실 구간"""
+
+import pytest
+
+from local_sentiment import LocalSentimentScorer
+
+
+@pytest.fixture
+def scorer():
+    return LocalSentimentScorer(band=0.35)
+
+
+def _labels(scorer, texts):
+    return [label for _, label in scorer.score_batch(texts)]
+
+
+@pytest.mark.parametrize("text, label", [
+    ("좋아요", "긍정"),
+    ("안 좋아요", "부정"),       # "안 좋"이 "좋아요"보다 먼저 시작 → 긴 표현만 채점
+    ("좋지 않아요", "부정"),     # 뒤 부정어
+    ("안 괜찮아요", "부정"),     # 앞 부정어
+    ("설사 없어요", "긍정"),     # 부정 표현의 부정
+    ("우리 애가 잘 먹어요", "긍정"),
+    ("그냥 그래요", None),
+])
+def test_negation(scorer, text, label):
+    assert _labels(scorer, [text]) == [label]
+
+
+def test_mixed_comment_is_uncertain(scorer):
+    score, label = scorer.score_batch(["잘 먹는데 설사해요"])[0]
+    assert score == pytest.approx(0.0)
+    assert label is None
+    assert scorer.label(score) == "중립"
+
+
+def test_batch_scores_match_single_scores(scorer):
+    """이어 붙여 채점해도 옆 댓글의 표현/부정어가 넘어오지 않음"""
+    texts = ["좋아요", "안 좋아요", "", "않아요 설사", "실망", "만족"]
+    batch = scorer.score_batch(texts)
+    assert batch == [scorer.score_batch([text])[0] for text in texts]
+    assert scorer.score_batch([]) == []
+
+
+def test_band_controls_uncertainty():
+    text = ["좋지 않아요"]  # 점수 약 -0.38
+    assert _labels(LocalSentimentScorer(band=0.35), text) == ["부정"]
+    assert _labels(LocalSentimentScorer(band=0.5), text) == [None]
@@ -0,0 +1,92 @@
+"""Pipeline: 순서 유지, 제외(dropped)와 실패(failed) 구분, Checkpoint 전달"""
+
+import random
+import time
+
+import pytest
+
+from pipeline import Checkpoint, Pipeline, Stage
+
+
+def _jitter(value):
+    time.sleep(random.uniform(0, 0.002))
+    return value
+
+
+def test_order_kept_after_drop():
+    """여러 워커가 뒤섞어 처리하고 일부를 제외해도 싱크에는 입력 순서대로 도착"""
+    received = []
+    stages = [
+        Stage("필터", lambda n: None if n % 3 == 0 else _jitter(n), workers=4),
+        Stage("AI", lambda batch: [_jitter(n * 10) for n in batch], workers=3, batch_size=4, batch_wait=0.01),
+    ]
+    pipeline = Pipeline(stages, received.append, queue_size=5)
+
+    pipeline.run(range(60))
+
+    assert received == [n * 10 for n in range(60) if n % 3 != 0]
+    assert stages[0].dropped == 20
+    assert pipeline.failed == 0
+
+
+def test_failures_counted_apart_from_drops():
+    received = []
+
+    def analyze(batch):
+        if 7 in batch:
+            raise RuntimeError("AI 오류")
+        return batch
+
+    stages = [
+        Stage("필터", lambda n: None if n == 2 else n),
+        Stage("AI", analyze, batch_size=2, batch_wait=None),
+    ]
+    pipeline = Pipeline(stages, received.append)
+
+    pipeline.run(range(10))
+
+    # 배치는 (0, 1) (3, 4) (5, 6) (7, 8) (9) - 7이 든 배치 전체가 실패
+    assert received == [0, 1, 3, 4, 5, 6, 9]
+    assert stages[0].dropped == 1 and stages[0].failed == 0
+    assert stages[1].dropped == 0 and stages[1].failed == 2
+    assert pipeline.failed == 2
+
+
+def test_checkpoint_carries_failures_since_previous():
+    received = []
+
+    def sink(item):
+        if item == "저장 오류":
+            raise IOError("시트 오류")
+        received.append(item)
+
+    def fn(item):
+        if item == "분석 오류":
+            raise ValueError(item)
+        return item
+
+    source = ["a", "분석 오류", Checkpoint("k1"), "b", "저장 오류", Checkpoint("k2"), "c", Checkpoint("k3")]
+    pipeline = Pipeline([Stage("AI", fn, workers=2)], sink)
+
+    pipeline.run(source)
+
+    assert [item.payload if isinstance(item, Checkpoint) else item for item in received] == \
+        ["a", "k1", "b", "k2", "c", "k3"]
+    assert [item.failed for item in received if isinstance(item, Checkpoint)] == [1, 1, 0]
+    assert pipeline.sink_failed == 1
+    assert pipeline.failed == 2
+
+
+def test_source_error_reraised_after_draining():
+    received = []
+
+    def source():
+        yield 1
+        yield 2
+        raise RuntimeError("검색 실패")
+
+    pipeline = Pipeline([Stage("AI", lambda n: n)], received.append)
+
+    with pytest.raises(RuntimeError):
+        pipeline.run(source())
+    assert received == [1, 2]
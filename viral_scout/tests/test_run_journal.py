@@ -0,0 +1,60 @@
+"""RunJournal: 재개용 상태 복원, 잘린 마지막 줄 처리"""
+
+import os
+
+from run_journal import RunJournal
+
+
+def _write_journal(path):
+    journal = RunJournal.start(path, "2026-10-17 09:00")
+    journal.record_row("blog", "link-1", ["a"])
+    journal.record_row("blog", "link-2", None)  # 분석 후 제외
+    journal.record_row("blog", "link-3", ["c"])
+    journal.mark_flushed("blog", 1)
+    journal.mark_keyword_done("blog", "강아지 사료")
+    journal.close()
+
+
+def test_load_restores_state(tmp_path):
+    path = str(tmp_path / "run_journal.jsonl")
+    _write_journal(path)
+
+    journal = RunJournal.load(path)
+    assert journal.today == "2026-10-17 09:00"
+    assert journal.has_key("blog", "link-2")
+    assert journal.rows["blog"] == [["a"], ["c"]]
+    assert journal.pending_rows("blog") == [["c"]]
+    assert journal.is_keyword_done("blog", "강아지 사료")
+    assert not journal.is_keyword_done("cafe", "강아지 사료")
+    assert not journal.completed
+
+
+def test_torn_last_line_is_ignored_and_truncated(tmp_path):
+    path = str(tmp_path / "run_journal.jsonl")
+    _write_journal(path)
+    intact_size = os.path.getsize(path)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"type": "row", "sheet": "blog", "key": "link-4", "ro')
+
+    journal = RunJournal.load(path)
+    assert not journal.has_key("blog", "link-4")
+    assert journal.pending_rows("blog") == [["c"]]
+    assert os.path.getsize(path) == intact_size
+
+    # 이어서 기록한 레코드가 잘린 줄에 붙지 않고 다음 load에서 그대로 읽힘
+    journal.record_row("blog", "link-4", ["d"])
+    journal.close()
+    assert RunJournal.load(path).pending_rows("blog") == [["c"], ["d"]]
+
+
+def test_start_backs_up_incomplete_journal(tmp_path):
+    path = str(tmp_path / "run_journal.jsonl")
+    _write_journal(path)
+
+    journal = RunJournal.start(path, "2026-10-18 09:00")
+    journal.complete()
+
+    backups = [name for name in os.listdir(tmp_path) if name.endswith(".bak")]
+    assert len(backups) == 1
+    assert RunJournal.load(path).completed
+    assert RunJournal.load(str(tmp_path / "missing.jsonl")) is None
@@ -0,0 +1,72 @@
+"""sharding: 키워드 분배, 샤드 결과 저장/읽기, 행 병합"""
+
+import argparse
+import json
+import os
+import time
+
+import pytest
+
+from sharding import (
+    load_shard_results, merge_rows, parse_shard, remove_shard_results, save_shard_result, shard_keywords, shard_path
+)
+
+KEYWORDS = ["강아지 사료", "고양이 사료", "알러지 사료", "눈물자국 사료", "설사 사료"]
+
+
+def test_parse_shard():
+    assert parse_shard("2/3") == (2, 3)
+    for text in ("0/3", "4/3", "1/0", "a/b", "3"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_shard(text)
+
+
+def test_shard_keywords_cover_all_once_in_order():
+    shards = [shard_keywords(KEYWORDS, i, 2) for i in (1, 2)]
+    assert shards == [["강아지 사료", "알러지 사료", "설사 사료"], ["고양이 사료", "눈물자국 사료"]]
+    assert sorted(k for shard in shards for k in shard) == sorted(KEYWORDS)
+    assert shard_keywords(KEYWORDS[:1], 2, 3) == []
+
+
+def test_merge_rows_orders_by_keyword_and_keeps_first():
+    # 행: [키워드, 링크]
+    shard_1 = [["강아지 사료", "a"], ["강아지 사료", "b"], ["알러지 사료", "c"], ["알러지 사료", "b"]]
+    shard_2 = [["고양이 사료", "d"], ["고양이 사료", "a"], ["모르는 키워드", "e"]]
+
+    merged, duplicates = merge_rows([shard_2, shard_1], KEYWORDS, 0, lambda row: row[1])
+
+    assert merged == [
+        ["강아지 사료", "a"], ["강아지 사료", "b"],
+        ["고양이 사료", "d"],
+        ["알러지 사료", "c"],
+        ["모르는 키워드", "e"],   # 목록에 없는 키워드는 맨 뒤
+    ]
+    assert duplicates == 2
+
+
+def test_save_and_load_shard_results(tmp_path):
+    directory = str(tmp_path)
+    save_shard_result(directory, 1, 3, {"blog_rows": [["강아지 사료", "a"]]})
+    save_shard_result(directory, 3, 3, {"blog_rows": []})
+
+    results, missing = load_shard_results(directory, 3)
+    assert [r["shard"] for r in results] == [[1, 3], [3, 3]]
+    assert results[0]["blog_rows"] == [["강아지 사료", "a"]]
+    assert missing == [2]
+    assert not any(name.endswith(".tmp") for name in os.listdir(directory))
+
+
+def test_load_skips_stale_and_broken_results(tmp_path):
+    directory = str(tmp_path)
+    save_shard_result(directory, 1, 3, {"blog_rows": []})
+    with open(shard_path(directory, 2, 3), "w", encoding="utf-8") as f:
+        json.dump({"blog_rows": [], "finished_at": time.time() - 7200}, f)
+    with open(shard_path(directory, 3, 3), "w", encoding="utf-8") as f:
+        f.write('{"blog_rows": [')
+
+    results, missing = load_shard_results(directory, 3, max_age_seconds=3600)
+    assert [r["shard"] for r in results] == [[1, 3]]
+    assert missing == [2, 3]
+
+    remove_shard_results(directory, 3)
+    assert os.listdir(directory) == []
@@ -0,0 +1,107 @@
+"""WatermarkStore / normalize_post_date: 기준점 갱신, 실패한 글 처리, 샤드 간 전달"""
+
+import datetime
+
+import pytest
+
+from watermark import WatermarkStore, normalize_post_date
+
+
+@pytest.fixture
+def store(tmp_path):
+    return WatermarkStore(str(tmp_path / "watermarks.db"))
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("20240105", "20240105"),
+    ("2024.01.05.", "20240105"),
+    ("2024-1-5", "20240105"),
+    ("3시간 전", "20261017"),
+    ("2일 전", "20261015"),
+    ("1주 전", "20261010"),
+    ("어제", "20261016"),
+    ("방금 전", "20261017"),
+    ("", None),
+    ("알 수 없음", None),
+])
+def test_normalize_post_date(text, expected):
+    assert normalize_post_date(text, today=datetime.date(2026, 10, 17)) == expected
+
+
+def test_saved_only_on_commit(store):
+    store.advance("blog", "사료", [("20261016", "a"), ("20261017", "b"), ("20261017", "c")])
+    assert store.get("blog", "사료") == (None, [])
+    assert store.seen_checker("blog", "사료") is None
+
+    assert store.commit() == 1
+    assert store.get("blog", "사료") == ("20261017", ["b", "c"])
+
+    is_seen = store.seen_checker("blog", "사료")
+    assert is_seen("20261016", "x")        # 기준 날짜보다 오래된 글
+    assert is_seen("20261017", "b")        # 기준 날짜에 본 글
+    assert not is_seen("20261017", "d")    # 기준 날짜의 새 글
+    assert is_seen(None, "c") and not is_seen(None, "x")
+
+
+def test_failed_post_caps_mark(store):
+    """실패한 글의 날짜까지만 올리고 링크는 기억하지 않음 → 다음 실행에서 그 날짜부터 다시 확인"""
+    entries = [("20261017", "a"), ("20261016", "b"), ("20261015", "c")]
+    store.advance("cafe", "사료", entries, failed=[("20261016", "b")])
+    store.commit()
+
+    assert store.get("cafe", "사료") == ("20261016", [])
+    is_seen = store.seen_checker("cafe", "사료")
+    assert not is_seen("20261016", "b")
+    assert is_seen("20261015", "c")
+
+
+def test_failed_post_caps_below_existing_mark(store):
+    store.advance("cafe", "사료", [("20261016", "old")])
+    store.commit()
+
+    store.advance("cafe", "사료", [("20261017", "a")], failed=[("20261016", "b")])
+    store.commit()
+    assert store.get("cafe", "사료") == ("20261016", [])
+
+
+def test_failed_post_without_date_or_newer_is_ignored(store):
+    store.advance("blog", "사료", [("20261016", "a")], failed=[(None, "x"), ("20261017", "y")])
+    store.commit()
+    assert store.get("blog", "사료") == ("20261016", ["a"])
+
+
+def test_same_day_links_merged_newest_first_and_capped(store):
+    store.advance("blog", "사료", [("20261017", f"old-{i}") for i in range(WatermarkStore.MAX_LINKS)])
+    store.commit()
+
+    store.advance("blog", "사료", [("20261017", "new-1"), ("20261017", "old-3"), ("20261016", "x")])
+    store.commit()
+
+    date, links = store.get("blog", "사료")
+    assert date == "20261017"
+    assert len(links) == WatermarkStore.MAX_LINKS
+    assert links[:3] == ["new-1", "old-3", "old-0"]
+    assert f"old-{WatermarkStore.MAX_LINKS - 1}" not in links
+
+
+def test_older_entries_do_not_move_mark_back(store):
+    store.advance("blog", "사료", [("20261017", "a")])
+    store.commit()
+
+    store.advance("blog", "사료", [("20261010", "b")])
+    assert store.commit() == 0
+    assert store.get("blog", "사료") == ("20261017", ["a"])
+
+
+def test_export_import_between_stores(tmp_path):
+    """샤드 실행의 기준점 후보를 병합 단계 저장소로 전달"""
+    shard = WatermarkStore(str(tmp_path / "shard.db"))
+    shard.advance("blog", "사료", [("20261017", "a")])
+    shard.advance("cafe", "간식", [("20261016", "b")], failed=[("20261016", "b")])
+    pending = shard.export_pending()
+
+    merged = WatermarkStore(str(tmp_path / "merged.db"))
+    merged.import_pending(pending)
+    assert merged.commit() == 2
+    assert merged.get("blog", "사료") == ("20261017", ["a"])
+    assert merged.get("cafe", "간식") == ("20261016", [])
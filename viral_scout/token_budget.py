@@ -0,0 +1,151 @@
+"""
+AI 토큰 예산
+- 요청 전 프롬프트 토큰 수 추정 / 응답의 실제 사용량(usageMetadata, usage) 기록
+- 글자 수 고정 자르기 대신 작업별 토큰 예산 안에서 문장 경계로 자르기
+- 실행당 총 토큰 상한: 넘으면 AI를 호출하지 않고 TokenBudgetExceeded
+  → 호출 측은 정규식 브랜드 추출 / 로컬 감성 판별 등 대체 경로로 진행
+"""
+
+import re
+import threading
+
+_HANGUL = re.compile(r'[가-힣]')
+# 문장 경계 (마침표/물음표/느낌표/말줄임 뒤 공백, 줄바꿈)
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?~…。！？])\s+|\n+')
+
+# 작업 이름 -> 보고용 이름
+TASK_LABELS = {
+    "blog": "블로그분석",
+    "cafe": "카페요약",
+    "comments": "댓글감성",
+    "key_issues": "불만요약",
+    "question": "질문판별",
+    "relevance": "관련성",
+    "daily_summary": "일일리포트",
+}
+
+
+class TokenBudgetExceeded(Exception):
+    """실행당 토큰 상한 도달 (AI 대신 대체 경로 사용)"""
+
+
+def estimate_tokens(text):
+    """토큰 수 대략 추정 (한글 1자 ≈ 1토큰, 그 외 4자 ≈ 1토큰)"""
+    korean = len(_HANGUL.findall(text))
+    return korean + (len(text) - korean) // 4 + 1
+
+
+def _char_cut(text, max_tokens):
+    """문장 경계로 자를 수 없을 때: 예산 안의 마지막 공백 위치 (없으면 글자 위치)"""
+    cost = 0.0
+    for i, ch in enumerate(text):
+        cost += 1 if _HANGUL.match(ch) else 0.25
+        if cost > max_tokens - 1:
+            space = text.rfind(" ", 0, i)
+            return space if space > 0 else i
+    return len(text)
+
+
+def trim_to_budget(text, max_tokens):
+    """
+    추정 토큰 수가 max_tokens 이하가 되도록 문장 경계에서 자르기
+
+    첫 문장부터 예산을 넘으면 단어(공백) 경계에서 자름
+
+    Returns:
+        str: 잘린 텍스트 (예산 안이면 그대로)
+    """
+    if not text or estimate_tokens(text) <= max_tokens:
+        return text
+
+    cut = 0
+    korean = other = 0
+    last = 0
+    for match in _SENTENCE_BOUNDARY.finditer(text):
+        segment = text[last:match.start()]
+        k = len(_HANGUL.findall(segment))
+        korean += k
+        other += len(segment) - k
+        if korean + other // 4 + 1 > max_tokens:
+            break
+        cut = match.start()
+        other += len(match.group())
+        last = match.end()
+
+    if not cut:
+        cut = _char_cut(text, max_tokens)
+    return text[:cut].rstrip()
+
+
+class TokenBudget:
+    """
+    실행 1회의 AI 토큰 사용량 / 상한
+
+    Args:
+        run_limit: 실행당 총 토큰 상한 (None이면 무제한)
+    """
+
+    def __init__(self, run_limit=None):
+        self.run_limit = run_limit
+        self.used = 0
+        self.exhausted = False
+        self._tasks = {}  # 작업: {"calls", "tokens", "estimated", "skipped"}
+        self._lock = threading.Lock()
+
+    def _task(self, task):
+        stats = self._tasks.get(task)
+        if stats is None:
+            stats = self._tasks[task] = {"calls": 0, "tokens": 0, "estimated": 0, "skipped": 0}
+        return stats
+
+    def check(self, task, estimated):
+        """
+        요청 전 확인 (예상 토큰까지 쓰면 상한을 넘는 경우 예외)
+
+        Raises:
+            TokenBudgetExceeded: 상한 도달
+        """
+        with self._lock:
+            if self.run_limit is None or self.used + estimated <= self.run_limit:
+                return
+            self._task(task)["skipped"] += 1
+            first = not self.exhausted
+            self.exhausted = True
+        if first:
+            print(f"   ⚠️ 실행당 AI 토큰 상한 도달 ({self.used:,}/{self.run_limit:,}) → 이후 AI 대신 대체 경로 사용")
+        raise TokenBudgetExceeded(f"실행당 토큰 상한 도달 ({TASK_LABELS.get(task, task)})")
+
+    def record(self, task, estimated, actual):
+        """응답 후 사용량 기록 (공급자가 사용량을 주지 않으면 추정치 사용)"""
+        tokens = actual or estimated
+        with self._lock:
+            stats = self._task(task)
+            stats["calls"] += 1
+            stats["tokens"] += tokens
+            stats["estimated"] += estimated
+            self.used += tokens
+
+    def snapshot(self):
+        """JSON 저장용 작업별 사용량"""
+        with self._lock:
+            return {
+                "used": self.used,
+                "run_limit": self.run_limit,
+                "exhausted": self.exhausted,
+                "tasks": {task: dict(stats) for task, stats in self._tasks.items()},
+            }
+
+    def format_stats(self):
+        """작업별 사용량 한 줄 (많이 쓴 순)"""
+        with self._lock:
+            tasks = sorted(self._tasks.items(), key=lambda item: -item[1]["tokens"])
+            parts = []
+            for task, stats in tasks:
+                part = f"{TASK_LABELS.get(task, task)} {stats['tokens'] / 1000:.1f}k({stats['calls']}회)"
+                if stats["skipped"]:
+                    part += f" 생략 {stats['skipped']}회"
+                parts.append(part)
+            total = f"합계 {self.used / 1000:.1f}k"
+            if self.run_limit:
+                total += f" / 상한 {self.run_limit / 1000:.0f}k"
+        return " · ".join(parts + [total])
@@ -0,0 +1,201 @@
+"""
+키워드별 수집 기준점 (SQLite 단일 파일)
+- 키: (출처, 키워드) → 지금까지 본 가장 최신 글의 날짜 + 그 날짜에 본 글 링크 (최근에 본 것부터 MAX_LINKS개)
+- 최신순(SORT_MODE="date") 검색 결과는 위에서부터 새 글 → 이미 본 글을 만나는 순간 페이지 탐색 중단
+- 이번 실행의 기준점은 메모리에 모았다가 실행이 정상 종료됐을 때만 저장
+  (중간 실패 시 다음 실행이 같은 구간을 다시 가져오고 중복 체크에서 걸러짐)
+"""
+
+import datetime
+import json
+import os
+import re
+import threading
+import time
+
+import state_db
+
+KST = datetime.timezone(datetime.timedelta(hours=9))
+
+_ABSOLUTE_DATE = re.compile(r'(\d{4})[.\-/]\s*(\d{1,2})[.\-/]\s*(\d{1,2})')
+_RELATIVE_DATE = re.compile(r'(\d+)\s*(분|시간|일|주)\s*전')
+_RELATIVE_DAYS = {"분": 0, "시간": 0, "일": 1, "주": 7}
+
+
+def normalize_post_date(text, today=None):
+    """
+    게시글 날짜 표기를 비교 가능한 YYYYMMDD로 변환
+
+    예: "20240105" / "2024.01.05." / "2024-01-05" -> "20240105"
+        "3시간 전" -> 오늘, "어제" -> 어제, "2일 전" -> 이틀 전
+
+    Args:
+        text: 날짜 문자열
+        today: 기준 날짜 (기본값 오늘, KST)
+
+    Returns:
+        str: YYYYMMDD (알 수 없는 형식이면 None)
+    """
+    text = (text or "").strip()
+    if not text:
+        return None
+    if len(text) == 8 and text.isdigit():
+        return text
+
+    match = _ABSOLUTE_DATE.search(text)
+    if match:
+        year, month, day = (int(part) for part in match.groups())
+        return f"{year:04d}{month:02d}{day:02d}"
+
+    today = today or datetime.datetime.now(KST).date()
+    match = _RELATIVE_DATE.search(text)
+    if match:
+        days = int(match.group(1)) * _RELATIVE_DAYS[match.group(2)]
+        return (today - datetime.timedelta(days=days)).strftime("%Y%m%d")
+    if "어제" in text:
+        return (today - datetime.timedelta(days=1)).strftime("%Y%m%d")
+    if "오늘" in text or "방금" in text:
+        return today.strftime("%Y%m%d")
+    return None
+
+
+class WatermarkStore:
+    """
+    키워드별 기준점 저장소
+
+    Args:
+        path: SQLite 파일 경로
+    """
+
+    MAX_LINKS = 200  # 기준 날짜에 기억할 최대 링크 수
+
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.stopped = 0  # 이미 본 글에서 탐색을 멈춘 횟수
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._conn = state_db.connect(path)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS watermarks (
+                source TEXT NOT NULL,
+                keyword TEXT NOT NULL,
+                newest_date TEXT NOT NULL,
+                links TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (source, keyword)
+            )"""
+        )
+        self._conn.commit()
+
+    def get(self, source, keyword):
+        """
+        Returns:
+            tuple: (기준 날짜 YYYYMMDD, 그 날짜에 본 링크 리스트 - 최근에 본 순서) - 기준점이 없으면 (None, 빈 리스트)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT newest_date, links FROM watermarks WHERE source = ? AND keyword = ?", (source, keyword)
+            ).fetchone()
+        if not row:
+            return None, []
+        return row[0], json.loads(row[1])
+
+    def seen_checker(self, source, keyword):
+        """
+        이미 본 글 판별 함수
+
+        기준 날짜보다 오래된 글 또는 기준 날짜에 본 링크 → 이미 본 글
+        (날짜를 알 수 없는 글은 링크로만 판별)
+
+        Returns:
+            callable: is_seen(날짜, 링크) -> bool (기준점이 없으면 None)
+        """
+        newest_date, links = self.get(source, keyword)
+        if newest_date is None:
+            return None
+        links = set(links)
+
+        def is_seen(date, link):
+            if link in links:
+                return True
+            return date is not None and date < newest_date
+
+        return is_seen
+
+    def advance(self, source, keyword, entries, failed=()):
+        """
+        이번 실행에서 본 글로 기준점 갱신 (commit() 전까지는 메모리에만)
+
+        수집에 실패한 글이 있으면 기준점은 그 글의 날짜까지만 올리고 그 날짜의 링크는 기억하지 않음
+        → 다음 실행에서 그 날짜의 글부터 다시 확인 (실패한 글을 이미 본 글로 건너뛰지 않음)
+
+        Args:
+            entries: 수집한 글의 (날짜 YYYYMMDD, 링크) 목록 (검색 결과 순서) - 날짜를 모르는 항목은 무시
+            failed: 수집에 실패한 글의 (날짜, 링크) 목록
+        """
+        dated = [(date, link) for date, link in entries if date and link]
+        if not dated:
+            return
+        newest = max(date for date, _ in dated)
+        newest_links = [link for date, link in dated if date == newest]
+
+        failed_dates = [date for date, _ in failed if date]
+        if failed_dates and min(failed_dates) <= newest:
+            newest, newest_links = min(failed_dates), []
+
+        self._update(source, keyword, newest, newest_links)
+
+    def _update(self, source, keyword, newest, newest_links):
+        """기준점 후보 반영 (링크가 없으면 그 날짜의 기존 링크도 버림 - advance() 참고)"""
+        key = (source, keyword)
+        with self._lock:
+            current = self._pending.get(key)
+        if current is None:
+            current = self.get(source, keyword)
+
+        current_date, current_links = current
+        if current_date is not None and current_date > newest:
+            return
+        if current_date == newest and newest_links:
+            newest_links = list(dict.fromkeys(newest_links + current_links))
+        with self._lock:
+            self._pending[key] = (newest, newest_links[:self.MAX_LINKS])
+
+    def export_pending(self):
+        """
+        저장 전 기준점 목록 (샤드 실행 결과에 담아 병합 단계에서 import_pending/commit)
+
+        Returns:
+            list: [출처, 키워드, 날짜, [링크, ...]] 리스트
+        """
+        with self._lock:
+            return [
+                [source, keyword, date, list(links)]
+                for (source, keyword), (date, links) in self._pending.items()
+            ]
+
+    def import_pending(self, pending):
+        """export_pending() 결과를 이번 실행의 기준점 후보로 반영"""
+        for source, keyword, date, links in pending:
+            self._update(source, keyword, date, list(links))
+
+    def commit(self):
+        """
+        모아둔 기준점 저장
+
+        Returns:
+            int: 저장한 키워드 수
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            now = time.time()
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO watermarks (source, keyword, newest_date, links, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (source, keyword, date, json.dumps(links[:self.MAX_LINKS], ensure_ascii=False), now)
+                    for (source, keyword), (date, links) in pending.items()
+                ],
+            )
+            self._conn.commit()
+        return len(pending)